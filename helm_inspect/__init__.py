@@ -5,3 +5,7 @@
  See: http://www.apache.org/licenses/LICENSE-2.0
 
 """
+
+from helm_inspect.inspector import CalibrationResult, CheckResult, HelmInspector
+
+__all__ = ["CalibrationResult", "CheckResult", "HelmInspector"]
@@ -0,0 +1,286 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from helm_inspect.utils.cache import (
+    cache_stats,
+    enable_namespace_index,
+    enable_warm_caches,
+)
+from helm_inspect.utils.calibration import calibrate_system, save_drift_data
+from helm_inspect.utils.cli import resolve_ignorable_keys
+from helm_inspect.utils.cluster import get_cluster_name, get_helm_manifest
+from helm_inspect.utils.constant import NAMESPACE_CACHE_MAX_BYTES, NAMESPACE_CACHE_TTL
+from helm_inspect.utils.drift_check import check_drift, compile_ignorable_keys
+from helm_inspect.utils.logger import setup_logger
+
+logger = setup_logger()
+
+IGNORE_RULES_CAPACITY = 256
+"""
+Number of compiled ignore rule sets kept by an inspector.
+"""
+
+_session: Optional[Tuple[str, float]] = None
+_session_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    """
+    Outcome of a drift check.
+    """
+
+    release: str
+    namespace: str
+    cluster: str
+    total_drifts: int
+    new_keys: int
+    removed_keys: int
+    modified_keys: int
+    unchecked_resources: int
+    drift_reports: List[Dict[str, Any]] = field(repr=False)
+    stopped_early: bool = False
+    duration: float = 0.0
+
+    @property
+    def drifting(self) -> bool:
+        return self.total_drifts > 0
+
+    @classmethod
+    def from_drift_meta(
+        cls,
+        drift_meta: dict,
+        release: str,
+        namespace: str,
+        cluster: str,
+        duration: float,
+    ) -> "CheckResult":
+        summary = drift_meta["drift_summary"]
+        return cls(
+            release=release,
+            namespace=namespace,
+            cluster=cluster,
+            total_drifts=summary["total_drifts"],
+            new_keys=summary["new_keys"],
+            removed_keys=summary["removed_keys"],
+            modified_keys=summary["modified_keys"],
+            unchecked_resources=summary.get("unchecked_resources", 0),
+            drift_reports=drift_meta["drift_reports"],
+            stopped_early=bool(drift_meta.get("stopped_early")),
+            duration=duration,
+        )
+
+
+@dataclass(frozen=True)
+class CalibrationResult:
+    """
+    Outcome of a calibration.
+    """
+
+    release: str
+    namespace: str
+    cluster: str
+    revision: Optional[int]
+    date: str
+    ignorable_keys: List[str] = field(repr=False)
+    resources: int = 0
+
+
+class HelmInspector:
+    """
+    Reusable drift inspection session for embedding Helm Inspect.
+
+    The session keeps Helm manifests, live objects, calibration data and
+    compiled ignore rules warm between calls, so repeated checks from a
+    long-running process only fetch what expired. Errors are raised, never
+    turned into `sys.exit`. The level of the `helm-inspect` logger is left
+    to the caller.
+
+    The caches are process-wide and not keyed by cluster, so one inspector
+    per process is supported: another one can only be created for the same
+    cluster and cache TTL, and shares the caches of the first.
+
+        inspector = HelmInspector()
+        result = inspector.check("web", "production")
+        if result.drifting:
+            ...
+    """
+
+    def __init__(
+        self,
+        cluster_name: Optional[str] = None,
+        cache_ttl: float = 30,
+        no_ignore: bool = False,
+        structured_values: bool = False,
+        save_results: bool = False,
+    ):
+        """
+        Args:
+            cluster_name (str, optional): Kubernetes cluster name, read from
+                the current kubectl context when not provided.
+            cache_ttl (float): Time to live of cached live objects in seconds.
+            no_ignore (bool): Flag to disable key ignoring for strict drift detection.
+            structured_values (bool): Flag to compare JSON/YAML string values structurally.
+            save_results (bool): Flag to save drift data files like the CLI does.
+
+        Raises:
+            RuntimeError: If `helm` or `kubectl` is not installed, or if an
+                inspector of another cluster or cache TTL exists in the process.
+        """
+
+        global _session
+
+        missing_tools = [t for t in ["helm", "kubectl"] if not shutil.which(t)]
+        if missing_tools:
+            raise RuntimeError(f"Missing prerequisites: {', '.join(missing_tools)}")
+
+        self.cluster_name = cluster_name or get_cluster_name()
+        with _session_lock:
+            if _session is not None and _session != (self.cluster_name, cache_ttl):
+                raise RuntimeError(
+                    "One HelmInspector per process is supported, already created "
+                    f"for cluster `{_session[0]}` with a cache TTL of {_session[1]:g}s"
+                )
+            _session = (self.cluster_name, cache_ttl)
+
+        enable_warm_caches(cache_ttl)
+        enable_namespace_index(NAMESPACE_CACHE_TTL, NAMESPACE_CACHE_MAX_BYTES)
+
+        self.no_ignore = no_ignore
+        self.structured_values = structured_values
+        self.save_results = save_results
+
+        self._rules: "OrderedDict[Tuple, Dict[str, Set[str]]]" = OrderedDict()
+        self._calibrating: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _ignore_rules(self, ignorable_keys: Optional[List[str]]) -> Dict[str, Set[str]]:
+        key = tuple(ignorable_keys or ())
+        with self._lock:
+            rules = self._rules.get(key)
+            if rules is not None:
+                self._rules.move_to_end(key)
+                return rules
+
+        rules = compile_ignorable_keys(ignorable_keys)
+        with self._lock:
+            self._rules[key] = rules
+            while len(self._rules) > IGNORE_RULES_CAPACITY:
+                self._rules.popitem(last=False)
+        return rules
+
+    def check(
+        self,
+        release: str,
+        namespace: str,
+        fail_fast: bool = False,
+        structured_values: Optional[bool] = None,
+    ) -> CheckResult:
+        """
+        Check a release for drift.
+
+        Args:
+            release (str): Helm release name.
+            namespace (str): Kubernetes namespace.
+            fail_fast (bool): Flag to stop at the first drifted or missing resource.
+            structured_values (bool, optional): Overrides the session setting.
+
+        Returns:
+            CheckResult: The drift summary and reports.
+
+        Raises:
+            LookupError: If the release has no manifest, e.g. it does not exist
+                or its manifest could not be fetched.
+            ClusterError: If the cluster is unavailable or calls were cancelled.
+        """
+
+        started = time.monotonic()
+        helm_manifest = get_helm_manifest(release, namespace)
+        if not helm_manifest:
+            raise LookupError(
+                f"No Helm manifest for release `{release}` in namespace `{namespace}`"
+            )
+        ignorable_keys = resolve_ignorable_keys(
+            release, namespace, self.cluster_name, self.no_ignore, helm_manifest
+        )
+        drift_meta = check_drift(
+            release,
+            namespace,
+            ignorable_keys,
+            helm_manifest=helm_manifest,
+            structured_values=(
+                self.structured_values
+                if structured_values is None
+                else structured_values
+            ),
+            fail_fast=fail_fast,
+            ignore_rules=self._ignore_rules(ignorable_keys),
+        )
+        if self.save_results:
+            save_drift_data(drift_meta, release, namespace, self.cluster_name)
+
+        return CheckResult.from_drift_meta(
+            drift_meta,
+            release,
+            namespace,
+            self.cluster_name,
+            time.monotonic() - started,
+        )
+
+    def calibrate(
+        self, release: str, namespace: str, full: bool = False
+    ) -> CalibrationResult:
+        """
+        Calibrate a release; see `calibrate_system`.
+
+        Args:
+            release (str): Helm release name.
+            namespace (str): Kubernetes namespace.
+            full (bool): Recalibrate every resource instead of only changed ones.
+
+        Returns:
+            CalibrationResult: The saved calibration.
+        """
+
+        with self._lock:
+            lock = self._calibrating.setdefault((namespace, release), threading.Lock())
+
+        with lock:
+            calibration_data = calibrate_system(
+                release, namespace, self.cluster_name, full
+            )
+
+        return CalibrationResult(
+            release=release,
+            namespace=namespace,
+            cluster=self.cluster_name,
+            revision=calibration_data.get("revision"),
+            date=calibration_data["date"],
+            ignorable_keys=list(calibration_data["ignorable_keys"]),
+            resources=len(calibration_data.get("resources", {})),
+        )
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the statistics of the session caches.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The statistics by cache name.
+        """
+
+        stats = cache_stats()
+        with self._lock:
+            stats["ignore_rules"] = {"entries": len(self._rules)}
+        return stats
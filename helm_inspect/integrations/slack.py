@@ -7,8 +7,8 @@
 """
 
 import requests
-import json
 
+from helm_inspect.utils import codec
 from helm_inspect.utils.constant import (
     SLACK_FILE_UPLOAD_GET_URL,
     SLACK_FILE_UPLOAD_COMPLETE_URL,
@@ -31,8 +31,8 @@ def send_slack_notification_with_attachment(
         message (str): Message to send.
         file_data (dict): The drift report (JSON) to send as an attachment.
     """
-    file_content = json.dumps(file_data, indent=2)
-    file_length = len(file_content.encode("utf-8"))
+    file_content = codec.dumps(file_data, indent=True)
+    file_length = len(file_content)
 
     file_upload_url, file_id = get_file_upload_url(slack_token, file_length)
     if not file_upload_url or not file_id:
@@ -73,7 +73,7 @@ def get_file_upload_url(slack_token: str, file_length: int) -> tuple[str, str]:
 
 
 def upload_file_to_slack(
-    file_upload_url: str, slack_token: str, file_content: str
+    file_upload_url: str, slack_token: str, file_content: bytes
 ) -> bool:
     """
     Upload the file to Slack.
@@ -81,7 +81,7 @@ def upload_file_to_slack(
     Args:
         file_upload_url (str): URL to upload the file.
         slack_token (str): Slack API token.
-        file_content (str): Content of the file.
+        file_content (bytes): Content of the file, UTF-8 encoded.
 
     Returns:
         bool: True if the file was uploaded successfully, False otherwise.
@@ -146,7 +146,7 @@ def complete_file_upload(
         "Content-Type": "application/json; charset=utf-8",
     }
     file_complete_meta = {
-        "files": json.dumps([{"id": file_id, "title": "Drift Report"}]),
+        "files": codec.dumps_text([{"id": file_id, "title": "Drift Report"}]),
         "channel_id": slack_channel,
         "thread_ts": ts_id,
     }
@@ -242,7 +242,7 @@ def build_slack_message(
         },
     ]
 
-    return json.dumps(message)
+    return codec.dumps_text(message)
 
 
 def post_slack_message(
@@ -11,29 +11,149 @@ import sys
 
 from helm_inspect.utils.cli import (
     detect_drift,
+    detect_fleet_drift,
+    merge_fleet_reports,
     parse_args,
+    prune_files,
+    show_resource_drift,
     validate_args,
     check_prerequisites,
 )
 from helm_inspect.utils.cluster import get_cluster_name
 from helm_inspect.utils.calibration import calibrate_system
-from helm_inspect.utils.logger import setup_logger
+from helm_inspect.utils.limiter import set_run_timeout
+from helm_inspect.utils.logger import setup_event_log, setup_logger
+from helm_inspect.utils.server import serve
+from helm_inspect.utils.snapshot import start_recording, start_replay
 
 
 def main():
     print(text2art("\n\nHelm\nInspect\n\n", font="speed"))
 
-    check_prerequisites()
-
     args = parse_args()
     logger = setup_logger(args.verbose)
     validate_args(args)
 
+    if getattr(args, "event_log", None):
+        try:
+            setup_event_log(args.event_log)
+        except OSError as e:
+            logger.error(f"❌ Error opening event log: {str(e)}")
+            sys.exit(1)
+
+    if args.command == "merge":
+        try:
+            merge_fleet_reports(args.cluster, args.output)
+        except Exception as e:
+            logger.error(f"❌ Error merging fleet summaries: {str(e)}")
+            sys.exit(1)
+        return
+
+    if args.command == "prune":
+        try:
+            prune_files(args.older_than, args.dry_run)
+        except Exception as e:
+            logger.error(f"❌ Error pruning files: {str(e)}")
+            sys.exit(1)
+        return
+
+    if getattr(args, "from_snapshot", None):
+        try:
+            start_replay(args.from_snapshot)
+        except Exception as e:
+            logger.error(f"❌ Error loading snapshot: {str(e)}")
+            sys.exit(1)
+    else:
+        check_prerequisites()
+
+    snapshot = None
+    if getattr(args, "snapshot", None):
+        try:
+            snapshot = start_recording(
+                args.snapshot, getattr(args, "snapshot_secrets", False)
+            )
+        except Exception as e:
+            logger.error(f"❌ Error recording snapshot: {str(e)}")
+            sys.exit(1)
+
+    timer = set_run_timeout(args.timeout) if getattr(args, "timeout", None) else None
+
+    try:
+        run(args, logger)
+        if timer and timer.finished.is_set():
+            logger.error(f"❌ Run timed out after {args.timeout:g}s.")
+            sys.exit(1)
+    finally:
+        if timer:
+            timer.cancel()
+        if snapshot:
+            try:
+                snapshot.save(args.snapshot)
+            except Exception as e:
+                logger.error(f"❌ Error saving snapshot: {str(e)}")
+
+
+def run(args, logger):
     cluster_name = get_cluster_name()
 
+    if args.command == "scan":
+        try:
+            fleet_summary = detect_fleet_drift(
+                args.namespace,
+                cluster_name,
+                args.no_ignore,
+                args.deadline,
+                args.workers,
+                args.summary_only,
+                args.structured_values,
+                args.shard,
+                fail_fast=args.fail_fast,
+                quick=args.quick,
+                server_dry_run=args.server_dry_run,
+            )
+        except Exception as e:
+            logger.error(f"❌ Error scanning releases: {str(e)}")
+            sys.exit(1)
+        if args.fail_fast and fleet_summary["summary"]["drifting_releases"]:
+            sys.exit(1)
+        return
+
+    if args.command == "serve":
+        try:
+            serve(
+                cluster_name,
+                args.host,
+                args.port,
+                args.namespace,
+                args.no_ignore,
+                args.workers,
+                args.structured_values,
+                args.interval,
+                args.cache_ttl,
+            )
+        except Exception as e:
+            logger.error(f"❌ Error serving drift results: {str(e)}")
+            sys.exit(1)
+        return
+
+    if args.command == "show":
+        try:
+            show_resource_drift(
+                args.release,
+                args.namespace,
+                cluster_name,
+                args.resource,
+                args.no_ignore,
+                args.structured_values,
+            )
+        except Exception as e:
+            logger.error(f"❌ Error rendering drift: {str(e)}")
+            sys.exit(1)
+        return
+
     if args.calibrate:
         try:
-            calibrate_system(args.release, args.namespace, cluster_name)
+            calibrate_system(args.release, args.namespace, cluster_name, args.full)
             return
         except Exception as e:
             logger.error(f"❌ Error calibrating system: {str(e)}")
@@ -41,17 +161,27 @@ def main():
         return
 
     try:
-        detect_drift(
+        drift_meta = detect_drift(
             args.release,
             args.namespace,
             cluster_name,
             args.no_ignore,
             args.slack_channel,
             args.slack_token,
+            args.diff,
+            args.summary_only,
+            args.structured_values,
+            args.fail_fast,
+            args.quick,
+            args.server_dry_run,
         )
     except Exception as e:
         logger.error(f"❌ Error detecting drift: {str(e)}")
         sys.exit(1)
+    if args.fail_fast and (
+        drift_meta["drift_summary"]["total_drifts"] or drift_meta.get("stopped_early")
+    ):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,217 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import hashlib
+import hmac
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from helm_inspect.utils import codec
+from helm_inspect.utils.constant import BLOB_DIR, DIGEST_KEY_FILE, LEAF_DIGEST_BYTES
+from helm_inspect.utils.logger import setup_logger
+from helm_inspect.utils.storage import atomic_write
+
+logger = setup_logger()
+
+DIGEST_KEY_BYTES = 32
+"""
+Size of the key of Secret value digests.
+"""
+
+_digest_key: Optional[bytes] = None
+_digest_key_lock = threading.Lock()
+
+
+def _encode(value: Any) -> bytes:
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    return codec.dumps(value, sort_keys=True, default=str)
+
+
+def get_digest_key() -> bytes:
+    """
+    Get the per-installation key of Secret value digests, creating it once.
+
+    The key is kept in `DIGEST_KEY_FILE`, readable by the owner only, so
+    digests compare across runs but cannot be matched against guessed values
+    without it. If it cannot be read or written, a key for this process only
+    is used.
+
+    Returns:
+        bytes: The key.
+    """
+
+    global _digest_key
+
+    with _digest_key_lock:
+        if _digest_key is not None:
+            return _digest_key
+        try:
+            DIGEST_KEY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                fd = os.open(
+                    DIGEST_KEY_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600
+                )
+            except FileExistsError:
+                key = DIGEST_KEY_FILE.read_bytes()
+                if len(key) < DIGEST_KEY_BYTES:
+                    raise OSError(f"{DIGEST_KEY_FILE} holds no valid key")
+            else:
+                key = os.urandom(DIGEST_KEY_BYTES)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(key)
+        except OSError as e:
+            logger.warning(
+                f"⚠️ Failed to load the digest key ({e}), Secret digests will "
+                "not compare across runs."
+            )
+            key = os.urandom(DIGEST_KEY_BYTES)
+        _digest_key = key
+        return key
+
+
+def blob_path(digest: str) -> Path:
+    """
+    Get the path of a blob in the store.
+
+    Args:
+        digest (str): The prefixed hex digest, e.g. `sha256:ab12...`.
+
+    Returns:
+        Path: The blob path.
+    """
+
+    hex_digest = digest.split(":", 1)[-1]
+    return BLOB_DIR / hex_digest[:2] / hex_digest
+
+
+def store_blob(content: bytes) -> str:
+    """
+    Write content to the blob store, once per distinct content.
+
+    Storing content that is already present only refreshes its modification
+    time, so pruning by age keeps blobs still referenced by recent reports.
+
+    Args:
+        content (bytes): The content.
+
+    Returns:
+        str: The prefixed hex digest identifying the blob.
+
+    Raises:
+        OSError: If the blob cannot be written.
+    """
+
+    digest = "sha256:" + hashlib.sha256(content).hexdigest()
+    path = blob_path(digest)
+    if path.exists():
+        os.utime(path)
+    else:
+        atomic_write(path, content)
+    return digest
+
+
+def load_blob(digest: str) -> Optional[str]:
+    """
+    Read a blob from the store.
+
+    Args:
+        digest (str): The prefixed hex digest.
+
+    Returns:
+        str or None: The content, None if the blob is not stored.
+    """
+
+    try:
+        return blob_path(digest).read_bytes().decode("utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def digest_value(value: Any, store: bool = True, keyed: bool = False) -> Dict[str, Any]:
+    """
+    Replace a value with its digest and size.
+
+    Args:
+        value (Any): The value, digested as UTF-8 text or canonical JSON.
+        store (bool): Whether the content is written to the blob store.
+        keyed (bool): Whether the digest is an HMAC-SHA256 under the
+            installation key (see `get_digest_key`), for values that must not
+            be recoverable by hashing guesses. Keyed values are never stored.
+
+    Returns:
+        Dict[str, Any]: The digest, the size in bytes and whether the content
+        was stored.
+    """
+
+    content = _encode(value)
+    stored = False
+    if keyed:
+        mac = hmac.new(get_digest_key(), content, hashlib.sha256).hexdigest()
+        digest = "hmac-sha256:" + mac
+    elif store:
+        try:
+            digest = store_blob(content)
+            stored = True
+        except OSError as e:
+            logger.error(f"Failed to store blob: {e}")
+            digest = "sha256:" + hashlib.sha256(content).hexdigest()
+    else:
+        digest = "sha256:" + hashlib.sha256(content).hexdigest()
+
+    return {"digest": digest, "size": len(content), "stored": stored}
+
+
+def report_value(kind: str, value: Any) -> Any:
+    """
+    Get the form of a drifted value recorded in drift reports.
+
+    Secret values are always replaced by their keyed digest and never stored;
+    other values larger than `LEAF_DIGEST_BYTES` are replaced by their digest
+    and stored once in the blob store (see `load_blob`).
+
+    Args:
+        kind (str): The Kubernetes resource kind.
+        value (Any): The value.
+
+    Returns:
+        Any: The value itself, or its digest (see `digest_value`).
+    """
+
+    if kind == "Secret":
+        return digest_value(value, store=False, keyed=True)
+    if isinstance(value, str) and len(value) > LEAF_DIGEST_BYTES // 4:
+        if len(value.encode("utf-8")) > LEAF_DIGEST_BYTES:
+            return digest_value(value)
+    return value
+
+
+def redact_values(data: Any) -> Any:
+    """
+    Replace every leaf with a `hmac-sha256:<hex> (<size> bytes)` placeholder.
+
+    Used to render diffs of Secrets without printing their values.
+
+    Args:
+        data (Any): The data to redact.
+
+    Returns:
+        Any: The redacted copy.
+    """
+
+    if isinstance(data, dict) and data:
+        return {key: redact_values(value) for key, value in data.items()}
+    if isinstance(data, list) and data:
+        return [redact_values(value) for value in data]
+    if isinstance(data, (dict, list)):
+        return data
+
+    digest = digest_value(data, store=False, keyed=True)
+    return f"{digest['digest']} ({digest['size']} bytes)"
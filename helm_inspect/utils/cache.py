@@ -0,0 +1,494 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from helm_inspect.utils import codec
+from helm_inspect.utils.constant import (
+    CACHE_DIR,
+    CACHE_DISK,
+    CACHE_MAX_BYTES,
+    CACHE_NAMESPACE_TTLS,
+)
+from helm_inspect.utils.logger import setup_logger
+from helm_inspect.utils.storage import delete_file, read_json, write_json
+
+logger = setup_logger()
+
+MISSING = object()
+"""
+Sentinel returned by `BoundedCache.get` on a miss.
+"""
+
+
+def namespace_ttl(
+    namespace: Optional[str], default: Optional[float]
+) -> Optional[float]:
+    """
+    Get the time to live of cached entries of a namespace.
+
+    Args:
+        namespace (str, optional): The Kubernetes namespace.
+        default (float, optional): The TTL of namespaces without an override.
+
+    Returns:
+        float or None: The TTL in seconds, None never expires.
+    """
+
+    return CACHE_NAMESPACE_TTLS.get(namespace, default)
+
+
+def _namespace(key: Hashable) -> Optional[str]:
+    return key[0] if isinstance(key, tuple) and key else None
+
+
+def _size(value: Any) -> int:
+    return len(codec.dumps(value, default=str))
+
+
+class BoundedCache:
+    """
+    Thread-safe LRU cache bounded by the estimated size of its values.
+
+    Keys are tuples starting with the namespace, whose TTL override (see
+    `HI_CACHE_NAMESPACE_TTLS`) applies to them. With a disk directory,
+    entries are also written under it and read back on a memory miss, so
+    they survive evictions and restarts.
+
+    Values are shared, not copied: what is put and what `get` returns must
+    be treated as read-only, and copied by callers that modify it. Entries
+    are sized by the caller from the response they were parsed from, or
+    estimated from their JSON form outside the lock.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        disk_dir: Optional[Path] = None,
+    ):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Any: The value, or `MISSING` if absent or expired.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                value = entry[2]
+            else:
+                if entry is not None:
+                    self.size -= self._entries.pop(key)[1]
+                value = MISSING
+
+        if value is MISSING:
+            value, expires = self._read_disk(key)
+            if value is MISSING:
+                with self._lock:
+                    self.misses += 1
+                return MISSING
+            size = _size(value)
+            with self._lock:
+                self.disk_hits += 1
+                self._store(key, value, expires, size)
+
+        return value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = MISSING,
+        size: Optional[int] = None,
+    ) -> None:
+        """
+        Cache a value.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value, no longer modified by the caller.
+            ttl (float, optional): Time to live in seconds, defaults to the
+                TTL of the key namespace; None never expires.
+            size (int, optional): The size of the value in bytes, e.g. of the
+                response it was parsed from; estimated when not provided.
+        """
+
+        if ttl is MISSING:
+            ttl = namespace_ttl(_namespace(key), self.ttl)
+        if size is None:
+            size = _size(value)
+        with self._lock:
+            self._store(
+                key, value, time.monotonic() + ttl if ttl is not None else None, size
+            )
+        self._write_disk(key, value, ttl)
+
+    def _store(
+        self, key: Hashable, value: Any, expires: Optional[float], size: int
+    ) -> None:
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+        self._entries[key] = (expires, size, value)
+        self.size += size
+        while (
+            self.max_bytes is not None
+            and self.size > self.max_bytes
+            and len(self._entries) > 1
+        ):
+            self.size -= self._entries.popitem(last=False)[1][1]
+            self.evictions += 1
+
+    def _disk_name(self, key: Hashable) -> str:
+        return f"{hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest()}.json"
+
+    def _read_disk(self, key: Hashable) -> Tuple[Any, Optional[float]]:
+        if self.disk_dir is None:
+            return MISSING, None
+        try:
+            entry = read_json(self.disk_dir, self._disk_name(key))
+        except (ValueError, OSError):
+            return MISSING, None
+        if not entry or entry.get("key") != repr(key):
+            return MISSING, None
+        if entry.get("expires") is None:
+            return entry.get("value"), None
+        remaining = entry["expires"] - time.time()
+        if remaining <= 0:
+            return MISSING, None
+        return entry.get("value"), time.monotonic() + remaining
+
+    def _write_disk(self, key: Hashable, value: Any, ttl: Optional[float]) -> None:
+        if self.disk_dir is None:
+            return
+        entry = {
+            "key": repr(key),
+            "expires": time.time() + ttl if ttl is not None else None,
+            "value": value,
+        }
+        try:
+            write_json(self.disk_dir, self._disk_name(key), entry)
+        except (OSError, TypeError, ValueError, RuntimeError):
+            pass
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[1]
+        if self.disk_dir is not None:
+            try:
+                delete_file(self.disk_dir, self._disk_name(key))
+            except OSError:
+                pass
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Drop every entry whose key matches a predicate.
+
+        Only entries held in memory are matched; disk entries of other keys
+        are left in place.
+
+        Args:
+            predicate (Callable[[Hashable], bool]): Selects the keys to drop.
+
+        Returns:
+            int: The number of entries dropped.
+        """
+
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            self.invalidate(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache statistics.
+
+        Returns:
+            Dict[str, Any]: The entry count, size, hit, miss and eviction
+            counts and the hit rate.
+        """
+
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (
+                    round((self.hits + self.disk_hits) / lookups, 4)
+                    if lookups
+                    else None
+                ),
+                "ttl": self.ttl,
+            }
+
+
+class NamespaceIndex:
+    """
+    Live objects of a namespace, listed once per kind and indexed by name.
+
+    Listings expire after a time to live (or the TTL override of their
+    namespace) and the least recently used ones are evicted once their
+    estimated size exceeds the memory bound. Only one
+    thread lists a given namespace and kind at a time; the others wait for
+    its result.
+    """
+
+    def __init__(self, ttl: float, max_bytes: int):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.lists = 0
+        self.hits = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[str, str], tuple]" = OrderedDict()
+        self._loading: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        namespace: str,
+        kind: str,
+        load: Callable[[], Tuple[Optional[Dict[str, Any]], int]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the objects of a kind in a namespace, listing them when needed.
+
+        Args:
+            namespace (str): The Kubernetes namespace.
+            kind (str): The Kubernetes resource kind.
+            load (Callable): Lists the objects, returning them by name (None
+                when the kind cannot be listed) and their size in bytes.
+
+        Returns:
+            Dict[str, Any] or None: The objects by name, None if not listable.
+
+        Raises:
+            Exception: Whatever `load` raises, e.g. on a transient failure;
+                nothing is cached then, so the next lookup lists again.
+        """
+
+        key = (namespace, kind)
+        with self._lock:
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        with loading:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry and entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[2]
+                if entry:
+                    self.size -= self._entries.pop(key)[1]
+
+            objects, size = load()
+
+            with self._lock:
+                self.lists += 1
+                ttl = namespace_ttl(namespace, self.ttl)
+                expires = time.monotonic() + ttl if ttl is not None else float("inf")
+                self._entries[key] = (expires, size, objects)
+                self.size += size
+                while self.size > self.max_bytes and len(self._entries) > 1:
+                    self.size -= self._entries.popitem(last=False)[1][1]
+                    self.evictions += 1
+            return objects
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == namespace]:
+                self.size -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.lists
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.lists,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "ttl": self.ttl,
+            }
+
+
+_caches: Dict[str, Any] = {}
+_revisions: Dict[Tuple[str, str], Any] = {}
+_revisions_lock = threading.Lock()
+
+
+def enable_cache(
+    name: str, ttl: Optional[float] = None, disk: bool = False
+) -> BoundedCache:
+    """
+    Enable a bounded cache, or get it if already enabled.
+
+    Args:
+        name (str): `manifests`, `resources` or `calibration`.
+        ttl (float, optional): Default time to live in seconds, None never expires.
+        disk (bool): Whether entries are also kept under `CACHE_DIR`.
+
+    Returns:
+        BoundedCache: The cache.
+    """
+
+    cache = _caches.get(name)
+    if not isinstance(cache, BoundedCache):
+        cache = _caches[name] = BoundedCache(
+            ttl, CACHE_MAX_BYTES, CACHE_DIR / name if disk else None
+        )
+    return cache
+
+
+def enable_warm_caches(ttl: float) -> Dict[str, Any]:
+    """
+    Keep Helm manifests, live objects and calibration data in memory.
+
+    Used by long-lived processes (`helm-inspect serve`). Manifests are keyed
+    by revision and never expire (and are kept on disk with
+    `HI_CACHE_DISK`); live objects expire after `ttl` seconds; calibration
+    data is invalidated whenever it is saved or deleted.
+
+    Args:
+        ttl (float): Time to live of live objects in seconds.
+
+    Returns:
+        Dict[str, Any]: The caches by name.
+    """
+
+    enable_cache("manifests", ttl, disk=CACHE_DISK)
+    enable_cache("resources", ttl)
+    enable_cache("calibration")
+    return _caches
+
+
+def invalidate_release(namespace: str, release: str, revision: Any) -> bool:
+    """
+    Drop cached data made stale by a new Helm revision of a release.
+
+    The first revision seen for a release is only recorded. When it changes,
+    the cached manifests of the release and the live objects and listings
+    of its namespace are dropped, as the upgrade may have changed them.
+
+    Args:
+        namespace (str): The namespace of the release.
+        release (str): The name of the release.
+        revision (Any): The current revision of the release.
+
+    Returns:
+        bool: True if cached data was invalidated.
+    """
+
+    with _revisions_lock:
+        previous = _revisions.get((namespace, release), revision)
+        _revisions[(namespace, release)] = revision
+    if previous == revision:
+        return False
+
+    manifests = get_cache("manifests")
+    if manifests:
+        manifests.invalidate_where(lambda key: key[:2] == (namespace, release))
+    resources = get_cache("resources")
+    if resources:
+        resources.invalidate_where(lambda key: key[0] == namespace)
+    index = get_cache("namespaces")
+    if index:
+        index.invalidate_namespace(namespace)
+
+    logger.debug(
+        f"Release `{release}` moved from revision {previous} to {revision}, "
+        "cached data invalidated."
+    )
+    return True
+
+
+def enable_namespace_index(ttl: float, max_bytes: int) -> Optional[NamespaceIndex]:
+    """
+    Serve live objects from namespace listings instead of one call per object.
+
+    Args:
+        ttl (float): Seconds a listing is reused, 0 to disable.
+        max_bytes (int): Memory bound of the listings.
+
+    Returns:
+        NamespaceIndex or None: The index, None when disabled.
+    """
+
+    if ttl <= 0:
+        return None
+    if not isinstance(_caches.get("namespaces"), NamespaceIndex):
+        _caches["namespaces"] = NamespaceIndex(ttl, max_bytes)
+    return _caches["namespaces"]
+
+
+def get_cache(name: str) -> Optional[BoundedCache]:
+    """
+    Get a cache, if enabled.
+
+    Args:
+        name (str): `manifests`, `resources`, `calibration` or `namespaces`.
+
+    Returns:
+        BoundedCache or NamespaceIndex or None: The cache.
+    """
+
+    return _caches.get(name)
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get the statistics of every enabled cache.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The statistics by cache name.
+    """
+
+    return {name: cache.stats() for name, cache in _caches.items()}
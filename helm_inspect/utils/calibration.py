@@ -6,15 +6,39 @@
 
 """
 
-import json
+import hashlib
+import re
 from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
+from helm_inspect.utils import codec
+from helm_inspect.utils.cache import MISSING, get_cache
 from helm_inspect.utils.logger import setup_logger
-from helm_inspect.utils.drift_check import get_ignorable_keys
-from helm_inspect.utils.constant import TMP_DIR, DRIFT_DIR
+from helm_inspect.utils.cluster import get_helm_manifest, get_helm_revision
+from helm_inspect.utils.drift_check import (
+    calibrate_resources,
+    get_resource_info,
+    is_supported_resource,
+)
+from helm_inspect.utils.constant import BLOB_DIR, CACHE_DIR, TMP_DIR, DRIFT_DIR
+from helm_inspect.utils.credentials import orphaned_kubeconfigs
+from helm_inspect.utils.storage import (
+    delete_file,
+    find_file,
+    prune,
+    read_json,
+    store_path,
+    write_json,
+)
 
 logger = setup_logger()
 
+RELEASE_PLACEHOLDER = "{release}"
+"""
+Stands for the release name in the resource names of chart profiles.
+"""
+
 
 def get_calibration_file(release: str, namespace: str, cluster: str) -> dict:
     """
@@ -29,19 +53,32 @@ def get_calibration_file(release: str, namespace: str, cluster: str) -> dict:
         dict or None: The calibration data if available, otherwise None.
     """
 
-    calibration_file = TMP_DIR / f"calibration_{release}_{namespace}_{cluster}.json"
-    if calibration_file.exists():
-        try:
-            with open(calibration_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
-            logger.error(f"Failed to read calibration file: {e}")
-    return None
+    name = f"calibration_{release}_{namespace}_{cluster}.json"
+    cache = get_cache("calibration")
+    if cache:
+        calibration_data = cache.get((namespace, release, cluster))
+        if calibration_data is not MISSING:
+            return calibration_data
+
+    try:
+        calibration_data = read_json(TMP_DIR, name)
+    except (ValueError, OSError) as e:
+        logger.error(f"Failed to read calibration file: {e}")
+        return None
+
+    if cache:
+        cache.put((namespace, release, cluster), calibration_data)
+    return calibration_data
 
 
 def save_calibration_data(
-    ignorable_keys: list, release: str, namespace: str, cluster: str
-) -> None:
+    ignorable_keys: list,
+    release: str,
+    namespace: str,
+    cluster: str,
+    revision: Optional[int] = None,
+    resources: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> dict:
     """
     Save calibration data to file.
 
@@ -50,26 +87,38 @@ def save_calibration_data(
         release (str): The release name.
         namespace (str): The namespace of the release.
         cluster (str): The cluster name.
-    """
+        revision (int, optional): The Helm revision that was calibrated.
+        resources (Dict[str, Dict[str, Any]], optional): The manifest fingerprint
+            and ignorable keys of each resource, keyed by `Kind;name`.
 
-    TMP_DIR.mkdir(parents=True, exist_ok=True)
-    calibration_file = TMP_DIR / f"calibration_{release}_{namespace}_{cluster}.json"
+    Returns:
+        dict: The calibration data.
+    """
 
     calibration_data = {
         "date": datetime.utcnow().isoformat(),
         "release": release,
         "namespace": namespace,
         "cluster": cluster,
+        "revision": revision,
         "ignorable_keys": ignorable_keys,
     }
+    if resources is not None:
+        calibration_data["resources"] = resources
+
+    name = f"calibration_{release}_{namespace}_{cluster}.json"
+    cache = get_cache("calibration")
+    if cache:
+        cache.invalidate((namespace, release, cluster))
 
     try:
-        with open(calibration_file, "w") as f:
-            json.dump(calibration_data, f, indent=2)
+        write_json(TMP_DIR, name, calibration_data)
         logger.info("✅ Calibration data saved successfully.")
-    except OSError as e:
+    except (OSError, RuntimeError) as e:
         logger.error(f"Failed to save calibration file: {e}")
 
+    return calibration_data
+
 
 def delete_calibration_file(release: str, namespace: str, cluster: str) -> None:
     """
@@ -81,29 +130,380 @@ def delete_calibration_file(release: str, namespace: str, cluster: str) -> None:
         cluster (str): The cluster name.
     """
 
-    calibration_file = TMP_DIR / f"calibration_{release}_{namespace}_{cluster}.json"
+    name = f"calibration_{release}_{namespace}_{cluster}.json"
+    cache = get_cache("calibration")
+    if cache:
+        cache.invalidate((namespace, release, cluster))
 
-    if calibration_file.exists():
-        try:
-            calibration_file.unlink()
+    try:
+        if delete_file(TMP_DIR, name):
             logger.info("✅ Calibration data deleted successfully.")
-        except OSError as e:
-            logger.error(f"Failed to delete calibration file: {e}")
+    except OSError as e:
+        logger.error(f"Failed to delete calibration file: {e}")
+
+
+def get_chart(helm_manifest: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Get the chart name and version of a release from its manifest.
+
+    Args:
+        helm_manifest (List[Dict[str, Any]]): The Helm manifest.
+
+    Returns:
+        str or None: The `helm.sh/chart` label, e.g. `nginx-1.2.3`.
+    """
+
+    for resource in helm_manifest:
+        labels = (resource or {}).get("metadata", {}).get("labels") or {}
+        if labels.get("helm.sh/chart"):
+            return str(labels["helm.sh/chart"])
+    return None
+
+
+def normalize_resource_name(name: str, release: str) -> str:
+    """
+    Replace the release name in a resource name with `RELEASE_PLACEHOLDER`.
+
+    Only whole `-` or `.` separated segments are replaced, so that
+    `web-nginx` of release `web` becomes `{release}-nginx`.
+
+    Args:
+        name (str): The resource name.
+        release (str): The release name.
+
+    Returns:
+        str: The normalized name.
+    """
+
+    pattern = rf"(?<![a-z0-9]){re.escape(release)}(?![a-z0-9])"
+    return re.sub(pattern, lambda _: RELEASE_PLACEHOLDER, name)
+
+
+def get_chart_profile(chart: str, cluster: str) -> Optional[dict]:
+    """
+    Retrieve the calibration profile shared by the releases of a chart.
+
+    Args:
+        chart (str): The chart name and version.
+        cluster (str): The cluster name.
+
+    Returns:
+        dict or None: The profile if available, otherwise None.
+    """
+
+    cache = get_cache("calibration")
+    if cache:
+        profile = cache.get((None, chart, cluster))
+        if profile is not MISSING:
+            return profile
+
+    try:
+        profile = read_json(TMP_DIR, f"profile_{chart}_{cluster}.json")
+    except (ValueError, OSError) as e:
+        logger.error(f"Failed to read calibration profile: {e}")
+        return None
+
+    if cache:
+        cache.put((None, chart, cluster), profile)
+    return profile
+
+
+def save_chart_profile(
+    chart: str, cluster: str, release: str, resources: Dict[str, Dict[str, Any]]
+) -> None:
+    """
+    Merge the calibration of a release into the profile of its chart.
+
+    Resource names are normalized (see `normalize_resource_name`) so the
+    profile applies to any release of the chart.
+
+    Args:
+        chart (str): The chart name and version.
+        cluster (str): The cluster name.
+        release (str): The calibrated release.
+        resources (Dict[str, Dict[str, Any]]): The calibration of each resource,
+            keyed by `Kind;name`.
+    """
+
+    profile = get_chart_profile(chart, cluster) or {"resources": {}}
+    profile_resources = dict(profile.get("resources", {}))
+
+    for ref, entry in resources.items():
+        if entry.get("missing"):
+            continue
+        kind, name = ref.split(";", 1)
+        normalized = f"{kind};{normalize_resource_name(name, release)}"
+        profile_resources[normalized] = [
+            f"{normalized};{key.split(';', 2)[2]}" for key in entry["keys"]
+        ]
+
+    profile = {
+        "date": datetime.utcnow().isoformat(),
+        "chart": chart,
+        "cluster": cluster,
+        "source_release": release,
+        "resources": profile_resources,
+    }
+
+    cache = get_cache("calibration")
+    if cache:
+        cache.invalidate((None, chart, cluster))
+
+    try:
+        write_json(TMP_DIR, f"profile_{chart}_{cluster}.json", profile)
+    except (OSError, RuntimeError) as e:
+        logger.error(f"Failed to save calibration profile: {e}")
+
+
+def get_profile_ignorable_keys(profile: dict, release: str) -> List[str]:
+    """
+    Get the ignorable keys of a release from the profile of its chart.
+
+    Args:
+        profile (dict): The chart profile.
+        release (str): The release name.
+
+    Returns:
+        List[str]: The ignorable keys, with the release name filled in.
+    """
+
+    return sorted(
+        key.replace(RELEASE_PLACEHOLDER, release)
+        for keys in profile.get("resources", {}).values()
+        for key in keys
+    )
+
+
+def fingerprint_resource(resource: Dict[str, Any]) -> str:
+    """
+    Get the fingerprint of a Helm manifest resource.
+
+    Args:
+        resource (Dict[str, Any]): The manifest resource.
 
+    Returns:
+        str: A digest of its content.
+    """
+
+    content = codec.dumps(resource, sort_keys=True, default=str)
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def update_calibration(
+    release: str,
+    namespace: str,
+    cluster: str,
+    helm_manifest: List[Dict[str, Any]],
+    revision: Optional[int] = None,
+    calibration_data: Optional[dict] = None,
+    recheck_missing: bool = False,
+    chart: Optional[str] = None,
+) -> dict:
+    """
+    Recalibrate only the resources added or changed since the last calibration.
+
+    Resources whose manifest fingerprint is unchanged keep their keys, and
+    the keys of resources no longer in the manifest are dropped. Without
+    per-resource data (no calibration, or one saved by an older version),
+    every resource is calibrated. The recalibrated resources are merged into
+    the profile of the chart; see `save_chart_profile`.
+
+    Args:
+        release (str): The release name.
+        namespace (str): The namespace of the release.
+        cluster (str): The cluster name.
+        helm_manifest (List[Dict[str, Any]]): The current Helm manifest.
+        revision (int, optional): The current Helm revision.
+        calibration_data (dict, optional): The last calibration data.
+        recheck_missing (bool): Also recalibrate unchanged resources that
+            were not found in the cluster last time.
+        chart (str, optional): The chart name and version, read from the
+            manifest labels when not provided.
+
+    Returns:
+        dict: The calibration data, saved if anything changed.
+    """
+
+    previous = (calibration_data or {}).get("resources", {})
+    resources = {}
+    changed = []
+
+    for resource in helm_manifest:
+        if not resource:
+            continue
+        kind, name = get_resource_info(resource)
+        if not is_supported_resource(kind):
+            continue
+
+        ref = f"{kind};{name}"
+        fingerprint = fingerprint_resource(resource)
+        entry = previous.get(ref, {})
+        if entry.get("fingerprint") == fingerprint and not (
+            recheck_missing and entry.get("missing")
+        ):
+            resources[ref] = entry
+        else:
+            resources[ref] = {"fingerprint": fingerprint, "keys": [], "missing": True}
+            changed.append((resource, fingerprint))
+
+    removed = previous.keys() - resources.keys()
+    if (
+        calibration_data
+        and not changed
+        and not removed
+        and revision in (None, calibration_data.get("revision"))
+    ):
+        return calibration_data
+
+    recalibrated = {}
+    if changed:
+        resource_keys = calibrate_resources(
+            [resource for resource, _ in changed], namespace
+        )
+        for resource, fingerprint in changed:
+            ref = "{};{}".format(*get_resource_info(resource))
+            if ref in resource_keys:
+                resources[ref] = {
+                    "fingerprint": fingerprint,
+                    "keys": resource_keys[ref],
+                }
+            recalibrated[ref] = resources[ref]
+
+    logger.info(
+        f"♻️ Calibration of `{release}`: {len(changed)} resource(s) recalibrated, "
+        f"{len(resources) - len(changed)} unchanged, {len(removed)} removed."
+    )
 
-def calibrate_system(release: str, namespace: str, cluster_name: str):
+    chart = chart or get_chart(helm_manifest)
+    if chart and recalibrated:
+        save_chart_profile(chart, cluster, release, recalibrated)
+
+    ignorable_keys = sorted(
+        {key for entry in resources.values() for key in entry["keys"]}
+    )
+    return save_calibration_data(
+        ignorable_keys, release, namespace, cluster, revision, resources
+    )
+
+
+def refresh_calibration(
+    calibration_data: dict,
+    release: str,
+    namespace: str,
+    cluster: str,
+    helm_manifest: List[Dict[str, Any]],
+    revision: Optional[int] = None,
+) -> dict:
     """
-    Calibrate the system by deleting existing calibration data and saving new data.
+    Bring calibration data up to date after a Helm upgrade.
+
+    Resources changed by an upgrade were just applied by Helm, so their live
+    state is a fresh baseline; see `update_calibration`. Nothing is fetched
+    when the recorded revision matches or no resource changed.
+
+    Args:
+        calibration_data (dict): The last calibration data.
+        release (str): The release name.
+        namespace (str): The namespace of the release.
+        cluster (str): The cluster name.
+        helm_manifest (List[Dict[str, Any]]): The current Helm manifest.
+        revision (int, optional): The current Helm revision, when known.
+
+    Returns:
+        dict: The up to date calibration data.
+    """
+
+    if "resources" not in calibration_data:
+        logger.warning(
+            "⚠️ Calibration data predates incremental calibration and cannot be "
+            "refreshed after upgrades. Recalibrate with --calibrate.\n"
+        )
+        return calibration_data
+
+    if not helm_manifest or (
+        revision is not None and calibration_data.get("revision") == revision
+    ):
+        return calibration_data
+
+    return update_calibration(
+        release, namespace, cluster, helm_manifest, revision, calibration_data
+    )
+
+
+def calibrate_system(
+    release: str, namespace: str, cluster_name: str, full: bool = False
+) -> dict:
+    """
+    Calibrate the system, recomputing only the resources that changed since
+    the last calibration (see `update_calibration`).
 
     Args:
         release (str): The release name.
         namespace (str): The namespace of the release.
         cluster_name (str): The cluster name.
+        full (bool): Delete existing calibration data and calibrate every resource.
+
+    Returns:
+        dict: The calibration data.
     """
 
-    delete_calibration_file(release, namespace, cluster_name)
-    ignorable_keys = get_ignorable_keys(release, namespace)
-    save_calibration_data(ignorable_keys, release, namespace, cluster_name)
+    if full:
+        delete_calibration_file(release, namespace, cluster_name)
+        calibration_data = None
+    else:
+        calibration_data = get_calibration_file(release, namespace, cluster_name)
+
+    helm_manifest = get_helm_manifest(release, namespace)
+    revision = get_helm_revision(release, namespace)
+    updated = update_calibration(
+        release,
+        namespace,
+        cluster_name,
+        helm_manifest,
+        revision,
+        calibration_data,
+        recheck_missing=True,
+    )
+    if updated is calibration_data:
+        logger.info("✅ Calibration data is up to date.")
+    return updated
+
+
+def get_drift_file_path(release: str, namespace: str, cluster: str) -> Path:
+    """
+    Get the path of the drift file for a given release.
+
+    Args:
+        release (str): The release name.
+        namespace (str): The namespace of the release.
+        cluster (str): The cluster name.
+
+    Returns:
+        Path: The existing drift file, or the path it will be saved to.
+    """
+
+    name = f"drift_{release}_{namespace}_{cluster}.json"
+    return find_file(DRIFT_DIR, name) or store_path(DRIFT_DIR, name)
+
+
+def get_drift_data(release: str, namespace: str, cluster: str) -> dict:
+    """
+    Retrieve the last saved drift data if available.
+
+    Args:
+        release (str): The release name.
+        namespace (str): The namespace of the release.
+        cluster (str): The cluster name.
+
+    Returns:
+        dict or None: The drift data if available, otherwise None.
+    """
+
+    try:
+        return read_json(DRIFT_DIR, f"drift_{release}_{namespace}_{cluster}.json")
+    except (ValueError, OSError) as e:
+        logger.error(f"Failed to read drift file: {e}")
+    return None
 
 
 def save_drift_data(drift_data: dict, release: str, namespace: str, cluster: str):
@@ -117,12 +517,58 @@ def save_drift_data(drift_data: dict, release: str, namespace: str, cluster: str
         cluster (str): The cluster name.
     """
 
-    DRIFT_DIR.mkdir(parents=True, exist_ok=True)
-    drift_file = DRIFT_DIR / f"drift_{release}_{namespace}_{cluster}.json"
-
     try:
-        with open(drift_file, "w") as f:
-            json.dump(drift_data, f, indent=2)
+        write_json(DRIFT_DIR, f"drift_{release}_{namespace}_{cluster}.json", drift_data)
         logger.info("✅ Drift data saved successfully.")
-    except OSError as e:
+    except (OSError, RuntimeError) as e:
         logger.error(f"Failed to save drift file: {e}")
+
+
+def prune_saved_files(
+    max_age_days: Optional[float] = None,
+    dry_run: bool = False,
+) -> List[Path]:
+    """
+    Remove drift reports, fleet summaries, scan states, cached manifests and
+    blobs of large drifted values past their retention.
+
+    Calibration data is never pruned. Kubeconfigs holding cached exec
+    credentials are removed once their process is gone (see
+    `orphaned_kubeconfigs`) or past the retention.
+
+    Args:
+        max_age_days (float, optional): Remove files not modified for this many days.
+        dry_run (bool): Only list the files that would be removed.
+
+    Returns:
+        List[Path]: The removed files.
+    """
+
+    removed = []
+    try:
+        removed += prune(
+            DRIFT_DIR,
+            ["drift_*.json", "fleet_summary_*.json"],
+            max_age_days,
+            dry_run=dry_run,
+        )
+        removed += prune(
+            TMP_DIR,
+            ["scan_state_*.json", "kubeconfig_*.json"],
+            max_age_days,
+            dry_run=dry_run,
+        )
+        for path in orphaned_kubeconfigs(TMP_DIR):
+            if path not in removed:
+                if not dry_run:
+                    path.unlink(missing_ok=True)
+                removed.append(path)
+        removed += prune(
+            CACHE_DIR / "manifests", ["*.json"], max_age_days, dry_run=dry_run
+        )
+        if max_age_days is not None:
+            removed += prune(BLOB_DIR, ["*"], max_age_days, dry_run=dry_run)
+    except OSError as e:
+        logger.error(f"Failed to prune saved files: {e}")
+
+    return removed
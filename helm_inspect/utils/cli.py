@@ -7,20 +7,74 @@
 """
 
 import argparse
+import logging
 import shutil
 import sys
 
 from datetime import datetime
-from pathlib import Path
 
-from helm_inspect.utils.calibration import get_calibration_file, save_drift_data
-from helm_inspect.utils.drift_check import check_drift, IGNORABLE_KEYS
-from helm_inspect.utils.logger import setup_logger
-from helm_inspect.utils.constant import HI_SLACK_BOT_TOKEN, HI_SLACK_CHANNEL
+from helm_inspect.utils.calibration import (
+    get_calibration_file,
+    get_chart,
+    get_chart_profile,
+    get_drift_data,
+    get_profile_ignorable_keys,
+    get_drift_file_path,
+    prune_saved_files,
+    refresh_calibration,
+    save_drift_data,
+)
+from helm_inspect.utils.cluster import (
+    get_helm_manifest,
+    get_helm_revision,
+    list_helm_releases,
+)
+from helm_inspect.utils.drift_check import (
+    check_drift,
+    get_server_defaults,
+    show_drift,
+)
+from helm_inspect.utils.hotkeys import DriftAggregator, format_hot_spots
+from helm_inspect.utils.logger import console_level, setup_logger
+from helm_inspect.utils.quick import check_drift_quick
+from helm_inspect.utils.scheduler import (
+    build_fleet_summary,
+    duration_type,
+    get_scan_state,
+    parse_duration,
+    prioritize_releases,
+    run_scheduled_scan,
+    save_fleet_summary,
+    save_scan_state,
+    update_scan_state,
+)
+from helm_inspect.utils.sharding import (
+    get_fleet_summaries,
+    merge_fleet_summaries,
+    parse_shard,
+    save_fleet_report,
+    select_shard,
+)
+from helm_inspect.utils.constant import (
+    CACHE_DISK,
+    HI_EVENT_LOG,
+    HI_SLACK_BOT_TOKEN,
+    HI_SLACK_CHANNEL,
+    HOT_KEYS_TOP,
+    NAMESPACE_CACHE_MAX_BYTES,
+    NAMESPACE_CACHE_TTL,
+    RETENTION_DAYS,
+)
+from helm_inspect.utils.cache import (
+    cache_stats,
+    enable_cache,
+    enable_namespace_index,
+    invalidate_release,
+)
 
 from helm_inspect.integrations.slack import post_slack_message
 
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = setup_logger()
 
@@ -43,16 +97,42 @@ def check_prerequisites():
         sys.exit(1)
 
 
-def parse_args():
+def parse_args(argv: Optional[List[str]] = None):
     """
     Parse command line arguments.
 
+    The first argument may name a subcommand (`show`, `scan`, `merge`, `prune`, `serve`); otherwise the
+    arguments are parsed for a drift check.
+
+    Args:
+        argv (List[str], optional): Arguments to parse, defaults to `sys.argv[1:]`.
+
     Returns:
         argparse.Namespace: Parsed arguments.
     """
 
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv and argv[0] == "show":
+        return parse_show_args(argv[1:])
+
+    if argv and argv[0] == "scan":
+        return parse_scan_args(argv[1:])
+
+    if argv and argv[0] == "merge":
+        return parse_merge_args(argv[1:])
+
+    if argv and argv[0] == "prune":
+        return parse_prune_args(argv[1:])
+
+    if argv and argv[0] == "serve":
+        return parse_serve_args(argv[1:])
+
     parser = argparse.ArgumentParser(
-        description="HelmInspect - Detect drift between Helm and Kubernetes"
+        description="HelmInspect - Detect drift between Helm and Kubernetes",
+        epilog="Use 'helm-inspect show --help' to render diffs on demand, "
+        "'helm-inspect scan --help' to scan many releases and "
+        "'helm-inspect merge --help' to combine sharded scans.",
     )
 
     parser.add_argument("-r", "--release", required=True, help="Helm release name")
@@ -65,6 +145,12 @@ def parse_args():
         help="Calibrate HelmInspect to capture system-generated keys after a fresh Helm installation",
     )
 
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="With --calibrate, recalibrate every resource instead of only those changed since the last calibration",
+    )
+
     parser.add_argument(
         "-I",
         "--no-ignore",
@@ -88,7 +174,451 @@ def parse_args():
         "--slack-token", help="Slack bot token (or set HI_SLACK_BOT_TOKEN env var)"
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--diff",
+        action="store_true",
+        help="Render and log the unified diff of every drifting resource during the check",
+    )
+
+    parser.add_argument(
+        "-q",
+        "--summary-only",
+        action="store_true",
+        help="Only print warnings, drifting resources and the final summary (for cron and fleet runs)",
+    )
+
+    parser.add_argument(
+        "--structured-values",
+        action="store_true",
+        help="Parse ConfigMap/Secret values holding JSON or YAML and compare them key by key",
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first drifting resource and exit with status 1 when drift is found (for CI gating)",
+    )
+
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Compare only images, replicas, env, resources and Service ports, and the full specs when they drift or every HI_QUICK_FULL_INTERVAL seconds",
+    )
+
+    parser.add_argument(
+        "--server-dry-run",
+        action="store_true",
+        help="Default the Helm manifest on the API server (kubectl create --dry-run=server) before comparing, instead of using calibration data",
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=duration_type,
+        help="Overall time limit of the run (e.g. 120, 5m) after which in-flight cluster calls are cancelled",
+    )
+
+    parser.add_argument(
+        "--event-log",
+        metavar="PATH",
+        default=HI_EVENT_LOG,
+        help="Write one JSON event per checked resource to a file, '-' for stderr (or set HI_EVENT_LOG env var)",
+    )
+
+    parser.add_argument(
+        "--snapshot",
+        metavar="PATH",
+        help="Record every Helm manifest and live object fetched during the run to an archive (.tar.zst, .tar.gz, .tar.xz)",
+    )
+
+    parser.add_argument(
+        "--snapshot-secrets",
+        action="store_true",
+        help="Keep Secret values in plain text in the --snapshot archive instead of their keyed digests",
+    )
+
+    parser.add_argument(
+        "--from-snapshot",
+        metavar="PATH",
+        help="Run offline, serving Helm manifests and live objects from a snapshot archive",
+    )
+
+    args = parser.parse_args(argv)
+    args.command = "check"
+    return args
+
+
+def parse_show_args(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse command line arguments of the `show` subcommand.
+
+    Args:
+        argv (List[str]): Arguments following the subcommand name.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="helm-inspect show",
+        description="HelmInspect - Render the drift diff of release resources on demand",
+    )
+
+    parser.add_argument("-r", "--release", required=True, help="Helm release name")
+    parser.add_argument("-n", "--namespace", required=True, help="Kubernetes namespace")
+
+    parser.add_argument(
+        "-R",
+        "--resource",
+        action="append",
+        help="Resource to render as Kind/name (repeatable). Defaults to every drifting resource of the last check",
+    )
+
+    parser.add_argument(
+        "-I",
+        "--no-ignore",
+        action="store_true",
+        help="Disable key ignoring for strict drift detection (shows all differences including system-generated keys)",
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging (debug mode).",
+    )
+
+    parser.add_argument(
+        "--structured-values",
+        action="store_true",
+        help="Parse ConfigMap/Secret values holding JSON or YAML and compare them key by key",
+    )
+
+    parser.add_argument(
+        "--from-snapshot",
+        metavar="PATH",
+        help="Run offline, serving Helm manifests and live objects from a snapshot archive",
+    )
+
+    args = parser.parse_args(argv)
+    args.command = "show"
+
+    for resource in args.resource or []:
+        if resource.count("/") != 1 or not all(resource.split("/")):
+            parser.error(f"Invalid resource `{resource}`, expected Kind/name.")
+
+    return args
+
+
+def parse_scan_args(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse command line arguments of the `scan` subcommand.
+
+    Args:
+        argv (List[str]): Arguments following the subcommand name.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="helm-inspect scan",
+        description="HelmInspect - Detect drift across all Helm releases of a namespace or cluster",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--namespace",
+        help="Kubernetes namespace to scan (defaults to all namespaces)",
+    )
+
+    parser.add_argument(
+        "--deadline",
+        type=duration_type,
+        help="Time budget (e.g. 900, 15m, 1h) after which no new release is started",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of releases scanned concurrently (default: 4)",
+    )
+
+    def shard(value: str) -> tuple:
+        try:
+            return parse_shard(value)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+
+    parser.add_argument(
+        "--shard",
+        type=shard,
+        metavar="i/N",
+        help="Only scan the releases assigned to shard i of N (zero-based), for running the scan across several machines",
+    )
+
+    parser.add_argument(
+        "-I",
+        "--no-ignore",
+        action="store_true",
+        help="Disable key ignoring for strict drift detection (shows all differences including system-generated keys)",
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging (debug mode).",
+    )
+
+    parser.add_argument(
+        "-q",
+        "--summary-only",
+        action="store_true",
+        help="Only print warnings, drifting resources and the final summary",
+    )
+
+    parser.add_argument(
+        "--structured-values",
+        action="store_true",
+        help="Parse ConfigMap/Secret values holding JSON or YAML and compare them key by key",
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Cancel the scan at the first drifting release and exit with status 1 (for CI gating)",
+    )
+
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Compare only images, replicas, env, resources and Service ports of each release, and the full specs when they drift or every HI_QUICK_FULL_INTERVAL seconds",
+    )
+
+    parser.add_argument(
+        "--server-dry-run",
+        action="store_true",
+        help="Default each Helm manifest on the API server (kubectl create --dry-run=server) before comparing, instead of using calibration data",
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=duration_type,
+        help="Overall time limit of the run (e.g. 900, 15m) after which in-flight cluster calls are cancelled and the run fails",
+    )
+
+    parser.add_argument(
+        "--event-log",
+        metavar="PATH",
+        default=HI_EVENT_LOG,
+        help="Write one JSON event per checked resource to a file, '-' for stderr (or set HI_EVENT_LOG env var)",
+    )
+
+    parser.add_argument(
+        "--snapshot",
+        metavar="PATH",
+        help="Record every Helm manifest and live object fetched during the run to an archive (.tar.zst, .tar.gz, .tar.xz)",
+    )
+
+    parser.add_argument(
+        "--snapshot-secrets",
+        action="store_true",
+        help="Keep Secret values in plain text in the --snapshot archive instead of their keyed digests",
+    )
+
+    parser.add_argument(
+        "--from-snapshot",
+        metavar="PATH",
+        help="Run offline, serving Helm manifests and live objects from a snapshot archive",
+    )
+
+    args = parser.parse_args(argv)
+    args.command = "scan"
+    return args
+
+
+def parse_merge_args(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse command line arguments of the `merge` subcommand.
+
+    Args:
+        argv (List[str]): Arguments following the subcommand name.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="helm-inspect merge",
+        description="HelmInspect - Combine the fleet summaries of sharded scans into one report",
+    )
+
+    parser.add_argument(
+        "--cluster",
+        help="Only merge the summaries of this cluster (defaults to all clusters)",
+    )
+
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="PATH",
+        help="Path of the merged report (defaults to fleet_report.json in the drift directory)",
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging (debug mode).",
+    )
+
+    args = parser.parse_args(argv)
+    args.command = "merge"
+    return args
+
+
+def parse_prune_args(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse command line arguments of the `prune` subcommand.
+
+    Args:
+        argv (List[str]): Arguments following the subcommand name.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="helm-inspect prune",
+        description="HelmInspect - Remove old drift reports, fleet summaries and scan states",
+    )
+
+    def days(value: str) -> float:
+        value = value.strip()
+        try:
+            return (
+                parse_duration(value if value[-1:].isalpha() else f"{value}d") / 86400
+            )
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+
+    parser.add_argument(
+        "--older-than",
+        type=days,
+        default=RETENTION_DAYS,
+        metavar="AGE",
+        help="Remove files not modified for this long (e.g. 30d, 12h, plain numbers are days; defaults to HI_RETENTION_DAYS)",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only list the files that would be removed",
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging (debug mode).",
+    )
+
+    args = parser.parse_args(argv)
+    args.command = "prune"
+    if args.older_than is None:
+        parser.error("--older-than is required (or set HI_RETENTION_DAYS)")
+    return args
+
+
+def parse_serve_args(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse command line arguments of the `serve` subcommand.
+
+    Args:
+        argv (List[str]): Arguments following the subcommand name.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="helm-inspect serve",
+        description="HelmInspect - Serve drift results over HTTP from a long-lived process",
+    )
+
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to listen on (default: 127.0.0.1)",
+    )
+
+    parser.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        default=8080,
+        help="Port to listen on (default: 8080)",
+    )
+
+    parser.add_argument(
+        "-n",
+        "--namespace",
+        help="Kubernetes namespace of periodic scans (defaults to all namespaces)",
+    )
+
+    parser.add_argument(
+        "--interval",
+        type=duration_type,
+        help="Scan all releases periodically (e.g. 15m, 1h); scans are only run on request when not set",
+    )
+
+    parser.add_argument(
+        "--cache-ttl",
+        type=duration_type,
+        default=30,
+        help="How long live objects are cached (default: 30s)",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of releases scanned concurrently (default: 4)",
+    )
+
+    parser.add_argument(
+        "-I",
+        "--no-ignore",
+        action="store_true",
+        help="Disable key ignoring for strict drift detection (shows all differences including system-generated keys)",
+    )
+
+    parser.add_argument(
+        "--structured-values",
+        action="store_true",
+        help="Parse ConfigMap/Secret values holding JSON or YAML and compare them key by key",
+    )
+
+    parser.add_argument(
+        "--event-log",
+        metavar="PATH",
+        default=HI_EVENT_LOG,
+        help="Write one JSON event per checked resource to a file, '-' for stderr (or set HI_EVENT_LOG env var)",
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging (debug mode).",
+    )
+
+    args = parser.parse_args(argv)
+    args.command = "serve"
+    return args
 
 
 def validate_args(args: argparse.Namespace) -> None:
@@ -99,12 +629,40 @@ def validate_args(args: argparse.Namespace) -> None:
         args (argparse.Namespace): Parsed arguments.
     """
 
+    if getattr(args, "snapshot", None) and args.from_snapshot:
+        logger.error(
+            "❌ Cannot use --snapshot with --from-snapshot. Please use only one of these flags."
+        )
+        sys.exit(1)
+
+    if getattr(args, "snapshot_secrets", False) and not args.snapshot:
+        logger.error("❌ --snapshot-secrets requires --snapshot.")
+        sys.exit(1)
+
+    if args.command in ("scan", "serve") and args.workers < 1:
+        logger.error("❌ --workers must be at least 1.")
+        sys.exit(1)
+
+    if args.command != "check":
+        return
+
     if args.no_ignore and args.calibrate:
         logger.error(
             "❌ Cannot use --no-ignore with --calibrate. Please use only one of these flags."
         )
         sys.exit(1)
 
+    if args.full and not args.calibrate:
+        logger.error("❌ --full can only be used with --calibrate.")
+        sys.exit(1)
+
+    if (args.quick or args.server_dry_run) and args.calibrate:
+        logger.error(
+            f"❌ Cannot use {'--quick' if args.quick else '--server-dry-run'} with --calibrate. "
+            "Please use only one of these flags."
+        )
+        sys.exit(1)
+
     if (args.slack_token and not args.slack_channel) or (
         args.slack_channel and not args.slack_token
     ):
@@ -114,6 +672,78 @@ def validate_args(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def resolve_ignorable_keys(
+    release: str,
+    namespace: str,
+    cluster_name: str,
+    no_ignore: bool,
+    helm_manifest: Optional[List[Dict[str, Any]]] = None,
+    revision: Optional[int] = None,
+    chart: Optional[str] = None,
+    server_defaults: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None,
+) -> Optional[List[str]]:
+    """
+    Resolve the keys to ignore for a release from its calibration data.
+
+    With the current manifest, calibration data made stale by an upgrade is
+    refreshed first; see `refresh_calibration`. Releases without calibration
+    data use the profile of their chart, when another release of the chart
+    was calibrated; see `save_chart_profile`. With `server_defaults`, the
+    keys still apply to the objects left out of the dry run (e.g. Ingresses);
+    see `get_server_defaults`.
+
+    Args:
+        release (str): Helm release name.
+        namespace (str): Kubernetes namespace.
+        cluster_name (str): Kubernetes cluster name.
+        no_ignore (bool): Flag to disable key ignoring for strict drift detection.
+        helm_manifest (List[Dict[str, Any]], optional): The current Helm manifest.
+        revision (int, optional): The current Helm revision, when known.
+        chart (str, optional): The chart name and version, read from the
+            manifest labels when not provided.
+        server_defaults (Dict[Tuple[str, str], Dict[str, Any]], optional): The
+            manifest objects defaulted by a server-side dry run.
+
+    Returns:
+        List[str] or None: The ignorable keys, None for a strict comparison.
+    """
+
+    if no_ignore:
+        logger.info("✨ Proceeding without ignoring any keys.\n\n")
+        return None
+
+    if server_defaults is not None:
+        logger.info("✨ Comparing against server-side defaults (dry run).\n\n")
+
+    calibration_data = get_calibration_file(release, namespace, cluster_name)
+
+    if calibration_data and helm_manifest is not None:
+        calibration_data = refresh_calibration(
+            calibration_data, release, namespace, cluster_name, helm_manifest, revision
+        )
+
+    if calibration_data:
+        logger.info("✨ Using existing calibration data.\n\n")
+        return calibration_data["ignorable_keys"]
+
+    chart = chart or get_chart(helm_manifest or [])
+    profile = get_chart_profile(chart, cluster_name) if chart else None
+    if profile:
+        logger.info(f"✨ Using the calibration profile of chart `{chart}`.\n\n")
+        return get_profile_ignorable_keys(profile, release)
+
+    if server_defaults is not None:
+        return []
+
+    logger.info(
+        "✨ No calibration data found, ignoring Kubernetes defaults only.\n"
+        "  • Fields set by controllers or webhooks will be reported as drift.\n"
+        f"  • Run 'helm-inspect --calibrate --release {release} --namespace {namespace}'\n"
+        "    after a fresh Helm installation to ignore them as well.\n\n"
+    )
+    return []
+
+
 def detect_drift(
     release: str,
     namespace: str,
@@ -121,7 +751,13 @@ def detect_drift(
     no_ignore: bool,
     slack_channel: Optional[str] = None,
     slack_token: Optional[str] = None,
-) -> None:
+    render_diff: bool = False,
+    summary_only: bool = False,
+    structured_values: bool = False,
+    fail_fast: bool = False,
+    quick: bool = False,
+    server_dry_run: bool = False,
+) -> dict:
     """
     Detect drift between Helm and Kubernetes.
 
@@ -132,48 +768,69 @@ def detect_drift(
         no_ignore (bool): Flag to disable key ignoring for strict drift detection.
         slack_channel (str, optional): Slack channel to post drift detection results.
         slack_token (str, optional): Slack bot token.
-    """
-
-    calibration_data = get_calibration_file(release, namespace, cluster_name)
+        render_diff (bool): Flag to render the unified diff of drifting resources.
+        summary_only (bool): Flag to only print warnings, drifts and the summary.
+        structured_values (bool): Flag to compare JSON/YAML string values structurally.
+        fail_fast (bool): Flag to stop at the first drifted or missing resource.
+        quick (bool): Flag to compare the full specs only when the quick tier
+            flags drift; see `check_drift_quick`.
+        server_dry_run (bool): Flag to compare against the manifest defaulted by
+            the API server; see `get_server_defaults`.
 
-    if calibration_data:
-        try:
-            calibration_date = datetime.fromisoformat(calibration_data["date"])
-            days_old = (datetime.utcnow() - calibration_date).days
-            if days_old > 30:
-                logger.warning(
-                    f"⚠️ Calibration data is {days_old} days old. Consider recalibrating.\n"
-                )
-        except (KeyError, ValueError):
-            logger.error("❌ Invalid calibration data format. Consider recalibrating.")
+    Returns:
+        dict: The drift data.
+    """
 
-    no_cal_file = False
+    scan_level = logging.WARNING if summary_only else logging.NOTSET
 
-    if no_ignore:
-        logger.info("✨ Proceeding without ignoring any keys.\n\n")
-        ignorable_keys: Optional[list] = None
-    elif calibration_data:
-        logger.info("✨ Using existing calibration data.\n\n")
-        ignorable_keys = calibration_data["ignorable_keys"]
-    else:
-        logger.warning(
-            "⚠️ No calibration data found!\n"
-            "  • Using default ignorable keys which may not be accurate.\n"
-            f"  • Run 'helm-inspect --calibrate --release {release} --namespace {namespace}'\n"
-            "    immediately after a fresh Helm installation for accurate drift detection.\n\n"
+    with console_level(scan_level):
+        helm_manifest = get_helm_manifest(release, namespace)
+        server_defaults = (
+            get_server_defaults(helm_manifest, namespace) if server_dry_run else None
         )
-        no_cal_file = True
-        ignorable_keys = IGNORABLE_KEYS.copy()
+        ignorable_keys = resolve_ignorable_keys(
+            release,
+            namespace,
+            cluster_name,
+            no_ignore,
+            helm_manifest,
+            server_defaults=server_defaults,
+        )
+        if quick:
+            drift_meta = check_drift_quick(
+                release,
+                namespace,
+                ignorable_keys,
+                helm_manifest=helm_manifest,
+                previous=get_drift_data(release, namespace, cluster_name),
+                revision=get_helm_revision(release, namespace),
+                render_diff=render_diff,
+                structured_values=structured_values,
+                fail_fast=fail_fast,
+                server_defaults=server_defaults,
+            )
+        else:
+            drift_meta = check_drift(
+                release,
+                namespace,
+                ignorable_keys,
+                render_diff=render_diff,
+                helm_manifest=helm_manifest,
+                structured_values=structured_values,
+                fail_fast=fail_fast,
+                server_defaults=server_defaults,
+            )
+        save_drift_data(drift_meta, release, namespace, cluster_name)
 
-    drift_meta = check_drift(release, namespace, ignorable_keys, no_cal_file)
-    drift_file = (
-        Path.home()
-        / ".helminspect"
-        / "drift"
-        / f"drift_{release}_{namespace}_{cluster_name}.json"
+    drift_file = get_drift_file_path(release, namespace, cluster_name)
+    unchecked = drift_meta["drift_summary"].get("unchecked_resources", 0)
+    unchecked_line = (
+        f" • Unchecked Resources: {unchecked} (API server throttling or unavailable)\n\n"
+        if unchecked
+        else ""
     )
-
-    save_drift_data(drift_meta, release, namespace, cluster_name)
+    if drift_meta.get("stopped_early"):
+        unchecked_line += " • Stopped at the first drifting resource (--fail-fast)\n\n"
 
     logger.info("✨ Drift detection completed.")
     logger.info(
@@ -189,6 +846,7 @@ def detect_drift(
         f"   | Missing Keys        | {drift_meta['drift_summary']['removed_keys']: <22}|\n"
         f"   | Changed Keys        | {drift_meta['drift_summary']['modified_keys']: <22}|\n"
         f"   +---------------------+-----------------------+\n\n"
+        f"{unchecked_line}"
         f"  • Drift Report File: {drift_file}\n"
     )
 
@@ -199,3 +857,300 @@ def detect_drift(
         post_slack_message(
             drift_meta, release, namespace, cluster_name, slack_channel, slack_token
         )
+
+    return drift_meta
+
+
+def show_resource_drift(
+    release: str,
+    namespace: str,
+    cluster_name: str,
+    resources: Optional[List[str]] = None,
+    no_ignore: bool = False,
+    structured_values: bool = False,
+) -> None:
+    """
+    Render the unified diff of release resources on demand.
+
+    Args:
+        release (str): Helm release name.
+        namespace (str): Kubernetes namespace.
+        cluster_name (str): Kubernetes cluster name.
+        resources (List[str], optional): Resources as Kind/name, defaults to every
+            drifting resource recorded by the last drift check.
+        no_ignore (bool): Flag to disable key ignoring for strict drift detection.
+        structured_values (bool): Flag to compare JSON/YAML string values structurally.
+    """
+
+    if resources:
+        targets = [tuple(resource.split("/", 1)) for resource in resources]
+    else:
+        drift_data = get_drift_data(release, namespace, cluster_name)
+        if not drift_data:
+            logger.error(
+                "❌ No drift data found. Run a drift check first or pass --resource."
+            )
+            return
+
+        targets = list(
+            dict.fromkeys(
+                (report["kind"], report["name"])
+                for report in drift_data.get("drift_reports", [])
+            )
+        )
+        if not targets:
+            logger.info("✅ No drifting resources in the last drift check.")
+            return
+
+    ignorable_keys = resolve_ignorable_keys(release, namespace, cluster_name, no_ignore)
+    show_drift(
+        release,
+        namespace,
+        targets,
+        ignorable_keys,
+        structured_values=structured_values,
+    )
+
+
+def detect_fleet_drift(
+    namespace: Optional[str],
+    cluster_name: str,
+    no_ignore: bool = False,
+    deadline: Optional[float] = None,
+    workers: int = 4,
+    summary_only: bool = False,
+    structured_values: bool = False,
+    shard: Optional[tuple] = None,
+    on_complete: Optional[Callable[[Dict[str, Any]], None]] = None,
+    fail_fast: bool = False,
+    quick: bool = False,
+    server_dry_run: bool = False,
+) -> dict:
+    """
+    Detect drift across all Helm releases of a namespace or cluster.
+
+    Releases are scanned in priority order within the time budget; see
+    `prioritize_releases` and `run_scheduled_scan`. With a shard, only the
+    releases assigned to it are scanned; see `assign_shard`. Live objects are
+    served from one listing per kind and namespace; see `NamespaceIndex`.
+    With `HI_CACHE_DISK`, manifests of known revisions are reused across
+    scans; see `BoundedCache`.
+    The most drifting keys and resources are counted as releases complete;
+    see `DriftAggregator`.
+
+    Args:
+        namespace (str, optional): Kubernetes namespace, defaults to all namespaces.
+        cluster_name (str): Kubernetes cluster name.
+        no_ignore (bool): Flag to disable key ignoring for strict drift detection.
+        deadline (float, optional): Time budget in seconds.
+        workers (int): Number of releases scanned concurrently.
+        summary_only (bool): Flag to only print warnings, drifts and the summary.
+        structured_values (bool): Flag to compare JSON/YAML string values structurally.
+        shard (tuple, optional): The shard index and count.
+        on_complete (Callable[[Dict[str, Any]], None], optional): Called with the
+            outcome (release and drift data) of every completed release.
+        fail_fast (bool): Flag to cancel the scan at the first drifting release.
+        quick (bool): Flag to compare the full specs of a release only when the
+            quick tier flags drift; see `check_drift_quick`.
+        server_dry_run (bool): Flag to compare each release against its manifest
+            defaulted by the API server; see `get_server_defaults`.
+
+    Returns:
+        dict: The fleet summary.
+    """
+
+    started = datetime.utcnow()
+    enable_namespace_index(NAMESPACE_CACHE_TTL, NAMESPACE_CACHE_MAX_BYTES)
+    if CACHE_DISK:
+        enable_cache("manifests", disk=True)
+    state = get_scan_state(cluster_name, shard)
+    releases = prioritize_releases(
+        select_shard(list_helm_releases(namespace), cluster_name, shard), state
+    )
+
+    hot_spots = DriftAggregator()
+
+    logger.info(
+        f"🔍 Scanning {len(releases)} release(s)"
+        + (f" of shard {shard[0]}/{shard[1]}" if shard else "")
+        + f" with {workers} worker(s)"
+        + (f" and a {deadline:g}s deadline.\n" if deadline else ".\n")
+    )
+
+    def scan_release(release: Dict[str, Any]) -> dict:
+        if release.get("revision") is not None:
+            invalidate_release(
+                release["namespace"], release["name"], release["revision"]
+            )
+        helm_manifest = release.get("manifest")
+        if helm_manifest is None:
+            helm_manifest = get_helm_manifest(
+                release["name"], release["namespace"], release.get("revision")
+            )
+        release["resources"] = len(helm_manifest)
+
+        server_defaults = (
+            get_server_defaults(helm_manifest, release["namespace"])
+            if server_dry_run
+            else None
+        )
+        ignorable_keys = resolve_ignorable_keys(
+            release["name"],
+            release["namespace"],
+            cluster_name,
+            no_ignore,
+            helm_manifest,
+            release.get("revision"),
+            release.get("chart"),
+            server_defaults,
+        )
+        if quick:
+            drift_meta = check_drift_quick(
+                release["name"],
+                release["namespace"],
+                ignorable_keys,
+                helm_manifest=helm_manifest,
+                previous=get_drift_data(
+                    release["name"], release["namespace"], cluster_name
+                ),
+                revision=release.get("revision"),
+                structured_values=structured_values,
+                fail_fast=fail_fast,
+                server_defaults=server_defaults,
+            )
+        else:
+            drift_meta = check_drift(
+                release["name"],
+                release["namespace"],
+                ignorable_keys,
+                helm_manifest=helm_manifest,
+                structured_values=structured_values,
+                fail_fast=fail_fast,
+                server_defaults=server_defaults,
+            )
+        hot_spots.add(drift_meta["drift_reports"], cluster_name, release["namespace"])
+        return drift_meta
+
+    with console_level(logging.WARNING if summary_only else logging.NOTSET):
+        outcomes = run_scheduled_scan(
+            releases, scan_release, deadline, workers, fail_fast
+        )
+
+        for outcome in outcomes:
+            if outcome["status"] == "complete":
+                save_drift_data(
+                    outcome["drift_meta"],
+                    outcome["name"],
+                    outcome["namespace"],
+                    cluster_name,
+                )
+                if on_complete:
+                    on_complete(outcome)
+
+        save_scan_state(
+            update_scan_state(state, outcomes, started.isoformat()),
+            cluster_name,
+            shard,
+        )
+
+    fleet_summary = build_fleet_summary(
+        outcomes, cluster_name, started, shard, hot_spots.summary(HOT_KEYS_TOP)
+    )
+    save_fleet_summary(fleet_summary, cluster_name, shard)
+    logger.debug(f"Cache statistics: {cache_stats()}")
+
+    if RETENTION_DAYS is not None:
+        pruned = prune_saved_files(RETENTION_DAYS)
+        if pruned:
+            logger.info(
+                f"🧹 Pruned {len(pruned)} file(s) older than {RETENTION_DAYS:g} days."
+            )
+
+    summary = fleet_summary["summary"]
+    logger.info(
+        "-----\n\n✨Fleet Drift Summary✨\n\n"
+        f" • Cluster: {cluster_name}\n"
+        f" • Namespace: {namespace or 'all'}\n"
+        f" • Shard: {fleet_summary['shard'] or 'all'}\n\n"
+        f" • Releases: {summary['releases']}\n"
+        f"   +---------------------+-----------------------+\n"
+        f"   | Status              | Count                 |\n"
+        f"   +---------------------+-----------------------+\n"
+        f"   | Complete            | {summary['complete']: <22}|\n"
+        f"   | Drifting            | {summary['drifting_releases']: <22}|\n"
+        f"   | Failed              | {summary['failed']: <22}|\n"
+        f"   | Incomplete          | {summary['incomplete']: <22}|\n"
+        f"   | Skipped             | {summary['skipped']: <22}|\n"
+        f"   +---------------------+-----------------------+\n\n"
+        f" • Drifts: {summary['total_drifts']}\n\n"
+        f"{format_hot_spots(fleet_summary['hot_spots'])}"
+    )
+
+    return fleet_summary
+
+
+def merge_fleet_reports(cluster: Optional[str] = None, output: Optional[str] = None):
+    """
+    Combine the fleet summaries of sharded scans into one fleet report.
+
+    Args:
+        cluster (str, optional): Only merge the summaries of this cluster.
+        output (str, optional): Path of the merged report.
+
+    Returns:
+        dict: The fleet report.
+    """
+
+    summaries = get_fleet_summaries(cluster)
+    if not summaries:
+        logger.error("❌ No fleet summary found. Run 'helm-inspect scan' first.")
+        sys.exit(1)
+
+    report = merge_fleet_summaries(summaries)
+    report_file = save_fleet_report(report, output)
+
+    summary = report["summary"]
+    logger.info(
+        "-----\n\n✨Fleet Report✨\n\n"
+        f" • Summaries merged: {len(summaries)}\n"
+        f" • Clusters: {summary['clusters']}\n\n"
+        f" • Releases: {summary['releases']}\n"
+        f"   +---------------------+-----------------------+\n"
+        f"   | Status              | Count                 |\n"
+        f"   +---------------------+-----------------------+\n"
+        f"   | Complete            | {summary['complete']: <22}|\n"
+        f"   | Drifting            | {summary['drifting_releases']: <22}|\n"
+        f"   | Failed              | {summary['failed']: <22}|\n"
+        f"   | Incomplete          | {summary['incomplete']: <22}|\n"
+        f"   | Skipped             | {summary['skipped']: <22}|\n"
+        f"   +---------------------+-----------------------+\n\n"
+        f" • Drifts: {summary['total_drifts']}\n\n"
+        f"{format_hot_spots(report['hot_spots'])}"
+        f" • Report: {report_file}\n"
+    )
+
+    return report
+
+
+def prune_files(
+    older_than: Optional[float] = None,
+    dry_run: bool = False,
+):
+    """
+    Remove old drift reports, fleet summaries and scan states.
+
+    Args:
+        older_than (float, optional): Remove files not modified for this many days.
+        dry_run (bool): Only list the files that would be removed.
+
+    Returns:
+        List[Path]: The removed files.
+    """
+
+    removed = prune_saved_files(older_than, dry_run)
+
+    for path in removed:
+        logger.info(f"{'Would remove' if dry_run else 'Removed'} {path}")
+    logger.info(f"🧹 {len(removed)} file(s) {'would be ' if dry_run else ''}removed.\n")
+
+    return removed
@@ -6,42 +6,223 @@
 
 """
 
+import base64
+import copy
+import gzip
 import json
+import os
+import queue
+import random
 import subprocess
+import tempfile
+import threading
+import time
 import yaml
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import quote
 
+from helm_inspect.utils import codec
+from helm_inspect.utils.cache import MISSING, get_cache, invalidate_release
+from helm_inspect.utils.constant import (
+    CLUSTER_CALL_TIMEOUT,
+    CLUSTER_HEDGE,
+    CLUSTER_MAX_RETRIES,
+    HELM_STORAGE_KINDS,
+    HI_HELM_STORAGE,
+    KIND_API_PATHS,
+    LIST_PAGE_SIZE,
+    TMP_DIR,
+)
+from helm_inspect.utils.credentials import with_credentials
+from helm_inspect.utils.flatten import get_field
+from helm_inspect.utils.limiter import (
+    CANCELLED,
+    THROTTLED,
+    UNAVAILABLE,
+    CancelToken,
+    ClusterError,
+    classify_failure,
+    cluster_latency,
+    cluster_limiter,
+    current_cancel_token,
+)
 from helm_inspect.utils.logger import setup_logger
+from helm_inspect.utils.snapshot import get_active_snapshot
 
 logger = setup_logger()
 
 
-def run_command(command: List[str]) -> str:
+_processes: Set[subprocess.Popen] = set()
+_processes_lock = threading.Lock()
+
+CANCEL_POLL_INTERVAL = 0.2
+"""
+Seconds between two checks for cancellation while a call is in flight.
+"""
+
+
+def _spawn(command: List[str], results: "queue.Queue[tuple]") -> subprocess.Popen:
+    """
+    Start a command, posting its output to a queue once it exits.
+
+    Args:
+        command (List[str]): The command to run.
+        results (queue.Queue): Receives `(process, stdout, stderr)`.
+
+    Returns:
+        subprocess.Popen: The started process.
+    """
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    with _processes_lock:
+        _processes.add(process)
+
+    def wait() -> None:
+        stdout, stderr = process.communicate()
+        results.put((process, stdout, stderr.decode("utf-8", "replace")))
+
+    threading.Thread(target=wait, daemon=True).start()
+    return process
+
+
+def _kill(processes: List[subprocess.Popen]) -> None:
+    for process in processes:
+        if process.poll() is None:
+            process.kill()
+    with _processes_lock:
+        _processes.difference_update(processes)
+
+
+def _execute(
+    command: List[str], timeout: float, hedge: bool, cancel: CancelToken
+) -> Tuple[int, bytes, str]:
+    """
+    Run a command once, with a timeout, cancellation and an optional hedge.
+
+    When hedging, a duplicate of the command is started once the call runs
+    longer than the 95th percentile of recent calls (and the limiter has a
+    free slot); the first one to exit wins and the other is killed.
+
+    Args:
+        command (List[str]): The command to run.
+        timeout (float): Seconds after which the call is killed.
+        hedge (bool): Whether a slow call may be duplicated.
+        cancel (CancelToken): The cancellation of the run the call belongs to.
+
+    Returns:
+        Tuple[int, bytes, str]: The exit code, standard output and error output.
+
+    Raises:
+        ClusterError: If the calls of the run were cancelled.
+    """
+
+    results: "queue.Queue[tuple]" = queue.Queue()
+    started = time.monotonic()
+    deadline = started + timeout
+    hedge_after = cluster_latency.percentile(0.95) if hedge else None
+    processes = [_spawn(command, results)]
+    hedge_started = None
+
+    try:
+        while True:
+            cancel.check()
+            now = time.monotonic()
+            if now >= deadline:
+                return -1, b"", f"Call timed out after {timeout:g}s"
+
+            wait = min(deadline - now, CANCEL_POLL_INTERVAL)
+            if hedge_after is not None:
+                wait = max(0.0, min(wait, started + hedge_after - now))
+
+            try:
+                process, stdout, stderr = results.get(timeout=wait)
+                return process.returncode, stdout, stderr
+            except queue.Empty:
+                pass
+
+            if hedge_after is not None and time.monotonic() >= started + hedge_after:
+                hedge_after = None
+                if cluster_limiter.try_acquire():
+                    hedge_started = time.monotonic()
+                    logger.debug(f"Hedging slow cluster call: {' '.join(command)}")
+                    processes.append(_spawn(command, results))
+    finally:
+        _kill(processes)
+        if hedge_started is not None:
+            cluster_limiter.release(time.monotonic() - hedge_started)
+
+
+def run_command(
+    command: List[str],
+    timeout: float = CLUSTER_CALL_TIMEOUT,
+    hedge: bool = CLUSTER_HEDGE,
+    raw: bool = False,
+    cancel: Optional[CancelToken] = None,
+) -> Union[str, bytes]:
     """
     Run a shell command and return its output.
 
+    Calls go through the shared adaptive concurrency limiter. Throttled,
+    unavailable or timed out calls are retried with exponential backoff;
+    other failures, including objects that do not exist, return an empty
+    output. Calls stop as soon as the run they belong to is cancelled. Calls
+    reuse the cached exec plugin credential (see `with_credentials`).
+
     Args:
         command (List[str]): The command to run as a list of strings.
+        timeout (float): Seconds after which a single attempt is killed.
+        hedge (bool): Whether a duplicate is started for slow calls. Only
+            safe for read-only commands.
+        raw (bool): Whether the output is returned as bytes, e.g. for JSON
+            parsed by `codec.loads`.
+        cancel (CancelToken, optional): The cancellation of the run, that of
+            the current thread when not provided (see `cancel_scope`).
 
     Returns:
-        str: The standard output from the command.
+        str or bytes: The standard output from the command.
 
     Raises:
-        subprocess.CalledProcessError: If the command returns a non-zero exit status.
+        ClusterError: If the call is still throttled or unavailable after
+            retries, or if the calls of the run were cancelled.
     """
 
-    try:
-        valid_commands = ["kubectl", "helm"]
+    valid_commands = ["kubectl", "helm"]
+
+    if not any(cmd in command[0] for cmd in valid_commands):
+        raise ValueError(f"Invalid command: {command[0]}")
 
-        if not any(cmd in command[0] for cmd in valid_commands):
-            raise ValueError(f"Invalid command: {command[0]}")
+    cancel = cancel or current_cancel_token()
+    for attempt in range(CLUSTER_MAX_RETRIES + 1):
+        cancel.check()
+        with cluster_limiter.slot() as feedback:
+            started = time.monotonic()
+            returncode, stdout, stderr = _execute(
+                with_credentials(command), timeout, hedge, cancel
+            )
+            if returncode == 0:
+                cluster_latency.record(time.monotonic() - started)
+                return stdout if raw else stdout.decode("utf-8", "replace")
+            stderr = stderr.strip()
+            reason = classify_failure(stderr)
+            feedback["overloaded"] = reason in (THROTTLED, UNAVAILABLE)
 
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Error running command: {' '.join(command)}")
-        logger.error(f"Output: {e.stderr.strip()}")
-        return ""
+        if reason not in (THROTTLED, UNAVAILABLE):
+            logger.error(f"Error running command: {' '.join(command)}")
+            logger.error(f"Output: {stderr}")
+            return b"" if raw else ""
+
+        if attempt < CLUSTER_MAX_RETRIES:
+            delay = min(30.0, 0.5 * 2**attempt) * random.uniform(0.5, 1.0)
+            logger.debug(
+                f"Cluster call {reason}, retrying in {delay:.1f}s: {' '.join(command)}"
+            )
+            cancel.sleep(delay)
+
+    raise ClusterError(
+        f"Cluster call {reason} after {CLUSTER_MAX_RETRIES} retries: "
+        f"{' '.join(command)}: {stderr}",
+        reason,
+    )
 
 
 def get_cluster_name() -> str:
@@ -52,32 +233,314 @@ def get_cluster_name() -> str:
         str: The name of the current Kubernetes cluster or "unknown_cluster" if an error occurs.
     """
 
+    snapshot = get_active_snapshot()
+    if snapshot and snapshot.replaying:
+        return snapshot.cluster or "unknown_cluster"
+
     output = run_command(
         ["kubectl", "config", "view", "--minify", "-o", "jsonpath={.clusters[0].name}"]
     )
-    return output.strip() or "unknown_cluster"
+    cluster_name = output.strip() or "unknown_cluster"
+
+    if snapshot:
+        snapshot.cluster = cluster_name
+    return cluster_name
 
 
-def get_helm_manifest(release: str, namespace: str) -> List[Dict[str, Any]]:
+def get_helm_manifest(
+    release: str, namespace: str, revision: Optional[int] = None
+) -> List[Dict[str, Any]]:
     """
     Get the manifest of a Helm release.
 
     Args:
         release (str): The name of the Helm release.
         namespace (str): The namespace of the Helm release.
+        revision (int, optional): The release revision, when known. Manifests
+            of a known revision never change, so they stay in the cache; a
+            new revision invalidates what was cached for the release.
 
     Returns:
         List[Dict[str, Any]]: The manifest of the Helm release as a list of dictionaries.
     """
 
-    output = run_command(["helm", "get", "manifest", release, "-n", namespace])
+    snapshot = get_active_snapshot()
+    if snapshot and snapshot.replaying:
+        return parse_manifest(snapshot.get_manifest(release, namespace))
+
+    if revision is not None:
+        invalidate_release(namespace, release, revision)
+
+    cache = get_cache("manifests")
+    key = (namespace, release, revision)
+    if cache:
+        manifest = cache.get(key)
+        if manifest is not MISSING:
+            return manifest
+
+    size = None
+    if HI_HELM_STORAGE:
+        releases = get_helm_releases(namespace, HI_HELM_STORAGE, release)
+        manifest = releases.get((namespace, release), {}).get("manifest", [])
+    else:
+        output = run_command(["helm", "get", "manifest", release, "-n", namespace])
+        if snapshot:
+            snapshot.record_manifest(release, namespace, output)
+        manifest = parse_manifest(output)
+        size = len(output)
+
+    if cache and manifest:
+        cache.put(
+            key, manifest, ttl=None if revision is not None else MISSING, size=size
+        )
+    return manifest
+
+
+def parse_manifest(manifest: str) -> List[Dict[str, Any]]:
+    """
+    Parse a multi-document Helm manifest.
+
+    Args:
+        manifest (str): The manifest YAML.
+
+    Returns:
+        List[Dict[str, Any]]: The manifest as a list of dictionaries.
+    """
+
     try:
-        return list(yaml.safe_load_all(output)) if output else []
+        return list(yaml.safe_load_all(manifest)) if manifest else []
     except yaml.YAMLError:
         logger.error("Failed to parse Helm manifest YAML.")
         return []
 
 
+def decode_helm_release(payload: str, driver: str = "secret") -> Dict[str, Any]:
+    """
+    Decode a Helm release stored in a Secret or ConfigMap.
+
+    Helm stores releases as base64-encoded, gzipped JSON. Secret data is
+    base64-encoded once more by Kubernetes.
+
+    Args:
+        payload (str): The `release` value of the Secret or ConfigMap data.
+        driver (str): The Helm storage driver (`secret` or `configmap`).
+
+    Returns:
+        Dict[str, Any]: The decoded Helm release.
+    """
+
+    raw = base64.b64decode(payload)
+    if driver == "secret":
+        raw = base64.b64decode(raw)
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    return codec.loads(raw)
+
+
+def get_helm_releases(
+    namespace: Optional[str] = None,
+    driver: str = "secret",
+    release: Optional[str] = None,
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Get the deployed revision of many Helm releases with a single list call.
+
+    Reads the Helm storage objects (`sh.helm.release.v1.*`) directly instead of
+    forking `helm` once per release, and decodes the release payloads in-process.
+
+    Args:
+        namespace (str, optional): The namespace to list, defaults to all namespaces.
+        driver (str): The Helm storage driver (`secret` or `configmap`).
+        release (str, optional): Restrict the listing to a single release.
+
+    Returns:
+        Dict[Tuple[str, str], Dict[str, Any]]: Release information keyed by
+        (namespace, release), including its revision, chart and parsed manifest.
+    """
+
+    if driver not in HELM_STORAGE_KINDS:
+        raise ValueError(f"Unsupported Helm storage driver: {driver}")
+
+    snapshot = get_active_snapshot()
+    if snapshot and snapshot.replaying:
+        return {
+            key: {**info, "manifest": parse_manifest(snapshot.manifests.get(key, ""))}
+            for key, info in snapshot.releases.items()
+            if (not namespace or key[0] == namespace)
+            and (not release or key[1] == release)
+        }
+
+    selector = "owner=helm,status=deployed"
+    if release:
+        selector += f",name={release}"
+
+    command = ["kubectl", "get", HELM_STORAGE_KINDS[driver], "-l", selector]
+    command += ["-n", namespace] if namespace else ["--all-namespaces"]
+    output = run_command(command + ["-o", "json"], raw=True)
+
+    try:
+        items = codec.loads(output).get("items", []) if output else []
+    except json.JSONDecodeError:
+        logger.error("Failed to parse Helm release storage JSON.")
+        return {}
+
+    latest: Dict[Tuple[str, str], Tuple[int, Dict[str, Any]]] = {}
+    for item in items:
+        metadata = item.get("metadata", {})
+        labels = metadata.get("labels", {})
+        key = (metadata.get("namespace", namespace), labels.get("name"))
+        try:
+            revision = int(labels.get("version", 0))
+        except ValueError:
+            continue
+        if key[1] and (key not in latest or revision > latest[key][0]):
+            latest[key] = (revision, item)
+
+    releases = {}
+    for key, (revision, item) in latest.items():
+        try:
+            decoded = decode_helm_release(item["data"]["release"], driver)
+        except (KeyError, ValueError, OSError) as e:
+            logger.error(f"Failed to decode Helm release `{key[1]}`: {e}")
+            continue
+
+        chart_metadata = decoded.get("chart", {}).get("metadata", {})
+        releases[key] = {
+            "name": key[1],
+            "namespace": key[0],
+            "revision": revision,
+            "status": decoded.get("info", {}).get("status"),
+            "updated": decoded.get("info", {}).get("last_deployed"),
+            "chart": f"{chart_metadata.get('name')}-{chart_metadata.get('version')}",
+            "manifest": parse_manifest(decoded.get("manifest", "")),
+        }
+
+        if snapshot:
+            snapshot.record_release(releases[key], decoded.get("manifest", ""))
+
+    return releases
+
+
+def list_helm_releases(namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    List the Helm releases of a namespace or of the whole cluster.
+
+    Uses a single release storage listing when `HI_HELM_STORAGE` is set, in
+    which case the releases already carry their parsed manifest.
+
+    Args:
+        namespace (str, optional): The namespace to list, defaults to all namespaces.
+
+    Returns:
+        List[Dict[str, Any]]: The releases with their name, namespace, revision,
+        status and chart.
+    """
+
+    snapshot = get_active_snapshot()
+    if snapshot and snapshot.replaying:
+        return [
+            dict(info)
+            for key, info in sorted(snapshot.releases.items())
+            if not namespace or key[0] == namespace
+        ]
+
+    if HI_HELM_STORAGE:
+        return list(get_helm_releases(namespace, HI_HELM_STORAGE).values())
+
+    command = ["helm", "list", "--max", "0", "-o", "json"]
+    command += ["-n", namespace] if namespace else ["--all-namespaces"]
+    output = run_command(command, raw=True)
+
+    try:
+        listed = codec.loads(output) if output else []
+    except json.JSONDecodeError:
+        logger.error("Failed to parse Helm release list JSON.")
+        return []
+
+    releases = [
+        {
+            "name": item.get("name"),
+            "namespace": item.get("namespace"),
+            "revision": int(item.get("revision", 0)),
+            "status": item.get("status"),
+            "updated": item.get("updated"),
+            "chart": item.get("chart"),
+        }
+        for item in listed or []
+    ]
+
+    if snapshot:
+        for release in releases:
+            snapshot.record_release(release)
+    return releases
+
+
+def get_helm_revision(release: str, namespace: str) -> Optional[int]:
+    """
+    Get the deployed revision of a Helm release.
+
+    Args:
+        release (str): The name of the Helm release.
+        namespace (str): The namespace of the Helm release.
+
+    Returns:
+        int or None: The revision, None if the release cannot be found.
+    """
+
+    snapshot = get_active_snapshot()
+    if snapshot and snapshot.replaying:
+        return snapshot.releases.get((namespace, release), {}).get("revision")
+
+    if HI_HELM_STORAGE:
+        info = get_helm_releases(namespace, HI_HELM_STORAGE, release)
+        return info.get((namespace, release), {}).get("revision")
+
+    output = run_command(
+        ["helm", "status", release, "-n", namespace, "-o", "json"], raw=True
+    )
+    try:
+        status = codec.loads(output) if output else {}
+        revision = int(status["version"])
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+    if snapshot:
+        info = status.get("info", {})
+        chart_metadata = status.get("chart", {}).get("metadata", {})
+        snapshot.record_release(
+            {
+                "name": release,
+                "namespace": namespace,
+                "revision": revision,
+                "status": info.get("status"),
+                "updated": info.get("last_deployed"),
+                "chart": f"{chart_metadata.get('name')}-{chart_metadata.get('version')}",
+            }
+        )
+    return revision
+
+
+def get_helm_manifests(
+    namespace: Optional[str] = None, driver: str = "secret"
+) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """
+    Get the manifests of all deployed Helm releases with a single list call.
+
+    Args:
+        namespace (str, optional): The namespace to list, defaults to all namespaces.
+        driver (str): The Helm storage driver (`secret` or `configmap`).
+
+    Returns:
+        Dict[Tuple[str, str], List[Dict[str, Any]]]: Manifests keyed by
+        (namespace, release).
+    """
+
+    return {
+        key: release["manifest"]
+        for key, release in get_helm_releases(namespace, driver).items()
+    }
+
+
 def get_k8s_resource(kind: str, name: str, namespace: str) -> Dict[str, Any]:
     """
     Get a Kubernetes resource in JSON format.
@@ -91,11 +554,292 @@ def get_k8s_resource(kind: str, name: str, namespace: str) -> Dict[str, Any]:
         Dict[str, Any]: The Kubernetes resource as a dictionary.
     """
 
+    snapshot = get_active_snapshot()
+    if snapshot and snapshot.replaying:
+        return snapshot.get_resource(kind, name, namespace)
+
+    cache = get_cache("resources")
+    key = (namespace, kind.lower(), name)
+    if cache:
+        resource = cache.get(key)
+        if resource is not MISSING:
+            return resource
+
+    index = get_cache("namespaces")
+    if index and kind in KIND_API_PATHS:
+        try:
+            objects = index.get(
+                namespace, kind, lambda: list_namespace_objects(kind, namespace)
+            )
+        except ClusterError as e:
+            if e.reason == CANCELLED:
+                raise
+            objects = None
+        if objects and name in objects:
+            resource = objects[name]
+            if snapshot:
+                snapshot.record_resource(kind, name, namespace, resource)
+            if cache:
+                cache.put(key, resource)
+            return resource
+
     output = run_command(
-        ["kubectl", "get", kind.lower(), name, "-n", namespace, "-o", "json"]
+        ["kubectl", "get", kind.lower(), name, "-n", namespace, "-o", "json"],
+        raw=True,
     )
     try:
-        return json.loads(output) if output else {}
+        resource = codec.loads(output) if output else {}
     except json.JSONDecodeError:
         logger.error(f"Failed to parse {kind} `{name}` JSON.")
+        resource = {}
+
+    if snapshot:
+        snapshot.record_resource(kind, name, namespace, resource)
+    if cache:
+        cache.put(key, resource, size=len(output))
+    return resource
+
+
+def get_k8s_projections(
+    resources: List[Tuple[str, str]], namespace: str, paths: List[str]
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Get selected `spec` fields of several Kubernetes resources in one call.
+
+    Only the projected fields are transferred (`kubectl get -o jsonpath`).
+    When live objects are recorded or replayed, or already served from the
+    namespace index, the fields are read from the full objects instead.
+
+    Args:
+        resources (List[Tuple[str, str]]): The (kind, name) pairs.
+        namespace (str): The Kubernetes namespace.
+        paths (List[str]): The dotted field paths, relative to `spec`.
+
+    Returns:
+        Dict[Tuple[str, str], Dict[str, Any]]: The values by path, absent
+        when the field is not set, of every existing resource by (kind, name).
+
+    Raises:
+        ClusterError: If the call is still throttled or unavailable after
+            retries, or if cluster calls were cancelled.
+    """
+
+    if not resources:
         return {}
+
+    if get_active_snapshot() or get_cache("namespaces"):
+        projections = {}
+        for kind, name in resources:
+            resource = get_k8s_resource(kind, name, namespace)
+            if not resource:
+                continue
+            spec = resource.get("spec", {})
+            projections[(kind, name)] = {
+                path: get_field(spec, path)
+                for path in paths
+                if get_field(spec, path) is not None
+            }
+        return projections
+
+    tab, newline = '{"\\t"}', '{"\\n"}'
+    template = (
+        "{.kind}"
+        + tab
+        + "{.metadata.name}"
+        + "".join(f"{tab}{{.spec.{path}}}" for path in paths)
+        + newline
+    )
+    if len(resources) > 1:
+        template = "{range .items[*]}%s{end}" % template
+
+    output = run_command(
+        ["kubectl", "get"]
+        + [f"{kind.lower()}/{name}" for kind, name in resources]
+        + ["-n", namespace, "--ignore-not-found", "-o", f"jsonpath={template}"]
+    )
+
+    projections = {}
+    for line in output.splitlines():
+        fields = line.split("\t")
+        if len(fields) != len(paths) + 2:
+            continue
+        projection = {}
+        for path, field in zip(paths, fields[2:]):
+            if not field:
+                continue
+            try:
+                projection[path] = codec.loads(field)
+            except json.JSONDecodeError:
+                projection[path] = field
+        projections[(fields[0], fields[1])] = projection
+    return projections
+
+
+DRY_RUN_SOURCE_ANNOTATION = "helm-inspect/source-name"
+"""
+Annotation mapping a dry-run object back to the manifest object it was made from.
+"""
+
+
+def dry_run_resources(
+    resources: List[Dict[str, Any]], namespace: str
+) -> Optional[Dict[Tuple[str, str], Dict[str, Any]]]:
+    """
+    Let the API server default and admit manifest objects, without persisting them.
+
+    All objects are sent in one `kubectl create --dry-run=server` call. They
+    are created under a generated name (`metadata.generateName`), so the
+    result holds only what the manifest, the API server defaults and the
+    mutating admission webhooks set, independently of the live objects.
+
+    Args:
+        resources (List[Dict[str, Any]]): The manifest objects.
+        namespace (str): The Kubernetes namespace.
+
+    Returns:
+        Dict[Tuple[str, str], Dict[str, Any]] or None: The defaulted objects by
+        (kind, name) of their manifest object, None if the dry run failed or
+        live objects are replayed from a snapshot.
+
+    Raises:
+        ClusterError: If the call is still throttled or unavailable after
+            retries, or if cluster calls were cancelled.
+    """
+
+    snapshot = get_active_snapshot()
+    if not resources or (snapshot and snapshot.replaying):
+        return None
+
+    items = []
+    for resource in resources:
+        item = copy.deepcopy(resource)
+        metadata = item.setdefault("metadata", {})
+        name = metadata.pop("name", "")
+        metadata["generateName"] = f"{name[:50]}-"
+        metadata["namespace"] = namespace
+        metadata.setdefault("annotations", {})[DRY_RUN_SOURCE_ANNOTATION] = name
+        items.append(item)
+
+    try:
+        TMP_DIR.mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=TMP_DIR, prefix="dry_run_", suffix=".json")
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                codec.dumps(
+                    {"apiVersion": "v1", "kind": "List", "items": items},
+                    default=str,
+                )
+            )
+    except OSError as e:
+        logger.error(f"Failed to write the dry-run manifest: {e}")
+        return None
+
+    try:
+        output = run_command(
+            ["kubectl", "create", "--dry-run=server", "-f", path]
+            + ["-n", namespace, "-o", "json"],
+            raw=True,
+        )
+    finally:
+        os.unlink(path)
+
+    if not output:
+        return None
+
+    objects: List[Dict[str, Any]] = []
+    try:
+        documents = [codec.loads(output)]
+    except json.JSONDecodeError:
+        # Older kubectl versions print one document per object.
+        documents = []
+        text, position = output.decode("utf-8", "replace"), 0
+        decoder = json.JSONDecoder()
+        try:
+            while position < len(text):
+                if text[position].isspace():
+                    position += 1
+                    continue
+                document, position = decoder.raw_decode(text, position)
+                documents.append(document)
+        except json.JSONDecodeError:
+            logger.error("Failed to parse the dry-run output.")
+            return None
+
+    for document in documents:
+        if isinstance(document, dict):
+            objects.extend(document.get("items", [document]))
+
+    defaulted = {}
+    for item in objects:
+        metadata = item.get("metadata", {})
+        name = metadata.get("annotations", {}).pop(DRY_RUN_SOURCE_ANNOTATION, None)
+        if name is not None:
+            metadata["name"] = name
+            defaulted[(item.get("kind"), name)] = item
+    return defaulted
+
+
+def list_namespace_objects(
+    kind: str, namespace: str
+) -> Tuple[Optional[Dict[str, Dict[str, Any]]], int]:
+    """
+    List every object of a kind in a namespace.
+
+    The first request asks for `resourceVersion=0` so the API server answers
+    from its watch cache instead of etcd. Servers that answer from etcd
+    paginate the list, in which case the remaining pages are followed.
+
+    Args:
+        kind (str): The Kubernetes resource kind, one of `KIND_API_PATHS`.
+        namespace (str): The Kubernetes namespace.
+
+    Returns:
+        Tuple[Optional[Dict[str, Dict[str, Any]]], int]: The objects by name
+        (None if the kind cannot be listed, e.g. not allowed) and the size of
+        the listing in bytes.
+
+    Raises:
+        ClusterError: If the listing is still throttled or unavailable after
+            retries, or if cluster calls were cancelled.
+    """
+
+    api_path, resource = KIND_API_PATHS[kind]
+    path = f"{api_path}/namespaces/{namespace}/{resource}"
+    api_version = api_path.split("/", 2)[-1]
+
+    objects: Dict[str, Dict[str, Any]] = {}
+    size = 0
+    query = f"limit={LIST_PAGE_SIZE}&resourceVersion=0"
+
+    while True:
+        try:
+            output = run_command(
+                ["kubectl", "get", "--raw", f"{path}?{query}"], raw=True
+            )
+        except ClusterError as e:
+            logger.debug(f"Listing {kind} in `{namespace}` failed: {e}")
+            if e.reason in (CANCELLED, THROTTLED, UNAVAILABLE):
+                raise
+            return None, 0
+        if not output:
+            return None, 0
+
+        try:
+            listing = codec.loads(output)
+        except json.JSONDecodeError:
+            logger.error(f"Failed to parse {kind} listing of `{namespace}`.")
+            return None, 0
+
+        size += len(output)
+        for item in listing.get("items", []):
+            item.setdefault("kind", kind)
+            item.setdefault("apiVersion", api_version)
+            objects[item.get("metadata", {}).get("name")] = item
+
+        token = listing.get("metadata", {}).get("continue")
+        if not token:
+            break
+        query = f"limit={LIST_PAGE_SIZE}&continue={quote(token, safe='')}"
+
+    logger.debug(f"Listed {len(objects)} {kind} object(s) in `{namespace}`.")
+    return objects, size
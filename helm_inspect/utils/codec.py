@@ -0,0 +1,170 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import json
+import math
+from typing import Any, Callable, Optional, Union
+
+from helm_inspect.utils.constant import JSON_CODEC
+from helm_inspect.utils.logger import setup_logger
+
+logger = setup_logger()
+
+
+def _import_orjson():
+    """
+    Import the optional `orjson` package, as selected by `JSON_CODEC`.
+
+    Returns:
+        module or None: The `orjson` module, None to use the standard library.
+    """
+
+    if JSON_CODEC == "json":
+        return None
+    try:
+        import orjson
+    except ImportError:
+        if JSON_CODEC == "orjson":
+            logger.warning(
+                "⚠️ HI_JSON_CODEC=orjson requires the `orjson` package "
+                '(`pip install "helm-inspect[orjson]"`), using the standard '
+                "library."
+            )
+        return None
+    return orjson
+
+
+_orjson = _import_orjson()
+
+
+def codec_name() -> str:
+    """
+    Get the name of the JSON library in use.
+
+    Returns:
+        str: `orjson` or `json`.
+    """
+
+    return "orjson" if _orjson else "json"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON, preferably straight from the bytes read from a process or file.
+
+    Args:
+        data (bytes or str): The JSON document.
+
+    Returns:
+        Any: The parsed data.
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid (`orjson` raises a
+            subclass of it).
+    """
+
+    if _orjson:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _finite(data: Any) -> Any:
+    """
+    Replace the NaN and infinite floats of data with None, as `orjson` does.
+
+    Args:
+        data (Any): The data.
+
+    Returns:
+        Any: A copy of the containers of data, with finite floats only.
+    """
+
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite(value) for value in data]
+    return data
+
+
+def dumps(
+    data: Any,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize data to UTF-8 JSON, compact unless indented.
+
+    Both libraries produce the same text, but for the exponent notation of
+    some floats, so digests of the output hardly depend on which one is
+    installed. NaN and infinite floats are written as `null` by both, since
+    JSON has no representation for them. Data `orjson` cannot serialize
+    (e.g. integers beyond 64 bits) is serialized by the standard library.
+
+    Args:
+        data (Any): The data.
+        indent (bool): Flag to indent with two spaces, for files read by people.
+        sort_keys (bool): Flag to sort dictionary keys.
+        default (Callable[[Any], Any], optional): Converts values that are not
+            JSON types, e.g. `str`.
+
+    Returns:
+        bytes: The JSON document.
+
+    Raises:
+        TypeError: If a value cannot be serialized.
+    """
+
+    if _orjson:
+        option = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        try:
+            return _orjson.dumps(data, default=default, option=option)
+        except TypeError:
+            pass
+
+    options = {
+        "indent": 2 if indent else None,
+        "separators": (",", ": ") if indent else (",", ":"),
+        "sort_keys": sort_keys,
+        "ensure_ascii": False,
+        "default": default,
+    }
+    try:
+        text = json.dumps(data, allow_nan=False, **options)
+    except ValueError:
+        text = json.dumps(_finite(data), allow_nan=False, **options)
+    return text.encode("utf-8")
+
+
+def dumps_text(
+    data: Any,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Serialize data to a JSON string; see `dumps`.
+
+    Args:
+        data (Any): The data.
+        indent (bool): Flag to indent with two spaces.
+        sort_keys (bool): Flag to sort dictionary keys.
+        default (Callable[[Any], Any], optional): Converts values that are not
+            JSON types.
+
+    Returns:
+        str: The JSON document.
+    """
+
+    return dumps(data, indent, sort_keys, default).decode("utf-8")
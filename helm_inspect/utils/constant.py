@@ -39,6 +39,238 @@ SLACK_MESSAGE_URL = "https://slack.com/api/chat.postMessage"
 Slack API URL for posting messages.
 """
 
+HI_HELM_STORAGE = os.getenv("HI_HELM_STORAGE")
+"""
+Helm storage driver (`secret` or `configmap`) to read release manifests from directly.
+
+When unset, manifests are retrieved with `helm get manifest`. This can be set using the
+`HI_HELM_STORAGE` environment variable.
+"""
+
+HELM_STORAGE_KINDS = {"secret": "secrets", "configmap": "configmaps"}
+"""
+Kubernetes resource holding Helm releases for each supported storage driver.
+"""
+
+DIFF_MAX_BYTES = int(os.getenv("HI_DIFF_MAX_BYTES", 1024 * 1024))
+"""
+Size above which a value is summarized by digest and bounded context instead of line-diffed.
+
+This can be set using the `HI_DIFF_MAX_BYTES` environment variable.
+"""
+
+LEAF_DIGEST_BYTES = int(os.getenv("HI_LEAF_DIGEST_BYTES", 64 * 1024))
+"""
+Size above which a drifted value is reported by digest and size, its content
+being written once to the blob store. Secret values are always digested.
+
+This can be set using the `HI_LEAF_DIGEST_BYTES` environment variable.
+"""
+
+DIFF_CONTEXT_LINES = 3
+"""
+Number of context lines shown around each diff hunk.
+"""
+
+DIFF_LINE_WIDTH = 200
+"""
+Maximum number of characters shown per line in a digest summary.
+"""
+
+DIFF_FALLBACK_CELLS = 4_000_000
+"""
+Largest region (lines x lines) searched with `difflib` when no unique anchor lines exist.
+"""
+
+CLUSTER_CONCURRENCY_INITIAL = int(os.getenv("HI_CONCURRENCY_INITIAL", 4))
+"""
+Number of cluster calls allowed in flight when a run starts.
+
+This can be set using the `HI_CONCURRENCY_INITIAL` environment variable.
+"""
+
+CLUSTER_CONCURRENCY_MAX = int(os.getenv("HI_CONCURRENCY_MAX", 32))
+"""
+Upper bound of cluster calls in flight, however healthy the API server is.
+
+This can be set using the `HI_CONCURRENCY_MAX` environment variable.
+"""
+
+CLUSTER_TARGET_LATENCY = float(os.getenv("HI_TARGET_LATENCY", 1.0))
+"""
+Latency (in seconds) under which a cluster call is considered healthy.
+
+This can be set using the `HI_TARGET_LATENCY` environment variable.
+"""
+
+CLUSTER_MAX_RETRIES = int(os.getenv("HI_MAX_RETRIES", 4))
+"""
+Number of retries of a throttled or unavailable cluster call before giving up.
+
+This can be set using the `HI_MAX_RETRIES` environment variable.
+"""
+
+CLUSTER_CALL_TIMEOUT = float(os.getenv("HI_CALL_TIMEOUT", 60))
+"""
+Seconds after which a `kubectl` or `helm` call is killed and retried.
+
+This can be set using the `HI_CALL_TIMEOUT` environment variable.
+"""
+
+CLUSTER_HEDGE = os.getenv("HI_HEDGE", "1") not in ("0", "false", "no")
+"""
+Whether a duplicate of a read call is started once it runs longer than the
+95th percentile of recent calls, keeping whichever answers first.
+
+This can be set using the `HI_HEDGE` environment variable.
+"""
+
+EXEC_CREDENTIAL_CACHE = os.getenv("HI_EXEC_CREDENTIAL_CACHE", "1") not in (
+    "0",
+    "false",
+    "no",
+)
+"""
+Whether the exec credential plugin of the kubeconfig user (e.g. `aws eks
+get-token`) is run once and its token reused by every `kubectl` and `helm`
+call until it expires, instead of being run by each call.
+
+This can be set using the `HI_EXEC_CREDENTIAL_CACHE` environment variable.
+"""
+
+EXEC_CREDENTIAL_MARGIN = 60
+"""
+Seconds before its expiry at which a cached exec credential is renewed.
+"""
+
+HI_EVENT_LOG = os.getenv("HI_EVENT_LOG")
+"""
+Path of the structured JSON event log (`-` for standard error).
+
+This can be set using the `HI_EVENT_LOG` environment variable.
+"""
+
+STORE_COMPRESSION = os.getenv("HI_STORE_COMPRESSION", "none").lower()
+"""
+Compression of saved drift, calibration and scan files: `none`, `gzip` or
+`zstd` (requires the `zstandard` package). Files are read whatever their
+compression.
+
+This can be set using the `HI_STORE_COMPRESSION` environment variable.
+"""
+
+JSON_CODEC = os.getenv("HI_JSON_CODEC", "auto").lower()
+"""
+JSON library used to parse cluster output and save files: `orjson`, `json`
+(the standard library) or `auto` to use `orjson` when it is installed.
+
+This can be set using the `HI_JSON_CODEC` environment variable.
+"""
+
+STORE_LAYOUT = os.getenv("HI_STORE_LAYOUT", "flat").lower()
+"""
+Directory layout of saved files: `flat`, or `sharded` to spread them over
+256 hashed subdirectories. Files are found in either layout.
+
+This can be set using the `HI_STORE_LAYOUT` environment variable.
+"""
+
+RETENTION_DAYS = (
+    float(os.environ["HI_RETENTION_DAYS"]) if os.getenv("HI_RETENTION_DAYS") else None
+)
+"""
+Age in days after which drift reports, fleet summaries and scan states are
+pruned at the end of a fleet scan. Unset to keep everything.
+
+This can be set using the `HI_RETENTION_DAYS` environment variable.
+"""
+
+KIND_API_PATHS = {
+    "Deployment": ("/apis/apps/v1", "deployments"),
+    "Service": ("/api/v1", "services"),
+    "Ingress": ("/apis/networking.k8s.io/v1", "ingresses"),
+    "ConfigMap": ("/api/v1", "configmaps"),
+    "Secret": ("/api/v1", "secrets"),
+}
+"""
+API group path and resource (plural) name of every supported kind, used to
+list a namespace in bulk.
+"""
+
+QUICK_FULL_INTERVAL = float(os.getenv("HI_QUICK_FULL_INTERVAL", 3600))
+"""
+Seconds after which a `--quick` check compares the full specs again even
+when the quick tier finds no drift.
+
+This can be set using the `HI_QUICK_FULL_INTERVAL` environment variable.
+"""
+
+NAMESPACE_CACHE_TTL = float(os.getenv("HI_NAMESPACE_CACHE_TTL", 60))
+"""
+Seconds a namespace listing is reused by fleet scans before listing again.
+Set to 0 to fetch every object individually.
+
+This can be set using the `HI_NAMESPACE_CACHE_TTL` environment variable.
+"""
+
+NAMESPACE_CACHE_MAX_BYTES = int(os.getenv("HI_NAMESPACE_CACHE_MAX_MB", 256)) * 1024**2
+"""
+Memory bound of namespace listings, least recently used evicted first.
+
+This can be set (in MiB) using the `HI_NAMESPACE_CACHE_MAX_MB` environment variable.
+"""
+
+CACHE_MAX_BYTES = int(os.getenv("HI_CACHE_MAX_MB", 128)) * 1024**2
+"""
+Memory bound of each of the manifest, live object and calibration caches,
+least recently used evicted first.
+
+This can be set (in MiB) using the `HI_CACHE_MAX_MB` environment variable.
+"""
+
+CACHE_NAMESPACE_TTLS = {
+    namespace.strip(): float(ttl)
+    for namespace, _, ttl in (
+        item.partition("=")
+        for item in os.getenv("HI_CACHE_NAMESPACE_TTLS", "").split(",")
+        if "=" in item
+    )
+}
+"""
+Time to live (in seconds) of cached live objects and listings per namespace,
+overriding the default TTL, e.g. `kube-system=600,payments=5`.
+
+This can be set using the `HI_CACHE_NAMESPACE_TTLS` environment variable.
+"""
+
+CACHE_DISK = os.getenv("HI_CACHE_DISK", "0") not in ("0", "false", "no")
+"""
+Whether manifests of known revisions are also cached on disk, under
+`CACHE_DIR`, so they survive evictions and restarts.
+
+This can be set using the `HI_CACHE_DISK` environment variable.
+"""
+
+LIST_PAGE_SIZE = 500
+"""
+Page size of namespace listings that are not served from the watch cache.
+"""
+
+HOT_KEYS_CAPACITY = int(os.getenv("HI_HOT_KEYS_CAPACITY", 1000))
+"""
+Number of keys and resources counted by the fleet drift aggregator. Memory
+stays bounded by this number however many releases are scanned.
+
+This can be set using the `HI_HOT_KEYS_CAPACITY` environment variable.
+"""
+
+HOT_KEYS_TOP = int(os.getenv("HI_HOT_KEYS_TOP", 20))
+"""
+Number of most drifting keys and resources reported in fleet summaries.
+
+This can be set using the `HI_HOT_KEYS_TOP` environment variable.
+"""
+
 BASE_DIR: Path = (
     Path.home() / ".helminspect"
     if "HI_BASE_DIR" not in os.environ
@@ -59,3 +291,18 @@ DRIFT_DIR = BASE_DIR / "drift"
 """
 Directory to store drift data.
 """
+
+CACHE_DIR = BASE_DIR / "cache"
+"""
+Directory of the on-disk cache tier.
+"""
+
+BLOB_DIR = BASE_DIR / "blobs"
+"""
+Directory of the content-addressed store of large drifted values.
+"""
+
+DIGEST_KEY_FILE = BASE_DIR / "digest.key"
+"""
+Per-installation key of the digests of Secret values, readable by the owner only.
+"""
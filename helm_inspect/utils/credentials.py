@@ -0,0 +1,306 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import atexit
+import base64
+import json
+import os
+import subprocess
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from helm_inspect.utils import codec
+from helm_inspect.utils.constant import (
+    EXEC_CREDENTIAL_CACHE,
+    EXEC_CREDENTIAL_MARGIN,
+    TMP_DIR,
+)
+from helm_inspect.utils.logger import setup_logger
+from helm_inspect.utils.storage import atomic_write
+
+logger = setup_logger()
+
+PLUGIN_TIMEOUT = 60
+"""
+Seconds after which an exec credential plugin is killed.
+"""
+
+
+def parse_timestamp(value: str) -> float:
+    """
+    Parse an RFC 3339 timestamp, e.g. `2025-01-01T12:00:00Z`.
+
+    Args:
+        value (str): The timestamp.
+
+    Returns:
+        float: The POSIX timestamp.
+
+    Raises:
+        ValueError: If the timestamp is invalid.
+    """
+
+    value = value.strip()
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    if "." in value:
+        head, _, tail = value.partition(".")
+        digits = len(tail) - len(tail.lstrip("0123456789"))
+        value = f"{head}.{tail[:min(digits, 6)]}{tail[digits:]}"
+    return datetime.fromisoformat(value).timestamp()
+
+
+def run_exec_plugin(
+    exec_config: Dict[str, Any], cluster: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run an exec credential plugin the way `kubectl` does.
+
+    Args:
+        exec_config (Dict[str, Any]): The `exec` section of the kubeconfig user.
+        cluster (Dict[str, Any], optional): The cluster, passed to plugins
+            that set `provideClusterInfo`.
+
+    Returns:
+        Dict[str, Any]: The `status` of the returned ExecCredential.
+
+    Raises:
+        RuntimeError: If the plugin fails or returns no credential.
+    """
+
+    spec: Dict[str, Any] = {"interactive": False}
+    if exec_config.get("provideClusterInfo") and cluster:
+        spec["cluster"] = {
+            "server": cluster.get("server"),
+            "certificate-authority-data": cluster.get("certificate-authority-data"),
+            "insecure-skip-tls-verify": cluster.get("insecure-skip-tls-verify"),
+        }
+
+    api_version = exec_config.get("apiVersion", "client.authentication.k8s.io/v1beta1")
+    env = dict(os.environ)
+    env.update({e["name"]: e["value"] for e in exec_config.get("env") or []})
+    env["KUBERNETES_EXEC_INFO"] = json.dumps(
+        {"apiVersion": api_version, "kind": "ExecCredential", "spec": spec}
+    )
+
+    command = [exec_config["command"], *(exec_config.get("args") or [])]
+    try:
+        result = subprocess.run(
+            command,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=PLUGIN_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise RuntimeError(f"Exec credential plugin `{command[0]}` failed: {e}")
+
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Exec credential plugin `{command[0]}` failed: {result.stderr.strip()}"
+        )
+
+    try:
+        status = json.loads(result.stdout).get("status") or {}
+    except (json.JSONDecodeError, AttributeError):
+        raise RuntimeError(f"Exec credential plugin `{command[0]}` returned no JSON")
+
+    if not status.get("token") and not status.get("clientCertificateData"):
+        raise RuntimeError(
+            f"Exec credential plugin `{command[0]}` returned no credential"
+        )
+    return status
+
+
+class ExecCredentialCache:
+    """
+    Runs the exec credential plugin of the current kubeconfig user once and
+    hands its credential to every `kubectl` and `helm` call.
+
+    The credential is written into a private copy of the current kubeconfig
+    context (readable by the owner only, removed at exit) that calls use
+    through `--kubeconfig`. It is renewed `EXEC_CREDENTIAL_MARGIN` seconds
+    before it expires. Users without an exec plugin are left untouched.
+    """
+
+    def __init__(self, kubectl: str = "kubectl", path: Optional[Path] = None):
+        self.kubectl = kubectl
+        self.path = path or TMP_DIR / f"kubeconfig_{os.getpid()}.json"
+        self.runs = 0
+        self._config: Optional[Dict[str, Any]] = None
+        self._expires: Optional[float] = None
+        self._loaded = False
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _load_config(self) -> Optional[Dict[str, Any]]:
+        result = subprocess.run(
+            [self.kubectl, "config", "view", "--minify", "--raw", "--flatten"]
+            + ["-o", "json"],
+            capture_output=True,
+            text=True,
+            timeout=PLUGIN_TIMEOUT,
+        )
+        if result.returncode != 0:
+            return None
+        config = json.loads(result.stdout)
+        users = config.get("users") or []
+        if len(users) != 1 or not (users[0].get("user") or {}).get("exec"):
+            return None
+        return config
+
+    def _refresh(self) -> None:
+        config = self._config
+        user = config["users"][0]["user"]
+        clusters = config.get("clusters") or []
+        status = run_exec_plugin(
+            user["exec"], clusters[0].get("cluster") if clusters else None
+        )
+        self.runs += 1
+
+        credential: Dict[str, Any] = {}
+        if status.get("token"):
+            credential["token"] = status["token"]
+        if status.get("clientCertificateData"):
+            credential["client-certificate-data"] = base64.b64encode(
+                status["clientCertificateData"].encode("utf-8")
+            ).decode("ascii")
+            credential["client-key-data"] = base64.b64encode(
+                (status.get("clientKeyData") or "").encode("utf-8")
+            ).decode("ascii")
+
+        derived = dict(config)
+        derived["users"] = [{"name": config["users"][0]["name"], "user": credential}]
+        if not self.path.exists():
+            # atomic_write keeps the mode of the file it replaces.
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            os.close(os.open(self.path, os.O_CREAT | os.O_WRONLY, 0o600))
+        atomic_write(self.path, codec.dumps(derived))
+
+        expiry = status.get("expirationTimestamp")
+        self._expires = parse_timestamp(expiry) if expiry else None
+        logger.debug(
+            "Cached exec credential of `%s`%s.",
+            user["exec"].get("command"),
+            f" until {expiry}" if expiry else "",
+        )
+
+    def kubeconfig(self) -> Optional[str]:
+        """
+        Get the kubeconfig holding a valid cached credential.
+
+        Returns:
+            str or None: Its path, None when the current user has no exec
+            plugin or the plugin cannot be run here (calls then run it
+            themselves).
+        """
+
+        with self._lock:
+            if self._disabled:
+                return None
+            try:
+                if not self._loaded:
+                    self._loaded = True
+                    self._config = self._load_config()
+                if self._config is None:
+                    self._disabled = True
+                    return None
+                if not self.path.exists() or (
+                    self._expires is not None
+                    and time.time() >= self._expires - EXEC_CREDENTIAL_MARGIN
+                ):
+                    self._refresh()
+            except (
+                OSError,
+                RuntimeError,
+                KeyError,
+                ValueError,
+                subprocess.TimeoutExpired,
+            ) as e:
+                logger.debug(f"Not caching exec credentials: {e}")
+                self._disabled = True
+                return None
+            return str(self.path)
+
+    def close(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def orphaned_kubeconfigs(directory: Path = TMP_DIR) -> List[Path]:
+    """
+    Find the kubeconfigs of exec credential caches whose process is gone,
+    e.g. killed before it could remove them, with their credential inside.
+
+    Args:
+        directory (Path): The directory of the kubeconfigs.
+
+    Returns:
+        List[Path]: The kubeconfigs.
+    """
+
+    orphaned = []
+    for path in directory.glob("kubeconfig_*.json") if directory.exists() else []:
+        pid = path.stem.rsplit("_", 1)[-1]
+        if not pid.isdigit():
+            continue
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            orphaned.append(path)
+        except (PermissionError, OverflowError):
+            pass
+    return orphaned
+
+
+_cache: Optional[ExecCredentialCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_credential_cache() -> Optional[ExecCredentialCache]:
+    """
+    Get the process-wide exec credential cache, if enabled.
+
+    Returns:
+        ExecCredentialCache or None: The cache.
+    """
+
+    global _cache
+
+    if not EXEC_CREDENTIAL_CACHE:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ExecCredentialCache()
+            atexit.register(_cache.close)
+        return _cache
+
+
+def with_credentials(command: List[str]) -> List[str]:
+    """
+    Point a `kubectl` or `helm` command at the cached exec credential.
+
+    Args:
+        command (List[str]): The command.
+
+    Returns:
+        List[str]: The command, with `--kubeconfig` added when a credential
+        is cached.
+    """
+
+    cache = get_credential_cache()
+    if cache is None or "--kubeconfig" in command:
+        return command
+    path = cache.kubeconfig()
+    return command + ["--kubeconfig", path] if path else command
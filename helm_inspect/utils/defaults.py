@@ -0,0 +1,177 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+ANY = object()
+"""
+Matches any live value: the field is allocated or defaulted by the cluster.
+"""
+
+_MISSING = object()
+
+_CONTAINER_DEFAULTS = {
+    "terminationMessagePath": "/dev/termination-log",
+    "terminationMessagePolicy": "File",
+    "imagePullPolicy": ("IfNotPresent", "Always"),
+    "resources": {},
+    "ports[*].protocol": "TCP",
+    "env[*].valueFrom.fieldRef.apiVersion": "v1",
+    **{
+        f"{probe}.{field}": value
+        for probe in ("livenessProbe", "readinessProbe", "startupProbe")
+        for field, value in (
+            ("timeoutSeconds", 1),
+            ("periodSeconds", 10),
+            ("successThreshold", 1),
+            ("failureThreshold", 3),
+            ("httpGet.scheme", "HTTP"),
+        )
+    },
+}
+
+_POD_DEFAULTS = {
+    "dnsPolicy": "ClusterFirst",
+    "restartPolicy": "Always",
+    "schedulerName": "default-scheduler",
+    "securityContext": {},
+    "terminationGracePeriodSeconds": 30,
+    "enableServiceLinks": True,
+    "volumes[*].configMap.defaultMode": 420,
+    "volumes[*].secret.defaultMode": 420,
+    "volumes[*].projected.defaultMode": 420,
+    "volumes[*].downwardAPI.defaultMode": 420,
+    **{
+        f"{containers}[*].{path}": value
+        for containers in ("containers", "initContainers")
+        for path, value in _CONTAINER_DEFAULTS.items()
+    },
+}
+
+KIND_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "Deployment": {
+        "progressDeadlineSeconds": 600,
+        "revisionHistoryLimit": 10,
+        "replicas": 1,
+        "strategy.type": "RollingUpdate",
+        "strategy.rollingUpdate.maxSurge": "25%",
+        "strategy.rollingUpdate.maxUnavailable": "25%",
+        "template.metadata.creationTimestamp": None,
+        **{f"template.spec.{path}": value for path, value in _POD_DEFAULTS.items()},
+    },
+    "Service": {
+        "type": "ClusterIP",
+        "clusterIP": ANY,
+        "clusterIPs": ANY,
+        "ipFamilies": ANY,
+        "ipFamilyPolicy": "SingleStack",
+        "sessionAffinity": "None",
+        "internalTrafficPolicy": "Cluster",
+        "externalTrafficPolicy": ("Cluster", "Local"),
+        "allocateLoadBalancerNodePorts": True,
+        "ports[*].protocol": "TCP",
+        "ports[*].targetPort": ANY,
+        "ports[*].nodePort": ANY,
+    },
+    "Ingress": {
+        "ingressClassName": ANY,
+    },
+}
+"""
+Fields the API server (or its built-in admission) sets when a manifest
+leaves them out, relative to the compared data (`spec`), per kind.
+
+`[*]` matches every item of a list; a tuple lists the acceptable defaults.
+"""
+
+
+def _parse_path(path: str) -> Tuple[str, ...]:
+    return tuple(segment for segment in re.split(r"\.|\[(\*)\]", path) if segment)
+
+
+_PARSED_DEFAULTS: Dict[str, List[Tuple[Tuple[str, ...], Any]]] = {
+    kind: [(_parse_path(path), value) for path, value in defaults.items()]
+    for kind, defaults in KIND_DEFAULTS.items()
+}
+
+
+def _is_default(value: Any, default: Any) -> bool:
+    if default is ANY:
+        return True
+    if isinstance(default, tuple):
+        return value in default
+    return value == default
+
+
+def _strip(live: Any, helm: Any, segments: Tuple[str, ...], default: Any) -> bool:
+    """
+    Remove a defaulted field from the live data where Helm leaves it out.
+
+    Args:
+        live (Any): The live data at the current level.
+        helm (Any): The Helm data at the same level, `_MISSING` if absent.
+        segments (Tuple[str, ...]): The remaining path segments.
+        default (Any): The default value of the field.
+
+    Returns:
+        bool: True if something was removed.
+    """
+
+    segment, rest = segments[0], segments[1:]
+
+    if segment == "*":
+        if not isinstance(live, list):
+            return False
+        changed = False
+        for index, item in enumerate(live):
+            counterpart = (
+                helm[index]
+                if isinstance(helm, list) and index < len(helm)
+                else _MISSING
+            )
+            changed |= _strip(item, counterpart, rest, default)
+        return changed
+
+    if not isinstance(live, dict) or segment not in live:
+        return False
+    counterpart = helm.get(segment, _MISSING) if isinstance(helm, dict) else _MISSING
+
+    if not rest:
+        if counterpart is _MISSING and _is_default(live[segment], default):
+            del live[segment]
+            return True
+        return False
+
+    changed = _strip(live[segment], counterpart, rest, default)
+    if changed and counterpart is _MISSING and live[segment] in ({}, []):
+        del live[segment]
+    return changed
+
+
+def strip_defaults(kind: str, helm_data: Any, live_data: Any) -> Any:
+    """
+    Remove the fields the API server defaulted from the live data.
+
+    A field is removed only when the Helm manifest leaves it out and the
+    live value is the known default, so explicitly set values and real
+    changes are still compared. This makes results accurate without
+    calibration for the defaults listed in `KIND_DEFAULTS`.
+
+    Args:
+        kind (str): The Kubernetes resource kind.
+        helm_data (Any): The compared Helm data.
+        live_data (Any): The compared live data, modified in place.
+
+    Returns:
+        Any: The live data without defaulted fields.
+    """
+
+    for segments, default in _PARSED_DEFAULTS.get(kind, []):
+        _strip(live_data, helm_data, segments, default)
+    return live_data
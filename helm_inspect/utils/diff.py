@@ -0,0 +1,496 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import difflib
+import hashlib
+import json
+import math
+import yaml
+from bisect import bisect_left
+from typing import Any, Dict, List, Tuple
+
+from helm_inspect.utils.constant import (
+    DIFF_CONTEXT_LINES,
+    DIFF_FALLBACK_CELLS,
+    DIFF_LINE_WIDTH,
+    DIFF_MAX_BYTES,
+)
+
+
+def digest(text: str) -> str:
+    """
+    Compute the SHA-256 digest of a text.
+
+    Args:
+        text (str): The text to digest.
+
+    Returns:
+        str: The prefixed hex digest.
+    """
+
+    return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_lines(a: List[str], b: List[str]) -> Tuple[List[int], List[int]]:
+    """
+    Map the lines of both sides to integer ids, so equal lines compare in O(1).
+
+    Args:
+        a (List[str]): The lines of the first side.
+        b (List[str]): The lines of the second side.
+
+    Returns:
+        Tuple[List[int], List[int]]: The line ids of both sides.
+    """
+
+    ids: Dict[str, int] = {}
+    return (
+        [ids.setdefault(line, len(ids)) for line in a],
+        [ids.setdefault(line, len(ids)) for line in b],
+    )
+
+
+def _unique_anchors(
+    a: List[int], b: List[int], alo: int, ahi: int, blo: int, bhi: int
+) -> List[Tuple[int, int]]:
+    """
+    Find the longest increasing run of lines unique to both regions (patience diff).
+
+    Args:
+        a (List[int]): The line ids of the first side.
+        b (List[int]): The line ids of the second side.
+        alo (int): Start of the first region.
+        ahi (int): End of the first region.
+        blo (int): Start of the second region.
+        bhi (int): End of the second region.
+
+    Returns:
+        List[Tuple[int, int]]: The anchor line pairs in increasing order.
+    """
+
+    counts: Dict[int, List[int]] = {}
+    for i in range(alo, ahi):
+        entry = counts.setdefault(a[i], [0, i, 0, -1])
+        entry[0] += 1
+    for j in range(blo, bhi):
+        entry = counts.get(b[j])
+        if entry is not None:
+            entry[2] += 1
+            entry[3] = j
+
+    candidates = sorted(
+        (entry[1], entry[3])
+        for entry in counts.values()
+        if entry[0] == 1 and entry[2] == 1
+    )
+    if not candidates:
+        return []
+
+    tails: List[int] = []
+    tail_index: List[int] = []
+    previous = [-1] * len(candidates)
+    for index, (_, j) in enumerate(candidates):
+        position = bisect_left(tails, j)
+        if position:
+            previous[index] = tail_index[position - 1]
+        if position == len(tails):
+            tails.append(j)
+            tail_index.append(index)
+        else:
+            tails[position] = j
+            tail_index[position] = index
+
+    anchors = []
+    index = tail_index[-1]
+    while index >= 0:
+        anchors.append(candidates[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors
+
+
+def matching_pairs(a: List[int], b: List[int]) -> List[Tuple[int, int]]:
+    """
+    Match the lines of two sequences with the patience diff algorithm.
+
+    Common prefixes and suffixes are trimmed first, unique lines are used as
+    anchors, and small regions without anchors fall back to `difflib`.
+    Large regions without anchors are reported as replaced rather than
+    searched, which keeps the cost bounded on multi-megabyte values.
+
+    Args:
+        a (List[int]): The line ids of the first side.
+        b (List[int]): The line ids of the second side.
+
+    Returns:
+        List[Tuple[int, int]]: The matched (a, b) line indexes in order.
+    """
+
+    pairs = []
+    stack = [(0, len(a), 0, len(b))]
+
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            pairs.append((alo, blo))
+            alo += 1
+            blo += 1
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            pairs.append((ahi, bhi))
+
+        if alo == ahi or blo == bhi:
+            continue
+
+        anchors = _unique_anchors(a, b, alo, ahi, blo, bhi)
+        if anchors:
+            for i, j in anchors:
+                pairs.append((i, j))
+                stack.append((alo, i, blo, j))
+                alo, blo = i + 1, j + 1
+            stack.append((alo, ahi, blo, bhi))
+        elif (ahi - alo) * (bhi - blo) <= DIFF_FALLBACK_CELLS:
+            matcher = difflib.SequenceMatcher(
+                None, a[alo:ahi], b[blo:bhi], autojunk=False
+            )
+            for i, j, size in matcher.get_matching_blocks():
+                pairs.extend((alo + i + k, blo + j + k) for k in range(size))
+
+    pairs.sort()
+    return pairs
+
+
+def get_opcodes(a: List[int], b: List[int]) -> List[Tuple[str, int, int, int, int]]:
+    """
+    Build `difflib`-style opcodes from the patience line matching.
+
+    Args:
+        a (List[int]): The line ids of the first side.
+        b (List[int]): The line ids of the second side.
+
+    Returns:
+        List[Tuple[str, int, int, int, int]]: The opcodes.
+    """
+
+    opcodes = []
+    i = j = 0
+
+    for ai, bj in matching_pairs(a, b) + [(len(a), len(b))]:
+        if i < ai and j < bj:
+            opcodes.append(("replace", i, ai, j, bj))
+        elif i < ai:
+            opcodes.append(("delete", i, ai, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, ai, j, bj))
+
+        if ai < len(a):
+            if opcodes and opcodes[-1][0] == "equal":
+                tag, i1, _, j1, _ = opcodes.pop()
+                opcodes.append((tag, i1, ai + 1, j1, bj + 1))
+            else:
+                opcodes.append(("equal", ai, ai + 1, bj, bj + 1))
+        i, j = ai + 1, bj + 1
+
+    return opcodes or [("equal", 0, 0, 0, 0)]
+
+
+def group_opcodes(opcodes: List[tuple], n: int = 3) -> List[List[tuple]]:
+    """
+    Group opcodes into hunks with up to `n` lines of context.
+
+    Mirrors `difflib.SequenceMatcher.get_grouped_opcodes`.
+
+    Args:
+        opcodes (List[tuple]): The opcodes.
+        n (int): The number of context lines.
+
+    Returns:
+        List[List[tuple]]: The grouped opcodes.
+    """
+
+    codes = list(opcodes)
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    groups = []
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > n * 2:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            groups.append(group)
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        groups.append(group)
+    return groups
+
+
+def _format_range(start: int, stop: int) -> str:
+    """
+    Format a line range the way `diff -u` does.
+
+    Args:
+        start (int): The zero-based start line.
+        stop (int): The zero-based stop line.
+
+    Returns:
+        str: The formatted range.
+    """
+
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def unified_diff(
+    a: List[str],
+    b: List[str],
+    fromfile: str = "",
+    tofile: str = "",
+    n: int = DIFF_CONTEXT_LINES,
+) -> List[str]:
+    """
+    Compute a unified diff using hashed lines and the patience algorithm.
+
+    Produces the same format as `difflib.unified_diff(..., lineterm="")`,
+    returning early when both sides are identical.
+
+    Args:
+        a (List[str]): The lines of the first side.
+        b (List[str]): The lines of the second side.
+        fromfile (str): The label of the first side.
+        tofile (str): The label of the second side.
+        n (int): The number of context lines.
+
+    Returns:
+        List[str]: The diff lines.
+    """
+
+    if a == b:
+        return []
+
+    a_ids, b_ids = hash_lines(a, b)
+    groups = group_opcodes(get_opcodes(a_ids, b_ids), n)
+    if not groups:
+        return []
+
+    lines = [f"--- {fromfile}", f"+++ {tofile}"]
+    for group in groups:
+        first, last = group[0], group[-1]
+        lines.append(
+            f"@@ -{_format_range(first[1], last[2])} "
+            f"+{_format_range(first[3], last[4])} @@"
+        )
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                lines.extend(" " + line for line in a[i1:i2])
+                continue
+            if tag in ("replace", "delete"):
+                lines.extend("-" + line for line in a[i1:i2])
+            if tag in ("replace", "insert"):
+                lines.extend("+" + line for line in b[j1:j2])
+
+    return lines
+
+
+def summarize_diff(
+    a_text: str,
+    b_text: str,
+    fromfile: str = "",
+    tofile: str = "",
+    n: int = DIFF_CONTEXT_LINES,
+) -> List[str]:
+    """
+    Summarize the difference of two large texts by digest and bounded context.
+
+    Only the first differing line and `n` lines around it are included, each
+    truncated to `DIFF_LINE_WIDTH` characters.
+
+    Args:
+        a_text (str): The first text.
+        b_text (str): The second text.
+        fromfile (str): The label of the first side.
+        tofile (str): The label of the second side.
+        n (int): The number of context lines.
+
+    Returns:
+        List[str]: The summary lines.
+    """
+
+    a_digest, b_digest = digest(a_text), digest(b_text)
+    if a_digest == b_digest:
+        return []
+
+    a, b = a_text.splitlines(), b_text.splitlines()
+    first = next(
+        (i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b))
+    )
+    start = max(0, first - n)
+
+    def clip(line: str) -> str:
+        if len(line) <= DIFF_LINE_WIDTH:
+            return line
+        return line[:DIFF_LINE_WIDTH] + f"... (+{len(line) - DIFF_LINE_WIDTH} chars)"
+
+    lines = [
+        f"--- {fromfile} ({a_digest}, {len(a_text.encode('utf-8'))} bytes)",
+        f"+++ {tofile} ({b_digest}, {len(b_text.encode('utf-8'))} bytes)",
+        f"@@ first difference at line {first + 1}, full diff skipped @@",
+    ]
+    lines.extend(" " + clip(line) for line in a[start:first])
+    lines.extend("-" + clip(line) for line in a[first : first + n + 1])
+    lines.extend("+" + clip(line) for line in b[first : first + n + 1])
+    return lines
+
+
+def diff_texts(
+    a_text: str, b_text: str, fromfile: str = "", tofile: str = ""
+) -> List[str]:
+    """
+    Diff two texts, falling back to a digest summary above `DIFF_MAX_BYTES`.
+
+    Args:
+        a_text (str): The first text.
+        b_text (str): The second text.
+        fromfile (str): The label of the first side.
+        tofile (str): The label of the second side.
+
+    Returns:
+        List[str]: The diff lines.
+    """
+
+    if a_text == b_text:
+        return []
+
+    if max(len(a_text), len(b_text)) > DIFF_MAX_BYTES:
+        return summarize_diff(a_text, b_text, fromfile, tofile)
+
+    return unified_diff(a_text.splitlines(), b_text.splitlines(), fromfile, tofile)
+
+
+class _DocumentLoader(yaml.SafeLoader):
+    """
+    YAML loader that keeps timestamps as strings, as JSON has no date type.
+    """
+
+
+_DocumentLoader.yaml_implicit_resolvers = {
+    first: [
+        (tag, regexp)
+        for tag, regexp in resolvers
+        if tag != "tag:yaml.org,2002:timestamp"
+    ]
+    for first, resolvers in yaml.SafeLoader.yaml_implicit_resolvers.items()
+}
+
+
+def _json_compatible(data: Any) -> Any:
+    """
+    Convert a parsed YAML document to JSON types, keys becoming strings.
+
+    Args:
+        data (Any): The parsed document.
+
+    Returns:
+        Any: The converted document.
+
+    Raises:
+        TypeError: If it holds a value JSON cannot represent (e.g. binary
+            data, sets or non-finite numbers).
+    """
+
+    if isinstance(data, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(key): _json_compatible(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [_json_compatible(value) for value in data]
+    if isinstance(data, float) and not math.isfinite(data):
+        raise TypeError(f"Non-finite number: {data}")
+    if data is None or isinstance(data, (str, bool, int, float)):
+        return data
+    raise TypeError(f"Unsupported value of type {type(data).__name__}")
+
+
+def parse_embedded_document(value: str) -> Any:
+    """
+    Parse a string value holding a JSON or YAML document.
+
+    YAML documents are kept to JSON types: timestamps stay strings and keys
+    become strings, so parsed values can be saved and compared like any other.
+
+    Args:
+        value (str): The string value.
+
+    Returns:
+        Any: The parsed mapping or list, or the original string if it does not
+        hold a structured document.
+    """
+
+    text = value.strip()
+    if not text:
+        return value
+
+    if text[0] in "{[":
+        try:
+            parsed = json.loads(text)
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, (dict, list)):
+            return parsed
+
+    if "\n" not in text or ":" not in text:
+        return value
+
+    try:
+        parsed = yaml.load(text, Loader=_DocumentLoader)
+    except yaml.YAMLError:
+        return value
+    if not isinstance(parsed, (dict, list)):
+        return value
+
+    try:
+        return _json_compatible(parsed)
+    except (TypeError, ValueError):
+        return value
+
+
+def expand_embedded_documents(data: Any) -> Any:
+    """
+    Replace string leaves holding JSON or YAML documents with their parsed form.
+
+    Lets a single changed setting inside an embedded config file be reported
+    as one drifted key instead of a line diff of the whole value.
+
+    Args:
+        data (Any): The data to expand.
+
+    Returns:
+        Any: The expanded data.
+    """
+
+    if isinstance(data, dict):
+        return {key: expand_embedded_documents(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [expand_embedded_documents(value) for value in data]
+    if isinstance(data, str):
+        return parse_embedded_document(data)
+    return data
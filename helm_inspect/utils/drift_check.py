@@ -6,67 +6,109 @@
 
 """
 
-import json
-import difflib
-from typing import Any, Dict, List, Set
-
-from helm_inspect.utils.cluster import get_helm_manifest, get_k8s_resource
-from helm_inspect.utils.logger import setup_logger
+import copy
+import time
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from helm_inspect.utils import codec
+from helm_inspect.utils.blobs import redact_values, report_value
+from helm_inspect.utils.cluster import (
+    dry_run_resources,
+    get_helm_manifest,
+    get_k8s_resource,
+)
+from helm_inspect.utils.defaults import strip_defaults
+from helm_inspect.utils.diff import diff_texts, expand_embedded_documents
+from helm_inspect.utils.flatten import count_leaves, diff_trees, flatten
+from helm_inspect.utils.limiter import CANCELLED, ClusterError
+from helm_inspect.utils.logger import event_log_enabled, log_event, setup_logger
 
 logger = setup_logger()
 
 SUPPORTED_KINDS = ["Deployment", "Service", "Ingress", "ConfigMap", "Secret"]
 
-IGNORABLE_KEYS = [
-    "Ingress;ingressClassName",
-    "Deployment;template.metadata.creationTimestamp",
-    "Deployment;template.spec.containers[0].terminationMessagePath",
-    "Deployment;progressDeadlineSeconds",
-    "Deployment;template.spec.schedulerName",
-    "Deployment;revisionHistoryLimit",
-    "Deployment;template.spec.securityContext",
-    "Service;ipFamilyPolicy",
-    "Service;clusterIPs[0]",
-    "Deployment;template.spec.dnsPolicy",
-    "Deployment;template.spec.terminationGracePeriodSeconds",
-    "Deployment;template.spec.volumes[0].configMap.defaultMode",
-    "Deployment;strategy.rollingUpdate.maxUnavailable",
-    "Service;ipFamilies[0]",
-    "Service;sessionAffinity",
-    "Deployment;template.spec.restartPolicy",
-    "Deployment;strategy.type",
-    "Service;clusterIP",
-    "Service;internalTrafficPolicy",
-    "Deployment;template.spec.containers[0].terminationMessagePolicy",
-    "Deployment;strategy.rollingUpdate.maxSurge",
-    "Deployment;template.spec.containers[0].resources",
-    "Deployment;template.spec.containers[0].ports[0].protocol",
-]
+DRY_RUN_KINDS = ["Deployment", "Service", "ConfigMap", "Secret"]
+"""
+Kinds defaulted by a server-side dry run. Ingresses are left out: ingress
+controllers reject a second Ingress for the host and path of the live one.
+"""
+
+
+def pins_allocated_ports(resource: Dict[str, Any]) -> bool:
+    """
+    Tell whether a Service sets a cluster IP or node port, which the live
+    Service already holds, so that a dry run of a copy would be rejected.
+
+    Args:
+        resource (Dict[str, Any]): The manifest object.
+
+    Returns:
+        bool: True if the object is such a Service.
+    """
+
+    if resource.get("kind") != "Service":
+        return False
+    spec = resource.get("spec") or {}
+    if spec.get("clusterIP") not in (None, "", "None") or any(
+        ip not in ("", "None") for ip in spec.get("clusterIPs") or []
+    ):
+        return True
+    return bool(spec.get("healthCheckNodePort")) or any(
+        isinstance(port, dict) and port.get("nodePort")
+        for port in spec.get("ports") or []
+    )
 
 
 def compare_values(
     helm_manifest: List[Dict[str, Any]],
     namespace: str,
     ignorable_keys: List[str],
-    no_cal_file: bool = False,
+    render_diff: bool = False,
+    structured_values: bool = False,
+    fail_fast: bool = False,
+    ignore_rules: Optional[Dict[str, Set[str]]] = None,
+    server_defaults: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None,
 ) -> dict:
     """
     Compares values between Helm manifest and live Kubernetes resources.
 
+    Only the structural drift is recorded by default; unified diffs are
+    rendered on demand (see `helm-inspect show`) unless `render_diff` is set.
+    A `resource_checked` event is recorded for every resource (see `log_event`).
+    With `fail_fast`, the comparison stops at the first drifted or missing
+    resource and `stopped_early` is set in the result. Resources found in
+    `server_defaults` are compared as defaulted by the API server instead of
+    as rendered by Helm, without ignore rules.
+
     Args:
         helm_manifest (List[Dict[str, Any]]): The Helm manifest.
         namespace (str): The Kubernetes namespace.
-        ignorable_keys (List[str]): The keys to ignore during comparison.
-        no_cal_file (bool): Flag to disable calibration file.
+        ignorable_keys (List[str]): The keys to ignore during comparison, None for a
+            strict comparison that also keeps fields defaulted by the API server.
+        render_diff (bool): Flag to render and log the unified diff of each resource.
+        structured_values (bool): Flag to compare JSON/YAML string values structurally.
+        fail_fast (bool): Flag to stop at the first drifted or missing resource.
+        ignore_rules (Dict[str, Set[str]], optional): `ignorable_keys` already
+            compiled by `compile_ignorable_keys`.
+        server_defaults (Dict[Tuple[str, str], Dict[str, Any]], optional): The
+            manifest objects defaulted by the API server (see `get_server_defaults`).
 
     Returns:
         dict: The drift logs and reports.
+
+    Raises:
+        ClusterError: If cluster calls were cancelled.
     """
 
+    if ignore_rules is None:
+        ignore_rules = compile_ignorable_keys(ignorable_keys)
+
     drift_logs = []
     drift_reports = []
+    stopped_early = False
 
     total_drifts, total_new_keys, total_removed_keys, total_modified_keys = 0, 0, 0, 0
+    unchecked_resources = 0
 
     for resource in helm_manifest:
         if not resource:
@@ -77,31 +119,80 @@ def compare_values(
         if not is_supported_resource(kind):
             continue
 
-        logger.info(f"Checking drift for {kind} `{name}`...")
+        logger.info("Checking drift for %s `%s`...", kind, name)
+        started = time.perf_counter()
+
+        try:
+            live_resource = get_k8s_resource(kind, name, namespace)
+        except ClusterError as e:
+            if e.reason == CANCELLED:
+                raise
+            drift_logs.append(handle_unchecked_resource(kind, name, e))
+            unchecked_resources += 1
+            log_event(
+                "resource_checked",
+                kind=kind,
+                name=name,
+                namespace=namespace,
+                status="unchecked",
+                reason=e.reason,
+                duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            )
+            continue
 
-        live_resource = get_k8s_resource(kind, name, namespace)
         if not live_resource:
             message = handle_missing_resource(kind, name)
             drift_logs.append(message)
+            log_event(
+                "resource_checked",
+                kind=kind,
+                name=name,
+                namespace=namespace,
+                status="missing",
+                duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            )
+            if fail_fast:
+                stopped_early = True
+                break
             continue
 
-        helm_data = extract_relevant_data(resource, ignorable_keys, no_cal_file)
-        live_data = extract_relevant_data(live_resource, ignorable_keys, no_cal_file)
+        defaulted = server_defaults.get((kind, name)) if server_defaults else None
+        if defaulted is not None:
+            manifest_data = extract_relevant_data(resource, None, ignore_rules={})
+            helm_data = extract_relevant_data(defaulted, None, ignore_rules={})
+            live_data = extract_relevant_data(live_resource, None, ignore_rules={})
+            if ignorable_keys is not None:
+                helm_data = strip_defaults(kind, manifest_data, helm_data)
+                live_data = strip_defaults(kind, manifest_data, live_data)
+        else:
+            helm_data = extract_relevant_data(resource, ignorable_keys, ignore_rules)
+            live_data = extract_relevant_data(
+                live_resource, ignorable_keys, ignore_rules
+            )
+            if ignorable_keys is not None:
+                live_data = strip_defaults(kind, helm_data, live_data)
 
-        diff = detect_drift(helm_data, live_data)
-        drift_logs.append(handle_drift_diff(diff, kind, name))
+        if structured_values:
+            helm_data = expand_embedded_documents(helm_data)
+            live_data = expand_embedded_documents(live_data)
 
-        helm_key_values = extract_deepest_keys_values(helm_data)
-        live_key_values = extract_deepest_keys_values(live_data)
+        tree_diff = diff_trees(helm_data, live_data)
+        new_keys = tree_diff.new_keys
+        removed_keys = tree_diff.removed_keys
+        modified_keys = tree_diff.modified_keys
 
-        new_keys, removed_keys, modified_keys = extract_drift_keys(
-            helm_key_values, live_key_values
-        )
+        if render_diff:
+            diff = detect_drift(helm_data, live_data, kind) if tree_diff else []
+            drift_logs.append(handle_drift_diff(diff, kind, name))
+        else:
+            drift_count = len(new_keys) + len(removed_keys) + len(modified_keys)
+            drift_logs.append(handle_drift_result(drift_count, kind, name))
 
+        drifts = len(new_keys) + len(removed_keys) + len(modified_keys)
         total_new_keys += len(new_keys)
         total_removed_keys += len(removed_keys)
         total_modified_keys += len(modified_keys)
-        total_drifts += len(new_keys) + len(removed_keys) + len(modified_keys)
+        total_drifts += drifts
 
         drift_reports.extend(
             generate_drift_report(
@@ -110,12 +201,30 @@ def compare_values(
                 new_keys,
                 removed_keys,
                 modified_keys,
-                helm_key_values,
-                live_key_values,
+                tree_diff.old,
+                tree_diff.new,
             )
         )
 
-    return {
+        log_event(
+            "resource_checked",
+            kind=kind,
+            name=name,
+            namespace=namespace,
+            status="drifted" if drifts else "in_sync",
+            drifts=drifts,
+            new_keys=len(new_keys),
+            removed_keys=len(removed_keys),
+            modified_keys=len(modified_keys),
+            keys=count_leaves(helm_data) if event_log_enabled() else None,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+        if fail_fast and drifts:
+            stopped_early = True
+            break
+
+    drift_meta = {
         "drift_logs": drift_logs,
         "drift_reports": drift_reports,
         "drift_summary": {
@@ -123,8 +232,12 @@ def compare_values(
             "new_keys": total_new_keys,
             "removed_keys": total_removed_keys,
             "modified_keys": total_modified_keys,
+            "unchecked_resources": unchecked_resources,
         },
     }
+    if stopped_early:
+        drift_meta["stopped_early"] = True
+    return drift_meta
 
 
 def get_resource_info(resource: Dict[str, Any]) -> tuple:
@@ -171,6 +284,27 @@ def handle_missing_resource(kind: str, name: str) -> str:
     return message
 
 
+def handle_unchecked_resource(kind: str, name: str, error: Exception) -> str:
+    """
+    Handles the case where the resource could not be fetched from Kubernetes.
+
+    Unlike a missing resource, this is not reported as drift: the API server
+    was throttling or unavailable, so the resource state is unknown.
+
+    Args:
+        kind (str): The Kubernetes resource kind.
+        name (str): The Kubernetes resource name.
+        error (Exception): The cluster error.
+
+    Returns:
+        str: The log message.
+    """
+
+    message = f"⚠️ Could not check {kind} `{name}`: {error}\n"
+    logger.warning(message)
+    return message
+
+
 def handle_drift_diff(diff: list, kind: str, name: str) -> str:
     """
     Handles and logs the drift diff results.
@@ -194,50 +328,83 @@ def handle_drift_diff(diff: list, kind: str, name: str) -> str:
         return message
 
 
-def detect_drift(helm_data: Dict[str, Any], live_data: Dict[str, Any]) -> List[str]:
+def handle_drift_result(drift_count: int, kind: str, name: str) -> str:
+    """
+    Handles and logs the structural drift result without rendering a diff.
+
+    Args:
+        drift_count (int): The number of drifted keys.
+        kind (str): The Kubernetes resource kind.
+        name (str): The Kubernetes resource name.
+
+    Returns:
+        str: The drift message.
+    """
+
+    if drift_count:
+        message = (
+            f"❌ Drift detected in {kind} `{name}`: {drift_count} key(s) drifted. "
+            f"Use `helm-inspect show --resource {kind}/{name}` to view the diff.\n"
+        )
+        logger.error(message)
+        return message
+    else:
+        message = f"✅ No drift detected in {kind} `{name}`.\n"
+        logger.info(message)
+        return message
+
+
+def detect_drift(
+    helm_data: Dict[str, Any], live_data: Dict[str, Any], kind: Optional[str] = None
+) -> List[str]:
     """
     Compares Helm data and live data to find drift.
 
+    Secret values are replaced by their digest (see `redact_values`), so
+    the diff shows which keys changed without printing their content.
+
     Args:
         helm_data (Dict[str, Any]): The Helm data.
         live_data (Dict[str, Any]): The live data.
+        kind (str, optional): The Kubernetes resource kind.
 
     Returns:
         List[str]: A list of drift messages.
     """
 
-    helm_json = json.dumps(helm_data, indent=2, sort_keys=True)
-    live_json = json.dumps(live_data, indent=2, sort_keys=True)
+    if kind == "Secret":
+        helm_data, live_data = redact_values(helm_data), redact_values(live_data)
 
-    return list(
-        difflib.unified_diff(
-            helm_json.splitlines(),
-            live_json.splitlines(),
-            fromfile="Helm Manifest",
-            tofile="Live Kubernetes",
-        )
+    helm_json = codec.dumps_text(helm_data, indent=True, sort_keys=True, default=str)
+    live_json = codec.dumps_text(live_data, indent=True, sort_keys=True, default=str)
+
+    return diff_texts(
+        helm_json, live_json, fromfile="Helm Manifest", tofile="Live Kubernetes"
     )
 
 
 def extract_drift_keys(
-    helm_key_values: Dict[str, Any], live_key_values: Dict[str, Any]
+    helm_key_values: Mapping[str, Any], live_key_values: Mapping[str, Any]
 ) -> tuple:
     """
     Extracts new, removed, and modified keys between Helm and live data.
 
     Args:
-        helm_key_values (Dict[str, Any]): The Helm key values.
-        live_key_values (Dict[str, Any]): The live key values.
+        helm_key_values (Mapping[str, Any]): The flattened Helm key values.
+        live_key_values (Mapping[str, Any]): The flattened live key values.
 
     Returns:
         tuple: A tuple containing new, removed, and modified keys.
     """
 
-    new_keys = set(live_key_values.keys()) - set(helm_key_values.keys())
-    removed_keys = set(helm_key_values.keys()) - set(live_key_values.keys())
+    helm_keys = helm_key_values.keys()
+    live_keys = live_key_values.keys()
+
+    new_keys = set(live_keys - helm_keys)
+    removed_keys = set(helm_keys - live_keys)
     modified_keys = {
         key
-        for key in helm_key_values.keys() & live_key_values.keys()
+        for key in helm_keys & live_keys
         if helm_key_values[key] != live_key_values[key]
     }
 
@@ -250,20 +417,25 @@ def generate_drift_report(
     new_keys: set,
     removed_keys: set,
     modified_keys: set,
-    helm_key_values: dict,
-    live_key_values: dict,
+    helm_key_values: Mapping[str, Any],
+    live_key_values: Mapping[str, Any],
 ) -> list:
     """
     Generates drift reports for new, removed, and modified keys.
 
+    Secret values and values larger than `LEAF_DIGEST_BYTES` are reported
+    by digest and size; see `report_value`.
+
     Args:
         kind (str): The Kubernetes resource kind.
         name (str): The Kubernetes resource name.
         new_keys (set): The new keys.
         removed_keys (set): The removed keys.
         modified_keys (set): The modified keys.
-        helm_key_values (dict): The Helm key values.
-        live_key_values (dict): The live key values.
+        helm_key_values (Mapping[str, Any]): The Helm values, at least of the
+            modified keys.
+        live_key_values (Mapping[str, Any]): The live values, at least of the
+            modified keys.
 
     Returns:
         list: A list of drift reports.
@@ -289,8 +461,8 @@ def generate_drift_report(
                 "drift_type": "value_modified",
                 "change": {
                     "key": key,
-                    "old_value": helm_key_values[key],
-                    "new_value": live_key_values[key],
+                    "old_value": report_value(kind, helm_key_values[key]),
+                    "new_value": report_value(kind, live_key_values[key]),
                 },
             }
         )
@@ -299,7 +471,15 @@ def generate_drift_report(
 
 
 def check_drift(
-    release: str, namespace: str, ignorable_keys: List[str], no_cal_file: bool = False
+    release: str,
+    namespace: str,
+    ignorable_keys: List[str],
+    render_diff: bool = False,
+    helm_manifest: Optional[List[Dict[str, Any]]] = None,
+    structured_values: bool = False,
+    fail_fast: bool = False,
+    ignore_rules: Optional[Dict[str, Set[str]]] = None,
+    server_defaults: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None,
 ) -> dict:
     """
     Checks for drift between Helm manifest and live Kubernetes resources.
@@ -307,14 +487,24 @@ def check_drift(
     Args:
         release (str): The Helm release name.
         namespace (str): The Kubernetes namespace.
-        ignorable_keys (List[str]): The keys to ignore during comparison.
-        no_cal_file (bool): Flag to disable calibration file.
+        ignorable_keys (List[str]): The keys to ignore during comparison, None for a
+            strict comparison that also keeps fields defaulted by the API server.
+        render_diff (bool): Flag to render and log the unified diff of each resource.
+        helm_manifest (List[Dict[str, Any]], optional): A manifest retrieved in bulk
+            (see `get_helm_releases`), fetched from Helm when not provided.
+        structured_values (bool): Flag to compare JSON/YAML string values structurally.
+        fail_fast (bool): Flag to stop at the first drifted or missing resource.
+        ignore_rules (Dict[str, Set[str]], optional): `ignorable_keys` already
+            compiled by `compile_ignorable_keys`.
+        server_defaults (Dict[Tuple[str, str], Dict[str, Any]], optional): The
+            manifest objects defaulted by the API server (see `get_server_defaults`).
 
     Returns:
         dict: A dictionary containing drift logs, reports, and summary.
     """
 
-    helm_manifest = get_helm_manifest(release, namespace)
+    if helm_manifest is None:
+        helm_manifest = get_helm_manifest(release, namespace)
 
     if not helm_manifest:
         message = (
@@ -329,15 +519,149 @@ def check_drift(
                 "new_keys": 0,
                 "removed_keys": 0,
                 "modified_keys": 0,
+                "unchecked_resources": 0,
             },
         }
 
-    return compare_values(helm_manifest, namespace, ignorable_keys, no_cal_file)
+    started = time.perf_counter()
+    drift_meta = compare_values(
+        helm_manifest,
+        namespace,
+        ignorable_keys,
+        render_diff=render_diff,
+        structured_values=structured_values,
+        fail_fast=fail_fast,
+        ignore_rules=ignore_rules,
+        server_defaults=server_defaults,
+    )
+    log_event(
+        "release_checked",
+        release=release,
+        namespace=namespace,
+        resources=len(helm_manifest),
+        duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        **drift_meta["drift_summary"],
+    )
+    return drift_meta
+
+
+def get_server_defaults(
+    helm_manifest: List[Dict[str, Any]], namespace: str
+) -> Optional[Dict[Tuple[str, str], Dict[str, Any]]]:
+    """
+    Default the objects of a Helm manifest on the API server, in one dry run.
+
+    Comparing defaulted objects with the live ones leaves out the fields set
+    by the API server and mutating admission webhooks, which otherwise have
+    to be calibrated away. See `dry_run_resources`. Services pinning an
+    allocated cluster IP or node port are left out, since the API server
+    would reject them and the whole dry run with them; see
+    `pins_allocated_ports`.
+
+    Args:
+        helm_manifest (List[Dict[str, Any]]): The Helm manifest.
+        namespace (str): The Kubernetes namespace.
+
+    Returns:
+        Dict[Tuple[str, str], Dict[str, Any]] or None: The defaulted objects of
+        the `DRY_RUN_KINDS` by (kind, name), None if the dry run failed.
+
+    Raises:
+        ClusterError: If cluster calls were cancelled.
+    """
+
+    resources = [
+        resource
+        for resource in helm_manifest
+        if resource and resource.get("kind") in DRY_RUN_KINDS
+    ]
+    for resource in [r for r in resources if pins_allocated_ports(r)]:
+        logger.debug(
+            "Leaving Service `%s` out of the server-side dry run: it pins a "
+            "cluster IP or node port.",
+            get_resource_info(resource)[1],
+        )
+        resources.remove(resource)
+
+    try:
+        server_defaults = dry_run_resources(resources, namespace)
+    except ClusterError as e:
+        if e.reason == CANCELLED:
+            raise
+        logger.debug(f"Server-side dry run failed: {e}")
+        server_defaults = None
+
+    if server_defaults is None and resources:
+        logger.warning(
+            "⚠️ Server-side dry run failed, falling back to calibration data."
+        )
+    return server_defaults
+
+
+def show_drift(
+    release: str,
+    namespace: str,
+    resources: List[tuple],
+    ignorable_keys: List[str],
+    structured_values: bool = False,
+) -> List[str]:
+    """
+    Renders the unified diff of selected resources on demand.
+
+    Args:
+        release (str): The Helm release name.
+        namespace (str): The Kubernetes namespace.
+        resources (List[tuple]): The (kind, name) pairs to render.
+        ignorable_keys (List[str]): The keys to ignore during comparison, None for a
+            strict comparison that also keeps fields defaulted by the API server.
+        structured_values (bool): Flag to compare JSON/YAML string values structurally.
+
+    Returns:
+        List[str]: The drift message of each rendered resource.
+    """
+
+    wanted = {(kind.lower(), name) for kind, name in resources}
+    ignore_rules = compile_ignorable_keys(ignorable_keys)
+    messages = []
+
+    for resource in get_helm_manifest(release, namespace):
+        if not resource:
+            continue
+
+        kind, name = get_resource_info(resource)
+        if (kind.lower(), name) not in wanted:
+            continue
+        wanted.discard((kind.lower(), name))
+
+        live_resource = get_k8s_resource(kind, name, namespace)
+        if not live_resource:
+            messages.append(handle_missing_resource(kind, name))
+            continue
+
+        helm_data = extract_relevant_data(resource, ignorable_keys, ignore_rules)
+        live_data = extract_relevant_data(live_resource, ignorable_keys, ignore_rules)
+        if ignorable_keys is not None:
+            live_data = strip_defaults(kind, helm_data, live_data)
+
+        if structured_values:
+            helm_data = expand_embedded_documents(helm_data)
+            live_data = expand_embedded_documents(live_data)
+
+        messages.append(
+            handle_drift_diff(detect_drift(helm_data, live_data, kind), kind, name)
+        )
+
+    for kind, name in sorted(wanted):
+        message = f"Resource {kind} `{name}` is not part of release `{release}`.\n"
+        logger.warning(message)
+        messages.append(message)
+
+    return messages
 
 
 def extract_deepest_keys_values(data: Any, parent_key: str = "") -> Dict[str, Any]:
     """
-    Recursively extracts only the deepest keys and their corresponding values
+    Extracts only the deepest keys and their corresponding values
     from a nested dictionary or list.
 
     Args:
@@ -347,40 +671,18 @@ def extract_deepest_keys_values(data: Any, parent_key: str = "") -> Dict[str, An
     Returns:
         Dict[str, Any]: A dictionary mapping the deepest keys to their values.
     """
-    result = {}
-
-    if isinstance(data, dict):
-        is_deepest = True
-        for key, value in data.items():
-            full_key = f"{parent_key}.{key}" if parent_key else key
-            sub_result = extract_deepest_keys_values(value, full_key)
-            if sub_result:
-                result.update(sub_result)
-                is_deepest = False
-        if is_deepest:
-            result[parent_key] = data
-
-    elif isinstance(data, list):
-        is_deepest = True
-        for index, item in enumerate(data):
-            full_key = f"{parent_key}[{index}]" if parent_key else f"[{index}]"
-            sub_result = extract_deepest_keys_values(item, full_key)
-            if sub_result:
-                result.update(sub_result)
-                is_deepest = False
-        if is_deepest:
-            result[parent_key] = data
-
-    else:
-        result[parent_key] = data
 
-    return result
+    return dict(flatten(data, parent_key).items())
 
 
 def get_ignorable_keys(release: str, namespace: str) -> List[str]:
     """
     Gets the keys that can be ignored during drift comparison.
 
+    Fields the API server defaults (see `strip_defaults`) are already left
+    out of every non-strict comparison, so only the remaining differences
+    (e.g. fields set by controllers or webhooks) are recorded.
+
     Args:
         release (str): The Helm release name.
         namespace (str): The Kubernetes namespace.
@@ -388,18 +690,39 @@ def get_ignorable_keys(release: str, namespace: str) -> List[str]:
     Returns:
         List[str]: A list of ignorable keys.
     """
-    helm_manifest = get_helm_manifest(release, namespace)
-    ignorable_keys = set()
-    resource_count = 0
+
+    resource_keys = calibrate_resources(
+        get_helm_manifest(release, namespace), namespace
+    )
+    return sorted({key for keys in resource_keys.values() for key in keys})
+
+
+def calibrate_resources(
+    resources: List[Dict[str, Any]], namespace: str
+) -> Dict[str, List[str]]:
+    """
+    Gets the ignorable keys of each supported resource of a manifest.
+
+    Args:
+        resources (List[Dict[str, Any]]): The Helm manifest resources to calibrate.
+        namespace (str): The Kubernetes namespace.
+
+    Returns:
+        Dict[str, List[str]]: The ignorable keys of every resource found in
+        the cluster, keyed by `Kind;name`.
+    """
+
+    resource_keys = {}
 
     logger.info("🔍 Starting Analysis for calibration... \n\n")
 
-    for resource in helm_manifest:
+    for resource in resources:
         if not resource:
             continue
 
-        kind = resource.get("kind", "Unknown")
-        name = resource.get("metadata", {}).get("name", "Unknown")
+        kind, name = get_resource_info(resource)
+        if not is_supported_resource(kind):
+            continue
 
         logger.info(f"Checking drift for {kind} `{name}`...")
 
@@ -408,32 +731,23 @@ def get_ignorable_keys(release: str, namespace: str) -> List[str]:
             logger.warning(f"Resource {kind} `{name}` not found during calibration")
             continue
 
-        helm_key_values = extract_deepest_keys_values(
-            extract_relevant_data(resource, None)
-        )
-        live_key_values = extract_deepest_keys_values(
-            extract_relevant_data(live_resource, None)
+        helm_data = extract_relevant_data(resource, None)
+        live_data = strip_defaults(
+            kind, helm_data, extract_relevant_data(live_resource, None)
         )
+        tree_diff = diff_trees(helm_data, live_data)
 
-        helm_key_values = {
-            f"{kind};{name};{key}": value for key, value in helm_key_values.items()
-        }
-        live_key_values = {
-            f"{kind};{name};{key}": value for key, value in live_key_values.items()
-        }
-
-        ignorable_keys.update(
-            set(helm_key_values.keys()).symmetric_difference(
-                set(live_key_values.keys())
-            )
+        resource_keys[f"{kind};{name}"] = sorted(
+            f"{kind};{name};{key}"
+            for key in tree_diff.new_keys | tree_diff.removed_keys
         )
-        resource_count += 1
 
+    key_count = sum(len(keys) for keys in resource_keys.values())
     logger.info(
-        f"\n\nAnalyzed {resource_count} resources and found {len(ignorable_keys)} drift-prone keys.\n"
+        f"\n\nAnalyzed {len(resource_keys)} resources and found {key_count} drift-prone keys.\n"
     )
 
-    return list(ignorable_keys)
+    return resource_keys
 
 
 def remove_nested_keys(data: Any, keys_to_ignore: Set[str]) -> Any:
@@ -503,8 +817,35 @@ def remove_nested_keys(data: Any, keys_to_ignore: Set[str]) -> Any:
     return data
 
 
+def compile_ignorable_keys(ignorable_keys: List[str]) -> Dict[str, Set[str]]:
+    """
+    Group ignorable keys by resource kind, dropping the kind and name prefix.
+
+    Args:
+        ignorable_keys (List[str]): The keys to ignore.
+
+    Returns:
+        Dict[str, Set[str]]: The key paths to ignore for every supported kind,
+        empty when no key is ignored.
+    """
+
+    if not ignorable_keys:
+        return {}
+
+    rules: Dict[str, Set[str]] = {kind: set() for kind in SUPPORTED_KINDS}
+
+    for key in ignorable_keys:
+        parts = key.split(";", 2)
+        if parts[0] in rules and len(parts) > 2:
+            rules[parts[0]].add(parts[2])
+
+    return rules
+
+
 def extract_relevant_data(
-    resource: Dict[str, Any], ignorable_keys: List[str], no_cal_file: bool = False
+    resource: Dict[str, Any],
+    ignorable_keys: List[str],
+    ignore_rules: Optional[Dict[str, Set[str]]] = None,
 ) -> Dict[str, Any]:
     """
     Extracts relevant data from a Kubernetes resource.
@@ -512,32 +853,26 @@ def extract_relevant_data(
     Args:
         resource (Dict[str, Any]): The Kubernetes resource.
         ignorable_keys (List[str]): The keys to ignore.
-        no_cal_file (bool): Flag to disable calibration file.
+        ignore_rules (Dict[str, Set[str]], optional): The keys to ignore as
+            compiled by `compile_ignorable_keys`, used instead of compiling
+            `ignorable_keys` again.
 
     Returns:
-        Dict[str, Any]: The extracted data.
+        Dict[str, Any]: A copy of the extracted data, which the caller may
+        modify; the resource itself may be shared with the caches.
     """
     kind = resource.get("kind", "Unknown")
     data = resource.get("data", {})
     spec = resource.get("spec", {})
 
-    if not ignorable_keys:
-        return data if kind in ["ConfigMap", "Secret"] else spec
-
-    kind_ignorable_keys = {}
-    split_num = 1 if no_cal_file else 2
+    if ignore_rules is None:
+        ignore_rules = compile_ignorable_keys(ignorable_keys)
 
-    for resource_kind in SUPPORTED_KINDS:
-        kind_ignorable_keys[resource_kind] = [
-            key.split(";", split_num)[split_num]
-            for key in ignorable_keys
-            if key.startswith(f"{resource_kind};")
-        ]
+    relevant = data if kind in ["ConfigMap", "Secret"] else spec
+    if not ignore_rules:
+        return copy.deepcopy(relevant)
 
-    if kind in kind_ignorable_keys:
-        keys_to_ignore = set(kind_ignorable_keys[kind])
-        if kind in ["ConfigMap", "Secret"]:
-            return remove_nested_keys(data, keys_to_ignore)
-        return remove_nested_keys(spec, keys_to_ignore)
+    if kind in ignore_rules:
+        return remove_nested_keys(copy.deepcopy(relevant), ignore_rules[kind])
 
-    return resource
+    return copy.deepcopy(resource)
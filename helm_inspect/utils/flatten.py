@@ -0,0 +1,271 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Set, Tuple
+
+_PATH_CACHE: Dict[Tuple[str, Any], str] = {}
+"""
+Cache of interned child paths, keyed by (parent path, segment).
+"""
+
+_PATH_CACHE_LIMIT = 200_000
+"""
+Maximum number of entries kept in the path cache before it is reset.
+"""
+
+
+def intern_path(parent: str, segment: Any) -> str:
+    """
+    Build the flattened path of a child node and intern it.
+
+    Dictionary keys are joined with a dot and list indexes are appended
+    in brackets, e.g. `template.spec.containers[0].image`.
+
+    Args:
+        parent (str): The flattened path of the parent node.
+        segment (Any): The dictionary key (str) or list index (int).
+
+    Returns:
+        str: The interned flattened path of the child.
+    """
+
+    cache_key = (parent, segment)
+    path = _PATH_CACHE.get(cache_key)
+    if path is not None:
+        return path
+
+    if isinstance(segment, int):
+        path = f"{parent}[{segment}]"
+    else:
+        path = f"{parent}.{segment}" if parent else str(segment)
+
+    if len(_PATH_CACHE) >= _PATH_CACHE_LIMIT:
+        _PATH_CACHE.clear()
+
+    path = sys.intern(path)
+    _PATH_CACHE[cache_key] = path
+    return path
+
+
+def get_field(data: Any, path: str) -> Any:
+    """
+    Get the value of a dotted path of nested dictionaries.
+
+    Args:
+        data (Any): The data.
+        path (str): The path, e.g. `template.spec.containers`.
+
+    Returns:
+        Any: The value, None if the path is not set.
+    """
+
+    for segment in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(segment)
+    return data
+
+
+class Leaf:
+    """
+    A single flattened leaf: its interned path and its value.
+    """
+
+    __slots__ = ("path", "value")
+
+    def __init__(self, path: str, value: Any):
+        self.path = path
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Leaf({self.path!r}, {self.value!r})"
+
+
+class FlatResource(Mapping):
+    """
+    Read-only mapping of flattened paths to leaf values.
+
+    Leaves are stored as slot records and paths are interned, so the same
+    path string is shared by every resource and run in the process.
+    """
+
+    __slots__ = ("_leaves",)
+
+    def __init__(self, leaves: Dict[str, Leaf]):
+        self._leaves = leaves
+
+    def __getitem__(self, path: str) -> Any:
+        return self._leaves[path].value
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._leaves
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._leaves)
+
+    def __len__(self) -> int:
+        return len(self._leaves)
+
+    def keys(self):
+        return self._leaves.keys()
+
+    def leaves(self) -> Iterator[Leaf]:
+        """
+        Iterate over the leaf records.
+
+        Returns:
+            Iterator[Leaf]: The leaf records in traversal order.
+        """
+
+        return iter(self._leaves.values())
+
+
+def flatten(data: Any, parent_key: str = "") -> FlatResource:
+    """
+    Flatten nested data down to its deepest keys without recursion.
+
+    Empty dictionaries and lists are kept as leaves, matching the
+    behaviour of `extract_deepest_keys_values`.
+
+    Args:
+        data (Any): The data to flatten.
+        parent_key (str): The path to prefix to every flattened key.
+
+    Returns:
+        FlatResource: The flattened leaves.
+    """
+
+    leaves: Dict[str, Leaf] = {}
+    stack = [(sys.intern(parent_key), data)]
+
+    while stack:
+        path, value = stack.pop()
+
+        if isinstance(value, dict) and value:
+            children = [
+                (intern_path(path, str(key)), item) for key, item in value.items()
+            ]
+        elif isinstance(value, list) and value:
+            children = [(intern_path(path, i), item) for i, item in enumerate(value)]
+        else:
+            leaves[path] = Leaf(path, value)
+            continue
+
+        stack.extend(reversed(children))
+
+    return FlatResource(leaves)
+
+
+def count_leaves(data: Any) -> int:
+    """
+    Count the leaves `flatten` would produce, without building them.
+
+    Args:
+        data (Any): The data.
+
+    Returns:
+        int: The number of leaves.
+    """
+
+    count = 0
+    stack = [data]
+
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict) and value:
+            stack.extend(value.values())
+        elif isinstance(value, list) and value:
+            stack.extend(value)
+        else:
+            count += 1
+
+    return count
+
+
+class TreeDiff:
+    """
+    Drifted leaf paths of two trees and the values of the modified ones.
+    """
+
+    __slots__ = ("new_keys", "removed_keys", "modified_keys", "old", "new")
+
+    def __init__(self):
+        self.new_keys: Set[str] = set()
+        self.removed_keys: Set[str] = set()
+        self.modified_keys: Set[str] = set()
+        self.old: Dict[str, Any] = {}
+        self.new: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.new_keys) + len(self.removed_keys) + len(self.modified_keys)
+
+
+def diff_trees(old: Any, new: Any, parent_key: str = "") -> TreeDiff:
+    """
+    Find the leaves that differ between two trees, descending only into
+    subtrees that differ.
+
+    Equal subtrees are skipped after a single deep equality check, which
+    runs in C, so the Python-level work scales with the amount of drift
+    rather than with the size of the trees. The result matches comparing
+    `flatten(old)` and `flatten(new)` key by key.
+
+    Args:
+        old (Any): The expected tree (e.g. the Helm side).
+        new (Any): The actual tree (e.g. the live side).
+        parent_key (str): The path to prefix to every key.
+
+    Returns:
+        TreeDiff: The new, removed and modified leaf paths.
+    """
+
+    diff = TreeDiff()
+    stack = [(sys.intern(parent_key), old, new)]
+
+    while stack:
+        path, a, b = stack.pop()
+        if a == b:
+            continue
+
+        if isinstance(a, dict) and isinstance(b, dict) and a and b:
+            for key, value in a.items():
+                child = intern_path(path, str(key))
+                if key in b:
+                    stack.append((child, value, b[key]))
+                else:
+                    diff.removed_keys.update(flatten(value, child).keys())
+            for key, value in b.items():
+                if key not in a:
+                    diff.new_keys.update(
+                        flatten(value, intern_path(path, str(key))).keys()
+                    )
+            continue
+
+        if isinstance(a, list) and isinstance(b, list) and a and b:
+            for i in range(max(len(a), len(b))):
+                child = intern_path(path, i)
+                if i >= len(b):
+                    diff.removed_keys.update(flatten(a[i], child).keys())
+                elif i >= len(a):
+                    diff.new_keys.update(flatten(b[i], child).keys())
+                else:
+                    stack.append((child, a[i], b[i]))
+            continue
+
+        old_leaves, new_leaves = flatten(a, path), flatten(b, path)
+        diff.removed_keys.update(old_leaves.keys() - new_leaves.keys())
+        diff.new_keys.update(new_leaves.keys() - old_leaves.keys())
+        for key in old_leaves.keys() & new_leaves.keys():
+            if old_leaves[key] != new_leaves[key]:
+                diff.modified_keys.add(key)
+                diff.old[key] = old_leaves[key]
+                diff.new[key] = new_leaves[key]
+
+    return diff
@@ -0,0 +1,239 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import heapq
+import re
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from helm_inspect.utils.constant import HOT_KEYS_CAPACITY
+
+_INDEX_PATTERN = re.compile(r"\[\d+\]")
+
+
+class SpaceSaving:
+    """
+    Space-saving heavy-hitter counter.
+
+    Counts at most `capacity` items. When a new item arrives and the counter
+    is full, the item with the lowest count is replaced and the new one
+    inherits that count as its error, so any item counted more than
+    `total / capacity` times is guaranteed to be kept, and reported counts
+    overestimate the true count by at most the recorded error.
+    """
+
+    def __init__(self, capacity: int = HOT_KEYS_CAPACITY):
+        self.capacity = max(1, capacity)
+        self.total = 0
+        self._counts: Dict[Hashable, List[int]] = {}
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _push(self, item: Hashable, count: int) -> None:
+        self._sequence += 1
+        heapq.heappush(self._heap, (count, self._sequence, item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [
+                (entry[0], index, key)
+                for index, (key, entry) in enumerate(self._counts.items())
+            ]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[Hashable, int]:
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            entry = self._counts.get(item)
+            if entry is not None and entry[0] == count:
+                del self._counts[item]
+                return item, count
+
+    def add(self, item: Hashable, count: int = 1, error: int = 0) -> None:
+        """
+        Count an item.
+
+        Args:
+            item (Hashable): The item.
+            count (int): The number of occurrences.
+            error (int): The overestimation already carried by `count`.
+        """
+
+        self.total += count
+        entry = self._counts.get(item)
+        if entry is None:
+            if len(self._counts) >= self.capacity:
+                _, floor = self._pop_min()
+                count, error = count + floor, error + floor
+            entry = self._counts[item] = [0, error]
+        else:
+            entry[1] += error
+        entry[0] += count
+        self._push(item, entry[0])
+
+    def top(self, n: int) -> List[Tuple[Hashable, int, int]]:
+        """
+        Get the most counted items.
+
+        Args:
+            n (int): The number of items.
+
+        Returns:
+            List[Tuple[Hashable, int, int]]: The items with their count and error.
+        """
+
+        return [
+            (item, count, error)
+            for item, (count, error) in heapq.nlargest(
+                n, self._counts.items(), key=lambda entry: entry[1][0]
+            )
+        ]
+
+
+class DriftAggregator:
+    """
+    Fleet-wide counts of drifting keys and resources, fed release by release.
+
+    Keys are counted per kind and path, with list indexes folded into `[*]`
+    so the same field of different containers or ports adds up; resources
+    are counted per cluster, namespace, kind and name. Both counters are
+    space-saving counters, so memory stays constant however many releases
+    are scanned and the drift reports never need to be reloaded.
+    """
+
+    def __init__(self, capacity: int = HOT_KEYS_CAPACITY):
+        self.keys = SpaceSaving(capacity)
+        self.resources = SpaceSaving(capacity)
+        self.releases = 0
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        drift_reports: Iterable[Dict[str, Any]],
+        cluster: str,
+        namespace: str,
+    ) -> None:
+        """
+        Count the drift reports of a release, as returned by `generate_drift_report`.
+
+        Args:
+            drift_reports (Iterable[Dict[str, Any]]): The drift reports.
+            cluster (str): The cluster name.
+            namespace (str): The release namespace.
+        """
+
+        with self._lock:
+            self.releases += 1
+            for report in drift_reports:
+                change = report["change"]
+                key = change["key"] if isinstance(change, dict) else change
+                self.keys.add((report["kind"], _INDEX_PATTERN.sub("[*]", key)))
+                self.resources.add((cluster, namespace, report["kind"], report["name"]))
+
+    def merge(self, hot_spots: Optional[Dict[str, Any]]) -> None:
+        """
+        Add the counts of a saved summary, e.g. from another shard or cluster.
+
+        The summary only lists the top entries, so the drift total is taken
+        from the saved `drifts` rather than added up from them.
+
+        Args:
+            hot_spots (Dict[str, Any], optional): A summary built by `summary`.
+        """
+
+        if not hot_spots:
+            return
+
+        with self._lock:
+            self.releases += hot_spots.get("releases", 0)
+            for entry in hot_spots.get("keys", []):
+                self.keys.add(
+                    (entry["kind"], entry["path"]), entry["drifts"], entry["error"]
+                )
+            for entry in hot_spots.get("resources", []):
+                self.resources.add(
+                    (
+                        entry["cluster"],
+                        entry["namespace"],
+                        entry["kind"],
+                        entry["name"],
+                    ),
+                    entry["drifts"],
+                    entry["error"],
+                )
+
+            drifts = hot_spots.get("drifts", 0)
+            self.keys.total += drifts - sum(
+                e["drifts"] for e in hot_spots.get("keys", [])
+            )
+            self.resources.total += drifts - sum(
+                e["drifts"] for e in hot_spots.get("resources", [])
+            )
+
+    def summary(self, n: int) -> Dict[str, Any]:
+        """
+        Get the most drifting keys and resources.
+
+        Args:
+            n (int): The number of keys and resources to report.
+
+        Returns:
+            Dict[str, Any]: The top keys and resources with their drift count
+                and the count's maximum overestimation (`error`).
+        """
+
+        with self._lock:
+            return {
+                "releases": self.releases,
+                "drifts": self.keys.total,
+                "keys": [
+                    {"kind": kind, "path": path, "drifts": count, "error": error}
+                    for (kind, path), count, error in self.keys.top(n)
+                ],
+                "resources": [
+                    {
+                        "cluster": cluster,
+                        "namespace": namespace,
+                        "kind": kind,
+                        "name": name,
+                        "drifts": count,
+                        "error": error,
+                    }
+                    for (cluster, namespace, kind, name), count, error in (
+                        self.resources.top(n)
+                    )
+                ],
+            }
+
+
+def format_hot_spots(hot_spots: Dict[str, Any], n: int = 5) -> str:
+    """
+    Render the most drifting keys and resources for the console summary.
+
+    Args:
+        hot_spots (Dict[str, Any]): A summary built by `DriftAggregator.summary`.
+        n (int): The number of keys and resources to render.
+
+    Returns:
+        str: The rendered lines, empty if nothing drifted.
+    """
+
+    if not hot_spots or not hot_spots.get("keys"):
+        return ""
+
+    lines = [" • Most Drifting Keys:\n"]
+    for entry in hot_spots["keys"][:n]:
+        lines.append(f"   {entry['drifts']: >6}  {entry['kind']} {entry['path']}\n")
+    lines.append("\n • Most Drifting Resources:\n")
+    for entry in hot_spots["resources"][:n]:
+        lines.append(
+            f"   {entry['drifts']: >6}  {entry['cluster']}/{entry['namespace']} "
+            f"{entry['kind']}/{entry['name']}\n"
+        )
+    return "".join(lines) + "\n"
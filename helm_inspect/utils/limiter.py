@@ -0,0 +1,340 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+from helm_inspect.utils.constant import (
+    CLUSTER_CONCURRENCY_INITIAL,
+    CLUSTER_CONCURRENCY_MAX,
+    CLUSTER_TARGET_LATENCY,
+)
+
+NOT_FOUND = "not_found"
+THROTTLED = "throttled"
+UNAVAILABLE = "unavailable"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+_SERVER_REASONS = {
+    "NotFound": NOT_FOUND,
+    "TooManyRequests": THROTTLED,
+    "ServiceUnavailable": UNAVAILABLE,
+    "InternalError": UNAVAILABLE,
+    "Timeout": UNAVAILABLE,
+    "ServerTimeout": UNAVAILABLE,
+}
+"""
+Failure of each reason reported by the API server, as in
+`Error from server (NotFound): ...`.
+"""
+
+_SERVER_REASON = re.compile(r"Error from server \((\w+)\)")
+
+_FAILURE_PATTERNS = [
+    (
+        THROTTLED,
+        re.compile(r"TooManyRequests|too many requests|\b429\b|rate limit", re.I),
+    ),
+    (
+        UNAVAILABLE,
+        re.compile(
+            r"ServiceUnavailable|InternalError|Bad Gateway|Gateway Timeout|"
+            r"\b50[0234]\b|timeout|timed out|deadline exceeded|"
+            r"connection refused|connection reset|Unable to connect|unexpected EOF",
+            re.I,
+        ),
+    ),
+    (NOT_FOUND, re.compile(r"NotFound|not found", re.I)),
+]
+
+
+class ClusterError(Exception):
+    """
+    A cluster call failed for a reason other than the object not existing.
+    """
+
+    def __init__(self, message: str, reason: str = FAILED):
+        super().__init__(message)
+        self.reason = reason
+
+
+def classify_failure(stderr: str) -> str:
+    """
+    Classify the failure of a `kubectl` or `helm` call from its error output.
+
+    The reason the API server gives takes precedence, so object names such as
+    `api-500` or `tls-429` in its message are not mistaken for status codes.
+
+    Args:
+        stderr (str): The error output of the command.
+
+    Returns:
+        str: One of `throttled`, `unavailable`, `not_found` or `failed`.
+    """
+
+    match = _SERVER_REASON.search(stderr or "")
+    if match:
+        return _SERVER_REASONS.get(match.group(1), FAILED)
+
+    for reason, pattern in _FAILURE_PATTERNS:
+        if pattern.search(stderr or ""):
+            return reason
+    return FAILED
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter for calls to the API server.
+
+    The number of calls allowed in flight grows additively while latency
+    stays under the target and is cut multiplicatively on throttling,
+    server errors or timeouts, so the scan runs at the highest throughput
+    the API server currently tolerates.
+    """
+
+    def __init__(
+        self,
+        initial: int = CLUSTER_CONCURRENCY_INITIAL,
+        minimum: int = 1,
+        maximum: int = CLUSTER_CONCURRENCY_MAX,
+        target_latency: float = CLUSTER_TARGET_LATENCY,
+        backoff: float = 0.5,
+    ):
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.target_latency = target_latency
+        self.backoff = backoff
+        self.limit = float(min(max(initial, minimum), self.maximum))
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """
+        Wait until a call may be started.
+        """
+
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def try_acquire(self) -> bool:
+        """
+        Start a call only if the limit allows it right away.
+
+        Returns:
+            bool: True if the call may be started.
+        """
+
+        with self._condition:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """
+        Finish a call and adapt the limit.
+
+        Args:
+            latency (float): The duration of the call in seconds.
+            overloaded (bool): Whether the call was throttled, failed with a
+                server error or timed out.
+        """
+
+        with self._condition:
+            self.in_flight -= 1
+            if overloaded:
+                self.limit = max(self.minimum, self.limit * self.backoff)
+            elif latency <= self.target_latency:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            elif latency > self.target_latency * 2:
+                self.limit = max(self.minimum, self.limit * 0.9)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """
+        Run a call within the limit, timing it on the way out.
+
+        The yielded dict accepts an `overloaded` flag to report throttling.
+        """
+
+        self.acquire()
+        started = time.monotonic()
+        feedback = {"overloaded": False}
+        try:
+            yield feedback
+        finally:
+            self.release(time.monotonic() - started, feedback["overloaded"])
+
+
+cluster_limiter = AdaptiveLimiter()
+"""
+Limiter shared by every cluster call of the process.
+"""
+
+
+class LatencyTracker:
+    """
+    Recent latencies of successful cluster calls, to decide when to hedge.
+    """
+
+    def __init__(self, size: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: "deque[float]" = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+
+    def percentile(self, q: float = 0.95) -> Optional[float]:
+        """
+        Get a percentile of the recent latencies.
+
+        Args:
+            q (float): The percentile, between 0 and 1.
+
+        Returns:
+            float or None: The latency in seconds, None until enough calls ran.
+        """
+
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+cluster_latency = LatencyTracker()
+"""
+Latencies of the cluster calls of the process.
+"""
+
+_timed_out = threading.Event()
+_timeout_reason = ""
+_scope = threading.local()
+
+
+class CancelToken:
+    """
+    Cancellation of the cluster calls of one run, e.g. one scan.
+
+    Cancelling a token stops the calls made under it (see `cancel_scope`)
+    and leaves the other runs of the process alone. Every token is also
+    cancelled once the process run times out (see `set_run_timeout`).
+    """
+
+    def __init__(self):
+        self.reason = ""
+        self._event = threading.Event()
+
+    def cancel(self, reason: str) -> None:
+        """
+        Cancel the in-flight and future cluster calls of the run.
+
+        Args:
+            reason (str): Why the calls are cancelled, reported in `ClusterError`.
+        """
+
+        self.reason = reason
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._event.is_set() or _timed_out.is_set()
+
+    def check(self) -> None:
+        """
+        Raise if the calls of the run were cancelled.
+
+        Raises:
+            ClusterError: With the `cancelled` reason.
+        """
+
+        if _timed_out.is_set():
+            raise ClusterError(_timeout_reason, CANCELLED)
+        if self._event.is_set():
+            raise ClusterError(self.reason or "Cluster calls cancelled", CANCELLED)
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleep, waking up early if the calls of the run are cancelled.
+
+        Args:
+            seconds (float): The sleep duration.
+        """
+
+        deadline = time.monotonic() + seconds
+        while not self.is_cancelled():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._event.wait(min(remaining, 0.2))
+
+
+@contextmanager
+def cancel_scope(token: CancelToken):
+    """
+    Make a token the cancellation of the cluster calls of the current thread.
+
+    Args:
+        token (CancelToken): The token of the run.
+    """
+
+    previous = getattr(_scope, "token", None)
+    _scope.token = token
+    try:
+        yield token
+    finally:
+        _scope.token = previous
+
+
+def current_cancel_token() -> CancelToken:
+    """
+    Get the cancellation of the cluster calls of the current thread.
+
+    Returns:
+        CancelToken: The token of the enclosing `cancel_scope`, or a token
+        that is only cancelled when the process run times out.
+    """
+
+    token = getattr(_scope, "token", None)
+    return token if token is not None else CancelToken()
+
+
+def _time_out_run(reason: str) -> None:
+    global _timeout_reason
+    _timeout_reason = reason
+    _timed_out.set()
+
+
+def set_run_timeout(seconds: float) -> threading.Timer:
+    """
+    Cancel every cluster call of the process once the run exceeds a time limit.
+
+    Args:
+        seconds (float): The time limit of the run.
+
+    Returns:
+        threading.Timer: The started timer.
+    """
+
+    timer = threading.Timer(
+        seconds,
+        _time_out_run,
+        args=(f"Run timed out after {seconds:g}s",),
+    )
+    timer.daemon = True
+    timer.start()
+    return timer
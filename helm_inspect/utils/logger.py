@@ -6,14 +6,116 @@
 
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+LOGGER_NAME = "helm-inspect"
+EVENT_LOGGER_NAME = "helm-inspect.events"
+
+_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The stock `QueueHandler` formats every record in the calling thread;
+    this one enqueues the record untouched, so the scan loop only pays for
+    building the record, never for rendering or writing it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Render an event record as one JSON object per line.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        # The codec logs through this module, so it is imported on first use.
+        from helm_inspect.utils import codec
+
+        event = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "event": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        return codec.dumps_text(event, default=str)
+
+
+class _ListenerHandler(logging.Handler):
+    """
+    Dispatch queued records to the console or event log handler.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.console = logging.StreamHandler(sys.stdout)
+        self.console.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+        self.events: Optional[logging.Handler] = None
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if record.name == EVENT_LOGGER_NAME:
+            if self.events is not None:
+                self.events.handle(record)
+        else:
+            self.console.handle(record)
+        return True
+
+    def close(self) -> None:
+        if self.events is not None:
+            self.events.close()
+        super().close()
+
+
+def _start_listener() -> _ListenerHandler:
+    """
+    Start the background thread that formats and writes every record.
+
+    Returns:
+        _ListenerHandler: The handler the listener dispatches records to.
+    """
+
+    global _listener
+
+    if _listener is None:
+        target = _ListenerHandler()
+        _listener = logging.handlers.QueueListener(_log_queue, target)
+        _listener.start()
+        atexit.register(stop_logging)
+
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.addHandler(DeferredQueueHandler(_log_queue))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        events = logging.getLogger(EVENT_LOGGER_NAME)
+        events.addHandler(DeferredQueueHandler(_log_queue))
+        events.setLevel(logging.CRITICAL + 1)
+        events.propagate = False
+
+    return _listener.handlers[0]
 
 
 def setup_logger(verbose: bool = False) -> logging.Logger:
     """
     Setup logger for the application.
 
+    Records are handed to a background thread through a queue, so logging
+    never blocks on terminal or file I/O. Safe to call from every module;
+    only the first call installs the handlers.
+
     Args:
         verbose (bool): Enable verbose logging (debug mode).
 
@@ -21,9 +123,93 @@ def setup_logger(verbose: bool = False) -> logging.Logger:
         logging.Logger: Logger object.
     """
 
-    logging.basicConfig(
-        level=logging.DEBUG if verbose else logging.INFO,
-        format="[%(levelname)s] %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
-    return logging.getLogger("helm-inspect")
+    with _lock:
+        _start_listener()
+
+    logger = logging.getLogger(LOGGER_NAME)
+    if verbose:
+        logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def setup_event_log(path: str) -> None:
+    """
+    Write structured events (one JSON object per line) to a file.
+
+    Args:
+        path (str): The event log path, `-` for standard error.
+    """
+
+    with _lock:
+        target = _start_listener()
+        handler = (
+            logging.StreamHandler(sys.stderr)
+            if path == "-"
+            else logging.FileHandler(path, encoding="utf-8")
+        )
+        handler.setFormatter(JsonFormatter())
+        target.events = handler
+        logging.getLogger(EVENT_LOGGER_NAME).setLevel(logging.INFO)
+
+
+def event_log_enabled() -> bool:
+    """
+    Check whether structured events are being recorded.
+
+    Returns:
+        bool: True if an event log is configured.
+    """
+
+    return logging.getLogger(EVENT_LOGGER_NAME).isEnabledFor(logging.INFO)
+
+
+def log_event(event: str, **fields: Any) -> None:
+    """
+    Record a structured event, if an event log is configured.
+
+    Args:
+        event (str): The event name.
+        **fields: The event fields, serialized to JSON by the listener thread.
+    """
+
+    events = logging.getLogger(EVENT_LOGGER_NAME)
+    if events.isEnabledFor(logging.INFO):
+        events.info(event, extra={"fields": fields})
+
+
+def stop_logging() -> None:
+    """
+    Flush every queued record and stop the background thread.
+    """
+
+    global _listener
+
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+            for name in (LOGGER_NAME, EVENT_LOGGER_NAME):
+                logger = logging.getLogger(name)
+                for handler in list(logger.handlers):
+                    if isinstance(handler, DeferredQueueHandler):
+                        logger.removeHandler(handler)
+
+
+@contextmanager
+def console_level(level: int):
+    """
+    Temporarily raise the minimum level logged by the application logger.
+
+    Args:
+        level (int): The logging level to apply within the context.
+    """
+
+    logger = logging.getLogger(LOGGER_NAME)
+    previous_level = logger.level
+    logger.setLevel(max(level, previous_level))
+    try:
+        yield logger
+    finally:
+        logger.setLevel(previous_level)
@@ -0,0 +1,302 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import copy
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from helm_inspect.utils.cluster import get_helm_manifest, get_k8s_projections
+from helm_inspect.utils.constant import QUICK_FULL_INTERVAL
+from helm_inspect.utils.defaults import strip_defaults
+from helm_inspect.utils.drift_check import (
+    check_drift,
+    compile_ignorable_keys,
+    get_resource_info,
+    remove_nested_keys,
+)
+from helm_inspect.utils.flatten import diff_trees, get_field
+from helm_inspect.utils.limiter import CANCELLED, ClusterError
+from helm_inspect.utils.logger import log_event, setup_logger
+
+logger = setup_logger()
+
+QUICK_FIELDS: Dict[str, List[str]] = {
+    "Deployment": [
+        "replicas",
+        "template.spec.containers",
+        "template.spec.initContainers",
+    ],
+    "Service": ["ports"],
+}
+"""
+The high-signal `spec` fields compared by the quick tier, per kind.
+"""
+
+CONTAINER_FIELDS = ("name", "image", "env", "envFrom", "resources")
+"""
+The container fields compared by the quick tier.
+"""
+
+
+def quick_paths() -> List[str]:
+    """
+    Get every field path of `QUICK_FIELDS`, once.
+
+    Returns:
+        List[str]: The field paths.
+    """
+
+    return list(
+        dict.fromkeys(path for paths in QUICK_FIELDS.values() for path in paths)
+    )
+
+
+def nest_quick_fields(kind: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild the part of a `spec` covered by the quick tier from its fields.
+
+    Containers keep only `CONTAINER_FIELDS`, so the result compares (and is
+    calibrated and defaulted) like the full `spec`.
+
+    Args:
+        kind (str): The Kubernetes resource kind.
+        fields (Dict[str, Any]): The field values by path.
+
+    Returns:
+        Dict[str, Any]: The partial `spec`.
+    """
+
+    spec: Dict[str, Any] = {}
+    for path in QUICK_FIELDS.get(kind, []):
+        value = fields.get(path)
+        if value is None:
+            continue
+        if path.rsplit(".", 1)[-1] in ("containers", "initContainers") and (
+            isinstance(value, list)
+        ):
+            value = [
+                {k: v for k, v in container.items() if k in CONTAINER_FIELDS}
+                for container in value
+                if isinstance(container, dict)
+            ]
+
+        *parents, leaf = path.split(".")
+        current = spec
+        for segment in parents:
+            current = current.setdefault(segment, {})
+        current[leaf] = copy.deepcopy(value)
+    return spec
+
+
+def quick_check(
+    helm_manifest: List[Dict[str, Any]],
+    namespace: str,
+    ignorable_keys: Optional[List[str]],
+    ignore_rules: Optional[Dict[str, Set[str]]] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Compare the `QUICK_FIELDS` of a release with the live objects.
+
+    The fields of every object are fetched in a single call; see
+    `get_k8s_projections`.
+
+    Args:
+        helm_manifest (List[Dict[str, Any]]): The Helm manifest.
+        namespace (str): The Kubernetes namespace.
+        ignorable_keys (List[str]): The keys to ignore during comparison, None for a
+            strict comparison that also keeps fields defaulted by the API server.
+        ignore_rules (Dict[str, Set[str]], optional): `ignorable_keys` already
+            compiled by `compile_ignorable_keys`.
+
+    Returns:
+        List[Tuple[str, str]]: The (kind, name) of the drifted or missing resources.
+
+    Raises:
+        ClusterError: If the objects cannot be fetched or calls were cancelled.
+    """
+
+    if ignore_rules is None:
+        ignore_rules = compile_ignorable_keys(ignorable_keys)
+
+    targets = [
+        (*get_resource_info(resource), resource)
+        for resource in helm_manifest
+        if resource and resource.get("kind") in QUICK_FIELDS
+    ]
+    live = get_k8s_projections(
+        [(kind, name) for kind, name, _ in targets], namespace, quick_paths()
+    )
+
+    flagged = []
+    for kind, name, resource in targets:
+        if (kind, name) not in live:
+            flagged.append((kind, name))
+            continue
+
+        spec = resource.get("spec", {})
+        helm_data = nest_quick_fields(
+            kind, {path: get_field(spec, path) for path in QUICK_FIELDS[kind]}
+        )
+        live_data = nest_quick_fields(kind, live[(kind, name)])
+
+        if ignore_rules.get(kind):
+            helm_data = remove_nested_keys(helm_data, ignore_rules[kind])
+            live_data = remove_nested_keys(live_data, ignore_rules[kind])
+        if ignorable_keys is not None:
+            live_data = strip_defaults(kind, helm_data, live_data)
+
+        if diff_trees(helm_data, live_data):
+            flagged.append((kind, name))
+
+    return flagged
+
+
+def full_check_reason(
+    previous: Optional[dict], revision: Optional[int] = None
+) -> Optional[str]:
+    """
+    Tell why the quick tier alone cannot vouch for a release.
+
+    Args:
+        previous (dict, optional): The drift data of the previous check.
+        revision (int, optional): The current Helm revision, when known.
+
+    Returns:
+        str or None: The reason to compare the full specs, None if the quick
+        tier is enough.
+    """
+
+    if not previous or not previous.get("full_checked_at"):
+        return "no previous full comparison"
+
+    try:
+        checked_at = datetime.fromisoformat(previous["full_checked_at"])
+    except (TypeError, ValueError):
+        return "no previous full comparison"
+    if (datetime.utcnow() - checked_at).total_seconds() >= QUICK_FULL_INTERVAL:
+        return f"last full comparison older than {QUICK_FULL_INTERVAL:g}s"
+
+    summary = previous.get("drift_summary", {})
+    if (
+        summary.get("total_drifts")
+        or summary.get("unchecked_resources")
+        or previous.get("stopped_early")
+    ):
+        return "drifted in the last comparison"
+
+    if revision is not None and str(previous.get("revision")) != str(revision):
+        return f"upgraded to revision {revision}"
+
+    return None
+
+
+def check_drift_quick(
+    release: str,
+    namespace: str,
+    ignorable_keys: Optional[List[str]],
+    helm_manifest: Optional[List[Dict[str, Any]]] = None,
+    previous: Optional[dict] = None,
+    revision: Optional[int] = None,
+    **kwargs: Any,
+) -> dict:
+    """
+    Check a release for drift, comparing the full specs only when needed.
+
+    The quick tier compares the `QUICK_FIELDS` (images, replicas, env,
+    resources and Service ports) of every object. The full comparison of
+    `check_drift` runs when the quick tier flags a resource, or when
+    `full_check_reason` gives a reason to. Otherwise the release is reported
+    in sync and the time of the last full comparison is carried over.
+
+    Args:
+        release (str): The Helm release name.
+        namespace (str): The Kubernetes namespace.
+        ignorable_keys (List[str]): The keys to ignore during comparison, None for a
+            strict comparison that also keeps fields defaulted by the API server.
+        helm_manifest (List[Dict[str, Any]], optional): The Helm manifest,
+            fetched from Helm when not provided.
+        previous (dict, optional): The drift data of the previous check.
+        revision (int, optional): The current Helm revision, when known.
+        **kwargs: Passed on to `check_drift`.
+
+    Returns:
+        dict: The drift data, with the `tier` that produced it (`quick` or
+        `full`) and the time of the last full comparison.
+
+    Raises:
+        ClusterError: If cluster calls were cancelled.
+    """
+
+    if helm_manifest is None:
+        helm_manifest = get_helm_manifest(release, namespace)
+
+    reason = full_check_reason(previous, revision) if helm_manifest else "no manifest"
+    started = time.perf_counter()
+
+    if reason is None:
+        try:
+            flagged = quick_check(
+                helm_manifest,
+                namespace,
+                ignorable_keys,
+                kwargs.get("ignore_rules"),
+            )
+        except ClusterError as e:
+            if e.reason == CANCELLED:
+                raise
+            reason = f"quick tier failed ({e.reason})"
+        else:
+            if flagged:
+                reason = "flagged " + ", ".join(f"{k} `{n}`" for k, n in flagged)
+
+    if reason is None:
+        message = (
+            f"⚡ No drift in the images, replicas, env, resources or Service ports "
+            f"of `{release}`; full comparison skipped.\n"
+        )
+        logger.info(message)
+        log_event(
+            "release_checked",
+            release=release,
+            namespace=namespace,
+            resources=len(helm_manifest),
+            tier="quick",
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+        drift_meta = {
+            "drift_logs": [message],
+            "drift_reports": [],
+            "drift_summary": {
+                "total_drifts": 0,
+                "new_keys": 0,
+                "removed_keys": 0,
+                "modified_keys": 0,
+                "unchecked_resources": 0,
+            },
+            "tier": "quick",
+            "full_checked_at": previous["full_checked_at"],
+        }
+        if previous.get("revision") is not None:
+            drift_meta["revision"] = previous["revision"]
+        return drift_meta
+
+    logger.info(f"🔍 Comparing the full specs of `{release}`: {reason}.\n")
+    full_checked_at = datetime.utcnow().isoformat()
+    drift_meta = check_drift(
+        release,
+        namespace,
+        ignorable_keys,
+        helm_manifest=helm_manifest,
+        **kwargs,
+    )
+    drift_meta["tier"] = "full"
+    drift_meta["full_checked_at"] = full_checked_at
+    if revision is not None:
+        drift_meta["revision"] = revision
+    return drift_meta
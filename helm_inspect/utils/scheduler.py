@@ -0,0 +1,379 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import argparse
+import queue
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from helm_inspect.utils.constant import DRIFT_DIR, TMP_DIR
+from helm_inspect.utils.limiter import (
+    CANCELLED,
+    ClusterError,
+    CancelToken,
+    cancel_scope,
+)
+from helm_inspect.utils.logger import setup_logger
+from helm_inspect.utils.sharding import shard_suffix
+from helm_inspect.utils.storage import read_json, write_json
+
+logger = setup_logger()
+
+
+def parse_duration(value: str) -> float:
+    """
+    Parse a duration such as `90`, `45s`, `15m`, `1h` or `7d` into seconds.
+
+    Args:
+        value (str): The duration.
+
+    Returns:
+        float: The duration in seconds.
+
+    Raises:
+        ValueError: If the duration is not valid.
+    """
+
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", value)
+    if not match:
+        raise ValueError(f"Invalid duration: {value}")
+
+    amount, unit = match.groups()
+    return float(amount) * {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}[unit]
+
+
+def duration_type(value: str) -> float:
+    """
+    Parse a duration command line argument; see `parse_duration`.
+
+    Args:
+        value (str): The duration.
+
+    Returns:
+        float: The duration in seconds.
+
+    Raises:
+        argparse.ArgumentTypeError: If the duration is not valid.
+    """
+
+    try:
+        return parse_duration(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def release_key(release: Dict[str, Any]) -> str:
+    """
+    Get the state key of a release.
+
+    Args:
+        release (Dict[str, Any]): The release information.
+
+    Returns:
+        str: The key as `namespace/name`.
+    """
+
+    return f"{release['namespace']}/{release['name']}"
+
+
+def get_scan_state(cluster: str, shard: Optional[Tuple[int, int]] = None) -> dict:
+    """
+    Retrieve the per-release state of previous fleet scans.
+
+    Args:
+        cluster (str): The cluster name.
+        shard (Tuple[int, int], optional): The shard index and count.
+
+    Returns:
+        dict: The scan state, empty if no scan ran before.
+    """
+
+    try:
+        state = read_json(TMP_DIR, f"scan_state_{cluster}{shard_suffix(shard)}.json")
+        if state is not None:
+            return state
+    except (ValueError, OSError) as e:
+        logger.error(f"Failed to read scan state file: {e}")
+    return {"releases": {}}
+
+
+def save_scan_state(
+    state: dict, cluster: str, shard: Optional[Tuple[int, int]] = None
+) -> None:
+    """
+    Save the per-release state of fleet scans.
+
+    Args:
+        state (dict): The scan state.
+        cluster (str): The cluster name.
+        shard (Tuple[int, int], optional): The shard index and count.
+    """
+
+    try:
+        write_json(TMP_DIR, f"scan_state_{cluster}{shard_suffix(shard)}.json", state)
+    except (OSError, RuntimeError) as e:
+        logger.error(f"Failed to save scan state file: {e}")
+
+
+def prioritize_releases(
+    releases: List[Dict[str, Any]], state: dict
+) -> List[Dict[str, Any]]:
+    """
+    Order releases so the most valuable ones are checked first.
+
+    Releases upgraded since their last scan come first, then releases that
+    drifted last time, then the ones scanned least recently (never scanned
+    first). Ties are broken largest first, which packs the time budget better.
+
+    Args:
+        releases (List[Dict[str, Any]]): The releases to scan.
+        state (dict): The scan state of previous runs.
+
+    Returns:
+        List[Dict[str, Any]]: The releases in scan order.
+    """
+
+    previous = state.get("releases", {})
+
+    def priority(release: Dict[str, Any]) -> tuple:
+        last = previous.get(release_key(release), {})
+        upgraded = str(last.get("revision")) != str(release.get("revision"))
+        drifting = last.get("drifts", 0) > 0
+        size = len(release.get("manifest") or []) or last.get("resources", 0)
+        return (not upgraded, not drifting, last.get("last_scan", ""), -size)
+
+    return sorted(releases, key=priority)
+
+
+def run_scheduled_scan(
+    releases: List[Dict[str, Any]],
+    scan_release: Callable[[Dict[str, Any]], dict],
+    deadline: Optional[float] = None,
+    workers: int = 4,
+    fail_fast: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Scan releases in order with a bounded number of workers and a time budget.
+
+    No release is started once the deadline has passed; the cluster calls of
+    releases still in flight are cancelled, those releases are recorded as
+    incomplete and the rest as skipped. With `fail_fast`, the same happens as
+    soon as a release is found drifting. Cancellation applies to the cluster
+    calls of this scan only (see `CancelToken`).
+
+    Args:
+        releases (List[Dict[str, Any]]): The releases in scan order.
+        scan_release (Callable[[Dict[str, Any]], dict]): Scans one release and
+            returns its drift data.
+        deadline (float, optional): The time budget in seconds.
+        workers (int): The maximum number of releases scanned concurrently.
+        fail_fast (bool): Flag to stop the scan at the first drifting release.
+
+    Returns:
+        List[Dict[str, Any]]: The outcome of every release, in scan order.
+    """
+
+    cancel = CancelToken()
+    deadline_at = time.monotonic() + deadline if deadline else None
+    results: "queue.Queue[tuple]" = queue.Queue()
+    outcomes: Dict[str, Dict[str, Any]] = {}
+    in_flight: Dict[str, float] = {}
+    pending = list(releases)
+
+    def worker(release: Dict[str, Any]) -> None:
+        try:
+            with cancel_scope(cancel):
+                drift_meta = scan_release(release)
+            results.put((release, "complete", drift_meta, None))
+        except ClusterError as e:
+            status = "incomplete" if e.reason == CANCELLED else "failed"
+            results.put((release, status, None, str(e)))
+        except Exception as e:
+            results.put((release, "failed", None, str(e)))
+
+    while pending or in_flight:
+        while (
+            pending
+            and len(in_flight) < max(1, workers)
+            and (deadline_at is None or time.monotonic() < deadline_at)
+            and not cancel.is_cancelled()
+        ):
+            release = pending.pop(0)
+            in_flight[release_key(release)] = time.monotonic()
+            threading.Thread(target=worker, args=(release,), daemon=True).start()
+
+        if not in_flight:
+            break
+
+        timeout = None if deadline_at is None else deadline_at - time.monotonic()
+        try:
+            release, status, drift_meta, error = results.get(
+                timeout=max(0, timeout) if timeout is not None else None
+            )
+        except queue.Empty:
+            cancel.cancel("Scan deadline reached")
+            logger.warning("⚠️ Deadline reached, cancelling the scan.")
+            break
+
+        key = release_key(release)
+        outcomes[key] = {
+            "status": status,
+            "duration": round(time.monotonic() - in_flight.pop(key), 3),
+            "drift_meta": drift_meta,
+            "error": error,
+        }
+
+        if (
+            fail_fast
+            and status == "complete"
+            and not cancel.is_cancelled()
+            and (
+                drift_meta["drift_summary"]["total_drifts"]
+                or drift_meta.get("stopped_early")
+            )
+        ):
+            cancel.cancel("Drift found, failing fast")
+            logger.warning(f"⚠️ Drift found in {key}, cancelling the scan.")
+
+    for key in in_flight:
+        outcomes[key] = {"status": "incomplete"}
+    for release in pending:
+        outcomes[release_key(release)] = {"status": "skipped"}
+
+    incomplete = sum(1 for o in outcomes.values() if o["status"] == "incomplete")
+    if incomplete or pending:
+        logger.warning(
+            f"⚠️ Scan stopped early: {incomplete} release(s) incomplete, "
+            f"{len(pending)} release(s) skipped."
+        )
+
+    return [
+        {**release, **outcomes.get(release_key(release), {"status": "skipped"})}
+        for release in releases
+    ]
+
+
+def update_scan_state(
+    state: dict, outcomes: List[Dict[str, Any]], scanned_at: str
+) -> dict:
+    """
+    Record completed scans in the scan state.
+
+    Args:
+        state (dict): The scan state of previous runs.
+        outcomes (List[Dict[str, Any]]): The outcome of every release.
+        scanned_at (str): The ISO timestamp of the scan.
+
+    Returns:
+        dict: The updated scan state.
+    """
+
+    releases = state.setdefault("releases", {})
+
+    for outcome in outcomes:
+        if outcome["status"] != "complete":
+            continue
+        summary = outcome["drift_meta"]["drift_summary"]
+        releases[release_key(outcome)] = {
+            "last_scan": scanned_at,
+            "revision": outcome.get("revision"),
+            "drifts": summary["total_drifts"],
+            "resources": outcome.get("resources", 0),
+            "duration": outcome["duration"],
+        }
+
+    return state
+
+
+def build_fleet_summary(
+    outcomes: List[Dict[str, Any]],
+    cluster: str,
+    started: datetime,
+    shard: Optional[Tuple[int, int]] = None,
+    hot_spots: Optional[Dict[str, Any]] = None,
+) -> dict:
+    """
+    Build the fleet summary of a scheduled scan.
+
+    Args:
+        outcomes (List[Dict[str, Any]]): The outcome of every release.
+        cluster (str): The cluster name.
+        started (datetime): The start of the scan.
+        shard (Tuple[int, int], optional): The shard index and count.
+        hot_spots (Dict[str, Any], optional): The most drifting keys and
+            resources; see `DriftAggregator.summary`.
+
+    Returns:
+        dict: The fleet summary.
+    """
+
+    releases = []
+    counts = {"complete": 0, "failed": 0, "incomplete": 0, "skipped": 0}
+    total_drifts = 0
+
+    for outcome in outcomes:
+        counts[outcome["status"]] += 1
+        entry = {
+            "release": outcome["name"],
+            "namespace": outcome["namespace"],
+            "revision": outcome.get("revision"),
+            "status": outcome["status"],
+        }
+        if outcome["status"] == "complete":
+            entry["drift_summary"] = outcome["drift_meta"]["drift_summary"]
+            entry["duration"] = outcome["duration"]
+            total_drifts += entry["drift_summary"]["total_drifts"]
+        elif outcome["status"] == "failed":
+            entry["error"] = outcome["error"]
+        releases.append(entry)
+
+    return {
+        "cluster": cluster,
+        "shard": f"{shard[0]}/{shard[1]}" if shard else None,
+        "started": started.isoformat(),
+        "finished": datetime.utcnow().isoformat(),
+        "releases": releases,
+        "summary": {
+            "releases": len(outcomes),
+            **counts,
+            "drifting_releases": sum(
+                1
+                for entry in releases
+                if entry.get("drift_summary", {}).get("total_drifts", 0) > 0
+            ),
+            "total_drifts": total_drifts,
+        },
+        "hot_spots": hot_spots,
+    }
+
+
+def save_fleet_summary(
+    summary: dict, cluster: str, shard: Optional[Tuple[int, int]] = None
+) -> None:
+    """
+    Save the fleet summary of a scheduled scan.
+
+    Each shard writes its own summary so shards never overwrite each other;
+    `helm-inspect merge` combines them into one fleet report.
+
+    Args:
+        summary (dict): The fleet summary.
+        cluster (str): The cluster name.
+        shard (Tuple[int, int], optional): The shard index and count.
+    """
+
+    try:
+        write_json(
+            DRIFT_DIR, f"fleet_summary_{cluster}{shard_suffix(shard)}.json", summary
+        )
+        logger.info("✅ Fleet summary saved successfully.")
+    except (OSError, RuntimeError) as e:
+        logger.error(f"Failed to save fleet summary file: {e}")
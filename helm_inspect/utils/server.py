@@ -0,0 +1,372 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import itertools
+import queue
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from helm_inspect.utils import codec
+from helm_inspect.utils.cache import (
+    cache_stats,
+    enable_namespace_index,
+    enable_warm_caches,
+)
+from helm_inspect.utils.calibration import calibrate_system, save_drift_data
+from helm_inspect.utils.cli import detect_fleet_drift, resolve_ignorable_keys
+from helm_inspect.utils.cluster import get_helm_manifest
+from helm_inspect.utils.drift_check import check_drift
+from helm_inspect.utils.constant import NAMESPACE_CACHE_MAX_BYTES, NAMESPACE_CACHE_TTL
+from helm_inspect.utils.logger import setup_logger
+
+logger = setup_logger()
+
+JOB_HISTORY = 200
+"""
+Number of finished jobs kept in memory.
+"""
+
+
+class DriftService:
+    """
+    Long-lived drift service backing `helm-inspect serve`.
+
+    Jobs (release checks, calibrations and fleet scans) run one at a time
+    from an internal queue; the latest result of every release is kept in
+    memory so it can be served without touching the cluster.
+    """
+
+    def __init__(
+        self,
+        cluster_name: str,
+        namespace: Optional[str] = None,
+        no_ignore: bool = False,
+        workers: int = 4,
+        structured_values: bool = False,
+        interval: Optional[float] = None,
+    ):
+        self.cluster_name = cluster_name
+        self.namespace = namespace
+        self.no_ignore = no_ignore
+        self.workers = workers
+        self.structured_values = structured_values
+        self.interval = interval
+        self.started = datetime.utcnow()
+
+        self.results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """
+        Start the job worker and, with an interval, the periodic scans.
+        """
+
+        threading.Thread(target=self._work, daemon=True).start()
+        if self.interval:
+            threading.Thread(target=self._schedule, daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def submit(self, job_type: str, **params: Any) -> Dict[str, Any]:
+        """
+        Queue a job, or return the identical job already queued.
+
+        Args:
+            job_type (str): `check`, `calibrate` or `scan`.
+            **params: The job parameters.
+
+        Returns:
+            Dict[str, Any]: The job.
+        """
+
+        with self._lock:
+            for job in self.jobs.values():
+                if job["status"] == "queued" and (job["type"], job["params"]) == (
+                    job_type,
+                    params,
+                ):
+                    return dict(job)
+
+            job = {
+                "id": str(next(self._ids)),
+                "type": job_type,
+                "params": params,
+                "status": "queued",
+                "created": datetime.utcnow().isoformat(),
+            }
+            self.jobs[job["id"]] = job
+            finished = [
+                j for j in self.jobs.values() if j["status"] in ("done", "failed")
+            ]
+            for old in finished[: max(0, len(finished) - JOB_HISTORY)]:
+                del self.jobs[old["id"]]
+
+        self._queue.put(job)
+        return dict(job)
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            job = self._queue.get()
+            with self._lock:
+                job.update(status="running", started=datetime.utcnow().isoformat())
+            try:
+                update = {"result": self._run(job["type"], **job["params"])}
+                update["status"] = "done"
+            except Exception as e:
+                logger.error(f"❌ Job {job['id']} ({job['type']}) failed: {e}")
+                update = {"status": "failed", "error": str(e)}
+            with self._lock:
+                job.update(update, finished=datetime.utcnow().isoformat())
+
+    def _schedule(self) -> None:
+        while True:
+            self.submit("scan", namespace=self.namespace)
+            if self._stop.wait(self.interval):
+                return
+
+    def _run(self, job_type: str, **params: Any) -> Any:
+        if job_type == "check":
+            return self.check_release(params["release"], params["namespace"])
+        if job_type == "calibrate":
+            calibrate_system(params["release"], params["namespace"], self.cluster_name)
+            return None
+        if job_type == "scan":
+            fleet_summary = detect_fleet_drift(
+                params.get("namespace"),
+                self.cluster_name,
+                self.no_ignore,
+                workers=self.workers,
+                summary_only=True,
+                structured_values=self.structured_values,
+                on_complete=self._record_outcome,
+            )
+            return fleet_summary["summary"]
+        raise ValueError(f"Unknown job type: {job_type}")
+
+    def check_release(self, release: str, namespace: str) -> Dict[str, Any]:
+        """
+        Check a release for drift and keep the result in memory.
+
+        Args:
+            release (str): Helm release name.
+            namespace (str): Kubernetes namespace.
+
+        Returns:
+            Dict[str, Any]: The drift summary.
+        """
+
+        started = time.monotonic()
+        helm_manifest = get_helm_manifest(release, namespace)
+        ignorable_keys = resolve_ignorable_keys(
+            release, namespace, self.cluster_name, self.no_ignore, helm_manifest
+        )
+        drift_meta = check_drift(
+            release,
+            namespace,
+            ignorable_keys,
+            helm_manifest=helm_manifest,
+            structured_values=self.structured_values,
+        )
+        save_drift_data(drift_meta, release, namespace, self.cluster_name)
+        self._record(release, namespace, None, drift_meta, time.monotonic() - started)
+        return drift_meta["drift_summary"]
+
+    def _record_outcome(self, outcome: Dict[str, Any]) -> None:
+        self._record(
+            outcome["name"],
+            outcome["namespace"],
+            outcome.get("revision"),
+            outcome["drift_meta"],
+            outcome["duration"],
+        )
+
+    def _record(
+        self,
+        release: str,
+        namespace: str,
+        revision: Optional[Any],
+        drift_meta: dict,
+        duration: float,
+    ) -> None:
+        with self._lock:
+            self.results[(namespace, release)] = {
+                "release": release,
+                "namespace": namespace,
+                "revision": revision,
+                "checked": datetime.utcnow().isoformat(),
+                "duration": round(duration, 3),
+                "drift_summary": drift_meta["drift_summary"],
+                "drift_reports": drift_meta["drift_reports"],
+            }
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get the service status.
+
+        Returns:
+            Dict[str, Any]: Cluster, uptime, releases, queued jobs and cache statistics.
+        """
+
+        with self._lock:
+            return {
+                "cluster": self.cluster_name,
+                "started": self.started.isoformat(),
+                "releases": len(self.results),
+                "jobs": {
+                    status: sum(
+                        1 for job in self.jobs.values() if job["status"] == status
+                    )
+                    for status in ("queued", "running", "done", "failed")
+                },
+                "caches": cache_stats(),
+            }
+
+
+class DriftRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API of `helm-inspect serve`.
+
+        GET  /healthz
+        GET  /status
+        GET  /releases
+        GET  /releases/<namespace>/<release>
+        POST /releases/<namespace>/<release>/check
+        POST /releases/<namespace>/<release>/calibrate
+        POST /scan[?namespace=<namespace>]
+        GET  /jobs
+        GET  /jobs/<id>
+    """
+
+    service: DriftService
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status: int, body: Any) -> None:
+        data = codec.dumps(body, indent=True)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self) -> Tuple[list, Dict[str, list]]:
+        url = urlparse(self.path)
+        return [part for part in url.path.split("/") if part], parse_qs(url.query)
+
+    def do_GET(self) -> None:
+        parts, _ = self._route()
+        service = self.service
+
+        if parts == ["healthz"]:
+            return self._send(200, {"status": "ok"})
+        if parts == ["status"]:
+            return self._send(200, service.status())
+        if parts == ["releases"]:
+            with service._lock:
+                releases = [
+                    {k: v for k, v in result.items() if k != "drift_reports"}
+                    for _, result in sorted(service.results.items())
+                ]
+            return self._send(200, releases)
+        if len(parts) == 3 and parts[0] == "releases":
+            with service._lock:
+                result = service.results.get((parts[1], parts[2]))
+            if result is None:
+                return self._send(404, {"error": "No result for this release yet."})
+            return self._send(200, result)
+        if parts == ["jobs"]:
+            with service._lock:
+                jobs = [dict(job) for job in service.jobs.values()]
+            return self._send(200, sorted(jobs, key=lambda j: int(j["id"])))
+        if len(parts) == 2 and parts[0] == "jobs":
+            with service._lock:
+                job = service.jobs.get(parts[1])
+                job = dict(job) if job is not None else None
+            if job is None:
+                return self._send(404, {"error": "Unknown job."})
+            return self._send(200, job)
+
+        self._send(404, {"error": "Not found."})
+
+    def do_POST(self) -> None:
+        parts, query = self._route()
+        service = self.service
+
+        if (
+            len(parts) == 4
+            and parts[0] == "releases"
+            and parts[3] in ("check", "calibrate")
+        ):
+            job = service.submit(parts[3], release=parts[2], namespace=parts[1])
+            return self._send(202, job)
+        if parts == ["scan"]:
+            namespace = query.get("namespace", [service.namespace])[0]
+            return self._send(202, service.submit("scan", namespace=namespace))
+
+        self._send(404, {"error": "Not found."})
+
+
+def serve(
+    cluster_name: str,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    namespace: Optional[str] = None,
+    no_ignore: bool = False,
+    workers: int = 4,
+    structured_values: bool = False,
+    interval: Optional[float] = None,
+    cache_ttl: float = 30,
+) -> None:
+    """
+    Run the drift service until interrupted.
+
+    Args:
+        cluster_name (str): Kubernetes cluster name.
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+        namespace (str, optional): Namespace of periodic scans, defaults to all namespaces.
+        no_ignore (bool): Flag to disable key ignoring for strict drift detection.
+        workers (int): Number of releases scanned concurrently.
+        structured_values (bool): Flag to compare JSON/YAML string values structurally.
+        interval (float, optional): Seconds between periodic scans, none when not set.
+        cache_ttl (float): Time to live of cached live objects in seconds.
+    """
+
+    enable_warm_caches(cache_ttl)
+    enable_namespace_index(NAMESPACE_CACHE_TTL, NAMESPACE_CACHE_MAX_BYTES)
+
+    service = DriftService(
+        cluster_name, namespace, no_ignore, workers, structured_values, interval
+    )
+    service.start()
+
+    handler = type("Handler", (DriftRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+
+    logger.info(
+        f"✨ Serving drift results for {cluster_name} on http://{host}:{port}"
+        + (f", scanning every {interval:g}s.\n" if interval else ".\n")
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down.")
+    finally:
+        service.stop()
+        server.server_close()
@@ -0,0 +1,281 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import hashlib
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from helm_inspect.utils import codec
+from helm_inspect.utils.constant import DRIFT_DIR, HOT_KEYS_TOP
+from helm_inspect.utils.hotkeys import DriftAggregator
+from helm_inspect.utils.logger import setup_logger
+from helm_inspect.utils.storage import (
+    atomic_write,
+    iter_files,
+    read_json_file,
+    store_path,
+    write_json,
+)
+
+logger = setup_logger()
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification such as `0/4` (zero-based index / shard count).
+
+    Args:
+        value (str): The shard specification.
+
+    Returns:
+        Tuple[int, int]: The shard index and the shard count.
+
+    Raises:
+        ValueError: If the specification is not valid.
+    """
+
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", value)
+    if not match:
+        raise ValueError(f"Invalid shard: {value}, expected i/N")
+
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or index >= count:
+        raise ValueError(f"Invalid shard: {value}, expected 0 <= i < N")
+    return index, count
+
+
+def shard_suffix(shard: Optional[Tuple[int, int]]) -> str:
+    """
+    Get the file name suffix of a shard.
+
+    Args:
+        shard (Tuple[int, int], optional): The shard index and count.
+
+    Returns:
+        str: The suffix, empty when not sharded.
+    """
+
+    return f"_shard{shard[0]}of{shard[1]}" if shard else ""
+
+
+def assign_shard(cluster: str, namespace: str, release: str, count: int) -> int:
+    """
+    Assign a release to a shard with rendezvous (highest random weight) hashing.
+
+    The assignment depends only on the release identity and the shard count,
+    so adding or removing releases never moves other releases between
+    shards, and changing the count only moves about 1/N of them.
+
+    Args:
+        cluster (str): The cluster name.
+        namespace (str): The namespace of the release.
+        release (str): The release name.
+        count (int): The shard count.
+
+    Returns:
+        int: The zero-based shard index.
+    """
+
+    key = f"{cluster}/{namespace}/{release}"
+
+    def weight(index: int) -> bytes:
+        return hashlib.blake2b(f"{key}#{index}".encode(), digest_size=8).digest()
+
+    return max(range(count), key=weight)
+
+
+def select_shard(
+    releases: List[Dict[str, Any]], cluster: str, shard: Optional[Tuple[int, int]]
+) -> List[Dict[str, Any]]:
+    """
+    Keep the releases assigned to a shard.
+
+    Args:
+        releases (List[Dict[str, Any]]): The releases.
+        cluster (str): The cluster name.
+        shard (Tuple[int, int], optional): The shard index and count.
+
+    Returns:
+        List[Dict[str, Any]]: The releases of the shard, all of them when not sharded.
+    """
+
+    if not shard:
+        return releases
+
+    index, count = shard
+    return [
+        release
+        for release in releases
+        if assign_shard(cluster, release["namespace"], release["name"], count) == index
+    ]
+
+
+def get_fleet_summaries(cluster: Optional[str] = None) -> List[Tuple[Path, dict]]:
+    """
+    Retrieve the fleet summaries written by (possibly sharded) scans.
+
+    Args:
+        cluster (str, optional): Restrict to summaries of a cluster.
+
+    Returns:
+        List[Tuple[Path, dict]]: The summary files and their content.
+    """
+
+    summaries = []
+    for _, summary_file in sorted(iter_files(DRIFT_DIR, "fleet_summary_*.json")):
+        try:
+            summary = read_json_file(summary_file)
+        except (ValueError, OSError, RuntimeError) as e:
+            logger.error(f"Failed to read fleet summary {summary_file.name}: {e}")
+            continue
+
+        if cluster and summary.get("cluster") != cluster:
+            continue
+        summaries.append((summary_file, summary))
+
+    return summaries
+
+
+def current_summaries(summaries: List[Tuple[Path, dict]]) -> List[int]:
+    """
+    Find the summaries of the latest shard layout of each cluster.
+
+    The layout of a cluster is the shard count of its most recent summary;
+    within it, only the most recent summary of each shard index is kept.
+    Summaries of an older shard count or an older run of the same shard
+    are superseded, since they cover releases counted again by newer ones.
+
+    Args:
+        summaries (List[Tuple[Path, dict]]): The summary files and their content.
+
+    Returns:
+        List[int]: The positions in `summaries` of the summaries not superseded.
+    """
+
+    latest: Dict[Any, Tuple[int, Dict[int, int]]] = {}
+    for position in sorted(
+        range(len(summaries)),
+        key=lambda position: summaries[position][1].get("finished", ""),
+        reverse=True,
+    ):
+        summary = summaries[position][1]
+        index, count = parse_shard(summary.get("shard") or "0/1")
+        layout = latest.setdefault(summary.get("cluster"), (count, {}))
+        if layout[0] == count and index not in layout[1]:
+            layout[1][index] = position
+
+    return [position for _, shards in latest.values() for position in shards.values()]
+
+
+def merge_fleet_summaries(summaries: List[Tuple[Path, dict]]) -> dict:
+    """
+    Combine per-shard fleet summaries into one fleet report.
+
+    When a release appears in several summaries (e.g. after a shard count
+    change), the most recent complete result wins. The most drifting keys
+    and resources are added up over the summaries of the latest shard
+    layout only (see `current_summaries` and `DriftAggregator`), so a
+    release is never counted twice.
+
+    Args:
+        summaries (List[Tuple[Path, dict]]): The summary files and their content.
+
+    Returns:
+        dict: The fleet report.
+    """
+
+    releases: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    shards = []
+    hot_spots = DriftAggregator()
+    current = set(current_summaries(summaries))
+
+    for position in sorted(
+        range(len(summaries)),
+        key=lambda position: summaries[position][1].get("finished", ""),
+    ):
+        summary_file, summary = summaries[position]
+        cluster = summary.get("cluster")
+        shards.append(
+            {
+                "file": summary_file.name,
+                "cluster": cluster,
+                "shard": summary.get("shard"),
+                "started": summary.get("started"),
+                "finished": summary.get("finished"),
+                "releases": summary.get("summary", {}).get("releases", 0),
+                "superseded": position not in current,
+            }
+        )
+
+        if position in current:
+            hot_spots.merge(summary.get("hot_spots"))
+
+        for entry in summary.get("releases", []):
+            key = (cluster, entry["namespace"], entry["release"])
+            previous = releases.get(key)
+            if previous and previous["status"] == "complete" != entry["status"]:
+                continue
+            releases[key] = {"cluster": cluster, **entry}
+
+    counts = {"complete": 0, "failed": 0, "incomplete": 0, "skipped": 0}
+    total_drifts = drifting = 0
+    for entry in releases.values():
+        counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        drifts = entry.get("drift_summary", {}).get("total_drifts", 0)
+        total_drifts += drifts
+        drifting += drifts > 0
+        if entry["status"] == "complete":
+            entry[
+                "drift_file"
+            ] = f"drift_{entry['release']}_{entry['namespace']}_{entry['cluster']}.json"
+
+    return {
+        "generated": datetime.utcnow().isoformat(),
+        "shards": shards,
+        "releases": sorted(
+            releases.values(),
+            key=lambda entry: (entry["cluster"], entry["namespace"], entry["release"]),
+        ),
+        "summary": {
+            "clusters": len({entry["cluster"] for entry in releases.values()}),
+            "releases": len(releases),
+            **counts,
+            "drifting_releases": drifting,
+            "total_drifts": total_drifts,
+        },
+        "hot_spots": hot_spots.summary(HOT_KEYS_TOP),
+    }
+
+
+def save_fleet_report(report: dict, output: Optional[Path] = None) -> Path:
+    """
+    Save a merged fleet report.
+
+    Args:
+        report (dict): The fleet report.
+        output (Path, optional): The report path, defaults to `fleet_report.json`
+            in the drift directory (with the configured layout and compression).
+
+    Returns:
+        Path: The report path.
+    """
+
+    report_file = Path(output) if output else store_path(DRIFT_DIR, "fleet_report.json")
+
+    try:
+        if output:
+            atomic_write(report_file, codec.dumps(report, indent=True))
+        else:
+            write_json(DRIFT_DIR, "fleet_report.json", report, indent=True)
+        logger.info("✅ Fleet report saved successfully.")
+    except OSError as e:
+        logger.error(f"Failed to save fleet report file: {e}")
+
+    return report_file
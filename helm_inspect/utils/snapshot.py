@@ -0,0 +1,360 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import io
+import os
+import tarfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+from helm_inspect.utils import codec
+from helm_inspect.utils.blobs import digest_value
+from helm_inspect.utils.logger import setup_logger
+
+logger = setup_logger()
+
+SNAPSHOT_VERSION = 1
+"""
+Version of the snapshot archive layout.
+"""
+
+SECRET_FIELDS = ("data", "stringData")
+"""
+Fields of Secrets whose values are digested in snapshot archives.
+"""
+
+
+def redact_secret(resource: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Replace the values of a Secret with their keyed digest (see `digest_value`).
+
+    Equal values keep equal digests, so replayed comparisons still tell which
+    keys of a Secret drifted.
+
+    Args:
+        resource (Dict[str, Any], optional): The object.
+
+    Returns:
+        Dict[str, Any] or None: A redacted copy of a Secret, other objects as is.
+    """
+
+    if not resource or resource.get("kind") != "Secret":
+        return resource
+    redacted = dict(resource)
+    for field in SECRET_FIELDS:
+        if isinstance(resource.get(field), dict):
+            redacted[field] = {
+                key: digest_value(value, store=False, keyed=True)["digest"]
+                for key, value in resource[field].items()
+            }
+    return redacted
+
+
+def redact_manifest(manifest: str) -> str:
+    """
+    Replace the values of the Secrets of a Helm manifest with their digest.
+
+    Args:
+        manifest (str): The manifest YAML.
+
+    Returns:
+        str: The manifest, rewritten if it holds a Secret.
+    """
+
+    try:
+        documents = list(yaml.safe_load_all(manifest))
+    except yaml.YAMLError:
+        return ""
+    if not any(isinstance(d, dict) and d.get("kind") == "Secret" for d in documents):
+        return manifest
+    return yaml.safe_dump_all(
+        [redact_secret(d) if isinstance(d, dict) else d for d in documents],
+        sort_keys=False,
+    )
+
+
+class Snapshot:
+    """
+    Helm manifests and live objects fetched during a run.
+
+    A snapshot is either recording (every cluster read is captured) or
+    replaying (every cluster read is served from the archive, offline).
+    Secret values are saved as their digest unless `raw_secrets` is set.
+    """
+
+    def __init__(self, mode: str = "record", raw_secrets: bool = False):
+        self.mode = mode
+        self.raw_secrets = raw_secrets
+        self.cluster: Optional[str] = None
+        self.created = datetime.utcnow().isoformat()
+        self.manifests: Dict[Tuple[str, str], str] = {}
+        self.releases: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.resources: Dict[Tuple[str, str, str], Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record_manifest(self, release: str, namespace: str, manifest: str) -> None:
+        """
+        Record the raw manifest of a Helm release.
+
+        Args:
+            release (str): The release name.
+            namespace (str): The namespace of the release.
+            manifest (str): The manifest YAML.
+        """
+
+        with self._lock:
+            self.manifests[(namespace, release)] = manifest
+
+    def record_release(
+        self, release: Dict[str, Any], manifest: Optional[str] = None
+    ) -> None:
+        """
+        Record a listed Helm release and, when known, its manifest.
+
+        Args:
+            release (Dict[str, Any]): The release information.
+            manifest (str, optional): The manifest YAML.
+        """
+
+        key = (release["namespace"], release["name"])
+        with self._lock:
+            self.releases[key] = {k: v for k, v in release.items() if k != "manifest"}
+            if manifest is not None:
+                self.manifests[key] = manifest
+
+    def record_resource(
+        self, kind: str, name: str, namespace: str, resource: Dict[str, Any]
+    ) -> None:
+        """
+        Record a live Kubernetes object, or its absence.
+
+        Args:
+            kind (str): The Kubernetes resource kind.
+            name (str): The Kubernetes resource name.
+            namespace (str): The Kubernetes namespace.
+            resource (Dict[str, Any]): The live object, empty when not found.
+        """
+
+        with self._lock:
+            self.resources[(namespace, kind.lower(), name)] = resource or None
+
+    def get_manifest(self, release: str, namespace: str) -> str:
+        return self.manifests.get((namespace, release), "")
+
+    def get_resource(self, kind: str, name: str, namespace: str) -> Dict[str, Any]:
+        return self.resources.get((namespace, kind.lower(), name)) or {}
+
+    def save(self, path: Path) -> None:
+        """
+        Write the snapshot to a compressed tar archive.
+
+        The compression is chosen from the file suffix: `.tar.zst` (requires the
+        `zstandard` package), `.tar.gz`, `.tar.xz` or an uncompressed `.tar`.
+        The archive is readable by the owner only; Secret values (in live
+        objects and Helm manifests) are replaced by their keyed digest
+        unless `raw_secrets` is set.
+
+        Args:
+            path (Path): The archive path.
+        """
+
+        members = {
+            "meta.json": codec.dumps(
+                {
+                    "version": SNAPSHOT_VERSION,
+                    "created": self.created,
+                    "cluster": self.cluster,
+                    "releases": list(self.releases.values()),
+                }
+            )
+        }
+        for (namespace, release), manifest in self.manifests.items():
+            if not self.raw_secrets:
+                manifest = redact_manifest(manifest)
+            members[f"manifests/{namespace}/{release}.yaml"] = manifest.encode("utf-8")
+        for (namespace, kind, name), resource in self.resources.items():
+            if not self.raw_secrets:
+                resource = redact_secret(resource)
+            members[f"resources/{namespace}/{kind}/{name}.json"] = codec.dumps(resource)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        os.chmod(path, 0o600)
+        with _open_archive(path, "w") as archive:
+            for member, data in members.items():
+                info = tarfile.TarInfo(member)
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+
+        logger.info(
+            f"✅ Snapshot saved to {path} ({len(self.manifests)} manifests, "
+            f"{len(self.resources)} objects)."
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "Snapshot":
+        """
+        Read a snapshot archive for offline replay.
+
+        Args:
+            path (Path): The archive path.
+
+        Returns:
+            Snapshot: The snapshot in replay mode.
+        """
+
+        snapshot = cls(mode="replay")
+        with _open_archive(Path(path), "r") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                content = archive.extractfile(member).read()
+                parts = member.name.split("/")
+
+                if member.name == "meta.json":
+                    meta = codec.loads(content)
+                    snapshot.cluster = meta.get("cluster")
+                    snapshot.created = meta.get("created")
+                    for release in meta.get("releases", []):
+                        key = (release["namespace"], release["name"])
+                        snapshot.releases[key] = release
+                elif parts[0] == "manifests" and len(parts) == 3:
+                    snapshot.manifests[
+                        (parts[1], parts[2][: -len(".yaml")])
+                    ] = content.decode("utf-8")
+                elif parts[0] == "resources" and len(parts) == 4:
+                    key = (parts[1], parts[2], parts[3][: -len(".json")])
+                    snapshot.resources[key] = codec.loads(content)
+
+        logger.info(f"✨ Replaying snapshot {path} taken {snapshot.created}.\n")
+        return snapshot
+
+
+def _open_archive(path: Path, mode: str):
+    """
+    Open a tar archive, compressed according to its suffix.
+
+    Args:
+        path (Path): The archive path.
+        mode (str): `r` to read or `w` to write.
+
+    Returns:
+        tarfile.TarFile: The opened archive.
+    """
+
+    if path.name.endswith((".zst", ".zstd")):
+        zstandard = _import_zstandard()
+
+        if mode == "w":
+            stream = zstandard.ZstdCompressor().stream_writer(open(path, "wb"))
+            return _ZstdTarFile(stream, tarfile.open(fileobj=stream, mode="w|"))
+
+        stream = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+        return _ZstdTarFile(stream, tarfile.open(fileobj=stream, mode="r|"))
+
+    compression = {".gz": "gz", ".tgz": "gz", ".xz": "xz", ".bz2": "bz2"}.get(
+        path.suffix, ""
+    )
+    return tarfile.open(path, f"{mode}:{compression}" if compression else mode)
+
+
+def _import_zstandard():
+    """
+    Import the optional `zstandard` package.
+
+    Returns:
+        module: The `zstandard` module.
+
+    Raises:
+        RuntimeError: If the package is not installed.
+    """
+
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError(
+            "Snapshots compressed with zstd require the `zstandard` package. "
+            "Install it or use a .tar.gz / .tar.xz file instead."
+        )
+    return zstandard
+
+
+class _ZstdTarFile:
+    """
+    Streamed tar archive that also closes its zstd stream.
+    """
+
+    def __init__(self, stream, archive: tarfile.TarFile):
+        self._stream = stream
+        self._archive = archive
+
+    def __enter__(self) -> tarfile.TarFile:
+        return self._archive
+
+    def __exit__(self, *exc_info) -> None:
+        self._archive.close()
+        self._stream.close()
+
+
+_active_snapshot: Optional[Snapshot] = None
+
+
+def get_active_snapshot() -> Optional[Snapshot]:
+    """
+    Get the snapshot being recorded or replayed by this run, if any.
+
+    Returns:
+        Snapshot or None: The active snapshot.
+    """
+
+    return _active_snapshot
+
+
+def start_recording(path: Path, raw_secrets: bool = False) -> Snapshot:
+    """
+    Start recording every cluster read of this run.
+
+    Args:
+        path (Path): The archive path the snapshot will be saved to.
+        raw_secrets (bool): Keep Secret values in plain text in the archive.
+
+    Returns:
+        Snapshot: The recording snapshot.
+    """
+
+    global _active_snapshot
+
+    if Path(path).name.endswith((".zst", ".zstd")):
+        _import_zstandard()
+    _active_snapshot = Snapshot(mode="record", raw_secrets=raw_secrets)
+    return _active_snapshot
+
+
+def start_replay(path: Path) -> Snapshot:
+    """
+    Serve every cluster read of this run from a snapshot archive.
+
+    Args:
+        path (Path): The archive path.
+
+    Returns:
+        Snapshot: The replaying snapshot.
+    """
+
+    global _active_snapshot
+    _active_snapshot = Snapshot.load(path)
+    return _active_snapshot
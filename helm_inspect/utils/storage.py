@@ -0,0 +1,371 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import fnmatch
+import gzip
+import hashlib
+import os
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple
+
+from helm_inspect.utils import codec
+from helm_inspect.utils.constant import STORE_COMPRESSION, STORE_LAYOUT
+
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+"""
+File suffix appended to saved files for each compression.
+"""
+
+
+def _import_zstandard():
+    """
+    Import the optional `zstandard` package.
+
+    Returns:
+        module: The `zstandard` module.
+
+    Raises:
+        RuntimeError: If the package is not installed.
+    """
+
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError(
+            "zstd compressed files require the `zstandard` package. "
+            'Install it (`pip install "helm-inspect[zstd]"`) or set '
+            "HI_STORE_COMPRESSION to gzip or none."
+        )
+    return zstandard
+
+
+def _bucket(name: str) -> str:
+    """
+    Get the hashed subdirectory of a file in the sharded layout.
+
+    Args:
+        name (str): The file name, without compression suffix.
+
+    Returns:
+        str: Two hex digits.
+    """
+
+    return hashlib.blake2b(name.encode("utf-8"), digest_size=1).hexdigest()
+
+
+def store_path(directory: Path, name: str) -> Path:
+    """
+    Get the path a file is written to with the configured layout and compression.
+
+    Args:
+        directory (Path): The store directory.
+        name (str): The file name, e.g. `drift_<release>_<namespace>_<cluster>.json`.
+
+    Returns:
+        Path: The file path.
+    """
+
+    suffix = COMPRESSION_SUFFIXES.get(STORE_COMPRESSION, "")
+    if STORE_LAYOUT == "sharded":
+        return directory / _bucket(name) / f"{name}{suffix}"
+    return directory / f"{name}{suffix}"
+
+
+def _candidates(directory: Path, name: str) -> List[Path]:
+    """
+    List every path a file may have been written to, preferred path first.
+
+    Args:
+        directory (Path): The store directory.
+        name (str): The file name.
+
+    Returns:
+        List[Path]: The candidate paths.
+    """
+
+    preferred = store_path(directory, name)
+    paths = [preferred]
+    for parent in (directory, directory / _bucket(name)):
+        for suffix in COMPRESSION_SUFFIXES.values():
+            path = parent / f"{name}{suffix}"
+            if path != preferred:
+                paths.append(path)
+    return paths
+
+
+def find_file(directory: Path, name: str) -> Optional[Path]:
+    """
+    Find a saved file in any layout and compression.
+
+    Args:
+        directory (Path): The store directory.
+        name (str): The file name.
+
+    Returns:
+        Path or None: The file path, if it exists.
+    """
+
+    for path in _candidates(directory, name):
+        if path.exists():
+            return path
+    return None
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write a file atomically: readers see either the old or the new content,
+    never a truncated file, even if the process dies mid-write.
+
+    Args:
+        path (Path): The file path.
+        data (bytes): The file content.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        os.chmod(tmp_path, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _compress(data: bytes, path: Path) -> bytes:
+    if path.name.endswith(".gz"):
+        return gzip.compress(data, compresslevel=6)
+    if path.name.endswith(".zst"):
+        return _import_zstandard().ZstdCompressor().compress(data)
+    return data
+
+
+def _decompress(data: bytes, path: Path) -> bytes:
+    if path.name.endswith(".gz"):
+        try:
+            return gzip.decompress(data)
+        except (OSError, EOFError, zlib.error) as e:
+            raise ValueError(f"Invalid gzip data in {path.name}: {e}")
+    if path.name.endswith(".zst"):
+        zstandard = _import_zstandard()
+        try:
+            return zstandard.ZstdDecompressor().decompress(data)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Invalid zstd data in {path.name}: {e}")
+    return data
+
+
+def write_json(directory: Path, name: str, data: Any, indent: bool = False) -> Path:
+    """
+    Save JSON data atomically, with the configured layout and compression.
+
+    Copies of the file in another layout or compression are removed, so a
+    later read never finds stale data.
+
+    Args:
+        directory (Path): The store directory.
+        name (str): The file name.
+        data (Any): The data to save.
+        indent (bool): Flag to indent uncompressed files, which are compact
+            by default since they are read back by Helm Inspect.
+
+    Returns:
+        Path: The file path.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+
+    path = store_path(directory, name)
+    compressed = path.name != name
+    content = codec.dumps(data, indent=indent and not compressed)
+    atomic_write(path, _compress(content, path))
+
+    for stale in _candidates(directory, name)[1:]:
+        if stale.exists():
+            stale.unlink()
+    return path
+
+
+def read_json(directory: Path, name: str) -> Optional[Any]:
+    """
+    Read JSON data saved with any layout and compression.
+
+    Args:
+        directory (Path): The store directory.
+        name (str): The file name.
+
+    Returns:
+        Any or None: The data, None if the file does not exist.
+
+    Raises:
+        ValueError: If the file is corrupt.
+        OSError: If the file cannot be read.
+    """
+
+    path = find_file(directory, name)
+    if path is None:
+        return None
+    return read_json_file(path)
+
+
+def read_json_file(path: Path) -> Any:
+    """
+    Read a JSON file, decompressing it according to its suffix.
+
+    Args:
+        path (Path): The file path.
+
+    Returns:
+        Any: The data.
+
+    Raises:
+        ValueError: If the file is corrupt.
+        OSError: If the file cannot be read.
+    """
+
+    with open(path, "rb") as f:
+        return codec.loads(_decompress(f.read(), path))
+
+
+def delete_file(directory: Path, name: str) -> bool:
+    """
+    Delete a saved file in every layout and compression.
+
+    Args:
+        directory (Path): The store directory.
+        name (str): The file name.
+
+    Returns:
+        bool: True if a file was deleted.
+
+    Raises:
+        OSError: If a file cannot be deleted.
+    """
+
+    deleted = False
+    for path in _candidates(directory, name):
+        if path.exists():
+            path.unlink()
+            deleted = True
+    return deleted
+
+
+def _logical_name(path: Path) -> str:
+    for suffix in COMPRESSION_SUFFIXES.values():
+        if suffix and path.name.endswith(suffix):
+            return path.name[: -len(suffix)]
+    return path.name
+
+
+def iter_files(directory: Path, pattern: str) -> Iterator[Tuple[str, Path]]:
+    """
+    List saved files matching a pattern, in any layout and compression.
+
+    Args:
+        directory (Path): The store directory.
+        pattern (str): A glob pattern on the file name, e.g. `fleet_summary_*.json`.
+
+    Yields:
+        Tuple[str, Path]: The file name (without compression suffix) and its path.
+    """
+
+    if not directory.exists():
+        return
+
+    parents = [directory] + sorted(
+        entry
+        for entry in directory.iterdir()
+        if entry.is_dir() and len(entry.name) == 2
+    )
+    for parent in parents:
+        with os.scandir(parent) as entries:
+            for entry in entries:
+                if not entry.is_file() or entry.name.startswith("."):
+                    continue
+                path = Path(entry.path)
+                name = _logical_name(path)
+                if fnmatch.fnmatch(name, pattern):
+                    yield name, path
+
+
+def prune(
+    directory: Path,
+    patterns: List[str],
+    max_age_days: Optional[float] = None,
+    dry_run: bool = False,
+) -> List[Path]:
+    """
+    Remove saved files past their retention, plus temp files left by crashes.
+
+    Files removed concurrently, e.g. by another prune, are skipped. Pass every
+    pattern of a directory in one call, so its temp files are collected once.
+
+    Args:
+        directory (Path): The store directory.
+        patterns (List[str]): Glob patterns of the files subject to retention.
+        max_age_days (float, optional): Remove files not modified for this many days.
+        dry_run (bool): Only list the files that would be removed.
+
+    Returns:
+        List[Path]: The removed files.
+
+    Raises:
+        OSError: If a file cannot be removed.
+    """
+
+    def modified(path: Path) -> Optional[float]:
+        try:
+            return path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    files = {}
+    for pattern in patterns:
+        for _, path in iter_files(directory, pattern):
+            files[path] = modified(path)
+
+    cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+    expired = [
+        path
+        for path, mtime in sorted(
+            files.items(), key=lambda item: item[1] or 0, reverse=True
+        )
+        if cutoff is not None and mtime is not None and mtime < cutoff
+    ]
+
+    if directory.exists():
+        stale_before = time.time() - 3600
+        for parent in [directory, *(p for p in directory.iterdir() if p.is_dir())]:
+            for path in parent.glob(".*.tmp"):
+                mtime = modified(path)
+                if mtime is not None and mtime < stale_before:
+                    expired.append(path)
+
+    if not dry_run:
+        for path in expired:
+            path.unlink(missing_ok=True)
+        for parent in directory.iterdir() if directory.exists() else []:
+            if parent.is_dir() and len(parent.name) == 2 and not any(parent.iterdir()):
+                try:
+                    parent.rmdir()
+                except FileNotFoundError:
+                    pass
+
+    return expired
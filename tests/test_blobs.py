@@ -0,0 +1,48 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import hashlib
+import stat
+
+import pytest
+
+from helm_inspect.utils import blobs
+
+
+@pytest.fixture
+def key_file(monkeypatch, tmp_path):
+    path = tmp_path / "digest.key"
+    monkeypatch.setattr(blobs, "DIGEST_KEY_FILE", path)
+    monkeypatch.setattr(blobs, "BLOB_DIR", tmp_path / "blobs")
+    monkeypatch.setattr(blobs, "_digest_key", None)
+    return path
+
+
+def test_secret_digests_are_keyed(monkeypatch, key_file):
+    digest = blobs.report_value("Secret", "hunter2")
+
+    assert digest["digest"].startswith("hmac-sha256:")
+    assert hashlib.sha256(b"hunter2").hexdigest() not in digest["digest"]
+    assert not digest["stored"]
+    assert stat.S_IMODE(key_file.stat().st_mode) == 0o600
+
+    monkeypatch.setattr(blobs, "_digest_key", None)
+    assert blobs.report_value("Secret", "hunter2") == digest
+    assert blobs.redact_values({"password": "hunter2"}) == {
+        "password": f"{digest['digest']} (7 bytes)"
+    }
+
+
+def test_large_values_stay_content_addressed(monkeypatch, key_file):
+    monkeypatch.setattr(blobs, "LEAF_DIGEST_BYTES", 8)
+
+    digest = blobs.report_value("ConfigMap", "x" * 16)
+
+    assert digest["digest"] == "sha256:" + hashlib.sha256(b"x" * 16).hexdigest()
+    assert blobs.load_blob(digest["digest"]) == "x" * 16
+    assert not key_file.exists()
@@ -0,0 +1,105 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import threading
+import time
+
+import pytest
+
+from helm_inspect.utils import cache as cache_module
+from helm_inspect.utils.cache import MISSING, BoundedCache, NamespaceIndex
+from helm_inspect.utils.drift_check import extract_relevant_data
+from helm_inspect.utils.defaults import strip_defaults
+from helm_inspect.utils.limiter import THROTTLED, ClusterError
+
+
+def test_values_are_shared_and_sized_by_the_caller(monkeypatch):
+    def estimate(value):
+        raise AssertionError("values sized by the caller are not serialized")
+
+    monkeypatch.setattr(cache_module, "_size", estimate)
+    cache = BoundedCache(ttl=60, max_bytes=100)
+    value = {"spec": {"replicas": 1}}
+
+    cache.put(("default", "deployment", "web"), value, size=60)
+
+    assert cache.get(("default", "deployment", "web")) is value
+    assert cache.stats()["bytes"] == 60
+
+
+def test_entries_are_evicted_by_size_and_expire():
+    cache = BoundedCache(ttl=60, max_bytes=100)
+    cache.put(("default", "a"), "a", size=60)
+    cache.put(("default", "b"), "b", size=60)
+    cache.put(("default", "c"), "c", ttl=0.01, size=10)
+    time.sleep(0.02)
+
+    assert cache.get(("default", "a")) is MISSING
+    assert cache.get(("default", "b")) == "b"
+    assert cache.get(("default", "c")) is MISSING
+    assert cache.stats()["evictions"] == 1
+
+
+def test_namespace_index_lists_once():
+    index = NamespaceIndex(ttl=60, max_bytes=1000)
+    lists = []
+    started = threading.Event()
+
+    def load():
+        lists.append(1)
+        started.wait(1)
+        return {"web": {"metadata": {"name": "web"}}}, 10
+
+    threads = [
+        threading.Thread(target=index.get, args=("default", "Deployment", load))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    started.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(lists) == 1
+    assert index.get("default", "Deployment", load)["web"]["metadata"]["name"] == "web"
+    assert index.stats()["hits"] == 4
+
+
+def test_compared_data_does_not_modify_cached_objects():
+    live = {
+        "kind": "Service",
+        "metadata": {"name": "web"},
+        "spec": {"ports": [{"port": 80, "protocol": "TCP"}], "type": "ClusterIP"},
+    }
+    helm = {"kind": "Service", "spec": {"ports": [{"port": 80}]}}
+
+    helm_data = extract_relevant_data(helm, [])
+    live_data = strip_defaults("Service", helm_data, extract_relevant_data(live, []))
+
+    assert live_data == {"ports": [{"port": 80}]}
+    assert live["spec"] == {
+        "ports": [{"port": 80, "protocol": "TCP"}],
+        "type": "ClusterIP",
+    }
+
+
+def test_namespace_index_does_not_cache_transient_failures():
+    index = NamespaceIndex(ttl=60, max_bytes=1000)
+    results = [ClusterError("throttled", THROTTLED), (None, 0), ({}, 2)]
+
+    def load():
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    with pytest.raises(ClusterError):
+        index.get("default", "Secret", load)
+    assert index.get("default", "Secret", load) is None
+    assert index.get("default", "Secret", load) is None
+    assert results == [({}, 2)]
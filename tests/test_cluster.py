@@ -0,0 +1,56 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import pytest
+
+from helm_inspect.utils import cluster, limiter
+
+
+@pytest.mark.parametrize(
+    "kind, path",
+    [
+        ("Deployment", "/apis/apps/v1/namespaces/default/deployments"),
+        ("Ingress", "/apis/networking.k8s.io/v1/namespaces/default/ingresses"),
+        ("ConfigMap", "/api/v1/namespaces/default/configmaps"),
+    ],
+)
+def test_list_namespace_objects_path(monkeypatch, kind, path):
+    commands = []
+
+    def run_command(command, raw=False):
+        commands.append(command)
+        return b'{"items": [{"metadata": {"name": "web"}}], "metadata": {}}'
+
+    monkeypatch.setattr(cluster, "run_command", run_command)
+
+    objects, _ = cluster.list_namespace_objects(kind, "default")
+
+    assert commands[0][3].split("?")[0] == path
+    assert objects["web"]["kind"] == kind
+
+
+@pytest.mark.parametrize(
+    "reason, raised",
+    [
+        (limiter.CANCELLED, True),
+        (limiter.THROTTLED, True),
+        (limiter.UNAVAILABLE, True),
+        (limiter.FAILED, False),
+    ],
+)
+def test_list_namespace_objects_failures(monkeypatch, reason, raised):
+    def run_command(command, raw=False):
+        raise limiter.ClusterError("listing failed", reason)
+
+    monkeypatch.setattr(cluster, "run_command", run_command)
+
+    if raised:
+        with pytest.raises(limiter.ClusterError):
+            cluster.list_namespace_objects("Deployment", "default")
+    else:
+        assert cluster.list_namespace_objects("Deployment", "default") == (None, 0)
@@ -0,0 +1,53 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+from datetime import datetime
+
+import pytest
+
+from helm_inspect.utils import codec
+
+DATA = [
+    {"b": 1, "a": [True, None, "é ✓"], "nested": {"x": 1.5, "y": -2}},
+    ["line\nbreak", 'quote"', "tab\t", 0, -0.25],
+    {"values": {"nan": float("nan"), "inf": [float("inf"), float("-inf")]}},
+    {"ts": datetime(2025, 1, 1, 12, 0)},
+    "plain",
+    {},
+]
+
+
+@pytest.fixture
+def orjson():
+    return pytest.importorskip("orjson")
+
+
+@pytest.mark.parametrize("data", DATA)
+@pytest.mark.parametrize("indent", [False, True])
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_codecs_produce_the_same_text(monkeypatch, orjson, data, indent, sort_keys):
+    monkeypatch.setattr(codec, "_orjson", orjson)
+    fast = codec.dumps(data, indent, sort_keys, default=str)
+    monkeypatch.setattr(codec, "_orjson", None)
+    fallback = codec.dumps(data, indent, sort_keys, default=str)
+
+    assert fast == fallback
+
+
+def test_fallback_writes_valid_json(monkeypatch):
+    monkeypatch.setattr(codec, "_orjson", None)
+    text = codec.dumps_text({"a": float("nan"), "b": (1, float("inf"))})
+
+    assert text == '{"a":null,"b":[1,null]}'
+    assert codec.loads(text) == {"a": None, "b": [1, None]}
+
+
+def test_values_orjson_cannot_serialize_fall_back(monkeypatch, orjson):
+    monkeypatch.setattr(codec, "_orjson", orjson)
+
+    assert codec.loads(codec.dumps({"big": 2**70})) == {"big": 2**70}
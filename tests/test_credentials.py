@@ -0,0 +1,100 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import json
+import os
+import stat
+import subprocess
+import sys
+
+from helm_inspect.utils import calibration, credentials
+
+PLUGIN = """#!{python}
+import json, sys
+from datetime import datetime, timedelta, timezone
+
+with open({runs!r}, "a") as f:
+    f.write("run\\n")
+expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+print(json.dumps({{
+    "apiVersion": "client.authentication.k8s.io/v1beta1",
+    "kind": "ExecCredential",
+    "status": {{
+        "token": "token-%d" % len(open({runs!r}).readlines()),
+        "expirationTimestamp": expiry.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }},
+}}))
+"""
+
+KUBECTL = """#!{python}
+import json
+print(json.dumps({config}))
+"""
+
+
+def executable(path, content):
+    path.write_text(content)
+    path.chmod(0o755)
+    return str(path)
+
+
+def test_exec_credentials_are_cached(monkeypatch, tmp_path):
+    runs = tmp_path / "runs"
+    plugin = executable(
+        tmp_path / "plugin", PLUGIN.format(python=sys.executable, runs=str(runs))
+    )
+    config = {
+        "clusters": [{"name": "test", "cluster": {"server": "https://k8s"}}],
+        "users": [
+            {
+                "name": "test",
+                "user": {"exec": {"command": plugin, "args": ["get-token"]}},
+            }
+        ],
+    }
+    kubectl = executable(
+        tmp_path / "kubectl",
+        KUBECTL.format(python=sys.executable, config=repr(config)),
+    )
+    cache = credentials.ExecCredentialCache(kubectl, tmp_path / "kubeconfig.json")
+
+    path = cache.kubeconfig()
+    assert cache.kubeconfig() == path
+    assert len(runs.read_text().splitlines()) == 1
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    with open(path) as f:
+        assert json.load(f)["users"][0]["user"] == {"token": "token-1"}
+
+    expires = cache._expires
+    monkeypatch.setattr(credentials.time, "time", lambda: expires - 30)
+    cache.kubeconfig()
+    assert len(runs.read_text().splitlines()) == 2
+    with open(path) as f:
+        assert json.load(f)["users"][0]["user"] == {"token": "token-2"}
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    cache.close()
+    assert not os.path.exists(path)
+
+
+def test_orphaned_kubeconfigs_are_pruned(monkeypatch, tmp_path):
+    monkeypatch.setattr(calibration, "TMP_DIR", tmp_path)
+    monkeypatch.setattr(calibration, "DRIFT_DIR", tmp_path / "drift")
+    monkeypatch.setattr(calibration, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(calibration, "BLOB_DIR", tmp_path / "blobs")
+
+    exited = subprocess.Popen([sys.executable, "-c", ""])
+    exited.wait()
+    orphaned = tmp_path / f"kubeconfig_{exited.pid}.json"
+    current = tmp_path / f"kubeconfig_{os.getpid()}.json"
+    orphaned.write_text("{}")
+    current.write_text("{}")
+
+    assert calibration.prune_saved_files() == [orphaned]
+    assert not orphaned.exists()
+    assert current.exists()
@@ -0,0 +1,71 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import pytest
+
+from helm_inspect.utils import calibration, codec, drift_check
+from helm_inspect.utils.diff import parse_embedded_document
+
+CONFIG = "release: {date}\nports:\n  1: http\n  2: grpc\n"
+
+
+def test_parse_embedded_document_keeps_json_types():
+    parsed = parse_embedded_document(CONFIG.format(date="2024-01-01"))
+
+    assert parsed == {"release": "2024-01-01", "ports": {"1": "http", "2": "grpc"}}
+
+
+def test_parse_embedded_document_keeps_unrepresentable_values_as_strings():
+    value = "payload: !!binary aGVsbG8=\nother: 1\n"
+
+    assert parse_embedded_document(value) == value
+
+
+@pytest.mark.parametrize("orjson", [True, False], ids=["orjson", "json"])
+def test_structured_values_drift_is_saved(monkeypatch, tmp_path, orjson):
+    if orjson and codec._orjson is None:
+        pytest.skip("orjson is not installed")
+    if not orjson:
+        monkeypatch.setattr(codec, "_orjson", None)
+
+    def configmap(date):
+        return {
+            "apiVersion": "v1",
+            "kind": "ConfigMap",
+            "metadata": {"name": "settings"},
+            "data": {"config.yaml": CONFIG.format(date=date)},
+        }
+
+    monkeypatch.setattr(
+        drift_check, "get_k8s_resource", lambda *args: configmap("2024-02-01")
+    )
+    monkeypatch.setattr(calibration, "DRIFT_DIR", tmp_path)
+
+    drift_meta = drift_check.check_drift(
+        "web",
+        "default",
+        [],
+        helm_manifest=[configmap("2024-01-01")],
+        render_diff=True,
+        structured_values=True,
+    )
+    calibration.save_drift_data(drift_meta, "web", "default", "test")
+
+    assert drift_meta["drift_reports"] == [
+        {
+            "kind": "ConfigMap",
+            "name": "settings",
+            "drift_type": "value_modified",
+            "change": {
+                "key": "config.yaml.release",
+                "old_value": "2024-01-01",
+                "new_value": "2024-02-01",
+            },
+        }
+    ]
+    assert calibration.get_drift_data("web", "default", "test") == drift_meta
@@ -0,0 +1,66 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+from helm_inspect.utils.hotkeys import DriftAggregator, SpaceSaving
+
+
+def report(kind, name, key):
+    return {"kind": kind, "name": name, "change": {"key": key}}
+
+
+def test_space_saving_keeps_heavy_hitters():
+    counter = SpaceSaving(capacity=4)
+    for i in range(100):
+        counter.add("hot")
+        counter.add(f"cold-{i}")
+
+    (item, count, error), *_ = counter.top(1)
+    assert item == "hot"
+    assert count - error <= 100 <= count
+    assert counter.total == 200
+    assert len(counter) == 4
+
+
+def test_list_indexes_are_folded():
+    aggregator = DriftAggregator()
+    aggregator.add(
+        [
+            report("Deployment", "web", "spec.containers[0].image"),
+            report("Deployment", "web", "spec.containers[1].image"),
+        ],
+        "prod",
+        "default",
+    )
+
+    summary = aggregator.summary(5)
+    assert summary["keys"] == [
+        {
+            "kind": "Deployment",
+            "path": "spec.containers[*].image",
+            "drifts": 2,
+            "error": 0,
+        }
+    ]
+    assert summary["resources"][0]["drifts"] == 2
+
+
+def test_merge_keeps_totals_of_truncated_summaries():
+    shard = DriftAggregator()
+    for i in range(10):
+        shard.add([report("ConfigMap", f"cm-{i}", f"data.key{i}")], "prod", "default")
+    saved = shard.summary(3)
+    assert len(saved["keys"]) == 3
+
+    fleet = DriftAggregator()
+    fleet.merge(saved)
+    fleet.merge(saved)
+
+    merged = fleet.summary(3)
+    assert merged["releases"] == 20
+    assert merged["drifts"] == 20
+    assert fleet.resources.total == 20
@@ -0,0 +1,51 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import logging
+
+import pytest
+
+from helm_inspect import inspector
+from helm_inspect.utils.logger import LOGGER_NAME
+
+
+@pytest.fixture(autouse=True)
+def tools(monkeypatch):
+    monkeypatch.setattr(inspector.shutil, "which", lambda tool: f"/usr/bin/{tool}")
+    monkeypatch.setattr(inspector, "get_cluster_name", lambda: "test")
+    monkeypatch.setattr(inspector, "_session", None)
+
+
+@pytest.fixture
+def session():
+    return inspector.HelmInspector()
+
+
+def test_session_leaves_the_logger_level_alone(monkeypatch):
+    logger = logging.getLogger(LOGGER_NAME)
+    monkeypatch.setattr(logger, "level", logging.INFO)
+
+    inspector.HelmInspector()
+
+    assert logger.level == logging.INFO
+
+
+def test_check_raises_without_a_manifest(monkeypatch, session):
+    monkeypatch.setattr(inspector, "get_helm_manifest", lambda *args: [])
+
+    with pytest.raises(LookupError, match="missing"):
+        session.check("missing", "default")
+
+
+def test_one_inspector_per_process(session):
+    assert inspector.HelmInspector().cluster_name == "test"
+
+    with pytest.raises(RuntimeError, match="One HelmInspector per process"):
+        inspector.HelmInspector(cache_ttl=60)
+    with pytest.raises(RuntimeError, match="One HelmInspector per process"):
+        inspector.HelmInspector(cluster_name="other")
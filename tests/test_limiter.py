@@ -0,0 +1,41 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import pytest
+
+from helm_inspect.utils.limiter import (
+    FAILED,
+    NOT_FOUND,
+    THROTTLED,
+    UNAVAILABLE,
+    classify_failure,
+)
+
+
+@pytest.mark.parametrize(
+    "stderr, reason",
+    [
+        ('Error from server (NotFound): configmaps "api-500" not found', NOT_FOUND),
+        ('Error from server (NotFound): secrets "tls-429" not found', NOT_FOUND),
+        ('Error from server (NotFound): services "timeout" not found', NOT_FOUND),
+        (
+            "Error from server (TooManyRequests): the server has received too many requests",
+            THROTTLED,
+        ),
+        (
+            "Error from server (ServiceUnavailable): the server is currently unable",
+            UNAVAILABLE,
+        ),
+        ('Error from server (Forbidden): secrets "db" is forbidden', FAILED),
+        ("Unable to connect to the server: dial tcp: i/o timeout", UNAVAILABLE),
+        ("Error: release: not found", NOT_FOUND),
+        ("error: unknown flag", FAILED),
+    ],
+)
+def test_classify_failure(stderr, reason):
+    assert classify_failure(stderr) == reason
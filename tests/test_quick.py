@@ -0,0 +1,141 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from helm_inspect.utils import cli, quick
+from helm_inspect.utils.limiter import CANCELLED, ClusterError
+
+MANIFEST = [
+    {
+        "kind": "Deployment",
+        "metadata": {"name": "web"},
+        "spec": {"replicas": 2},
+    }
+]
+
+IN_SYNC = {
+    "drift_logs": [],
+    "drift_reports": [],
+    "drift_summary": {
+        "total_drifts": 0,
+        "new_keys": 0,
+        "removed_keys": 0,
+        "modified_keys": 0,
+        "unchecked_resources": 0,
+    },
+}
+
+
+def previous(revision=3, age=0):
+    checked_at = datetime.utcnow() - timedelta(seconds=age)
+    return {**IN_SYNC, "full_checked_at": checked_at.isoformat(), "revision": revision}
+
+
+@pytest.fixture
+def full_checks(monkeypatch):
+    calls = []
+
+    def check_drift(*args, **kwargs):
+        calls.append(args)
+        return dict(IN_SYNC)
+
+    monkeypatch.setattr(quick, "check_drift", check_drift)
+    return calls
+
+
+def test_nest_quick_fields_keeps_container_fields():
+    spec = quick.nest_quick_fields(
+        "Deployment",
+        {
+            "replicas": 2,
+            "template.spec.containers": [
+                {"name": "web", "image": "web:1", "ports": [{"containerPort": 80}]}
+            ],
+        },
+    )
+
+    assert spec == {
+        "replicas": 2,
+        "template": {"spec": {"containers": [{"name": "web", "image": "web:1"}]}},
+    }
+
+
+@pytest.mark.parametrize(
+    "saved, revision, expected",
+    [
+        (None, 3, "no previous full comparison"),
+        (previous(), 3, None),
+        (previous(), None, None),
+        (previous(), 4, "upgraded to revision 4"),
+        (previous(age=10**7), 3, "last full comparison older than"),
+        ({**previous(), "stopped_early": True}, 3, "drifted in the last comparison"),
+    ],
+)
+def test_full_check_reason(saved, revision, expected):
+    reason = quick.full_check_reason(saved, revision)
+
+    if expected is None:
+        assert reason is None
+    else:
+        assert reason.startswith(expected)
+
+
+def test_quick_tier_skips_full_comparison(monkeypatch, full_checks):
+    monkeypatch.setattr(quick, "quick_check", lambda *args: [])
+
+    drift_meta = quick.check_drift_quick(
+        "web", "default", [], helm_manifest=MANIFEST, previous=previous(), revision=3
+    )
+
+    assert drift_meta["tier"] == "quick"
+    assert drift_meta["revision"] == 3
+    assert not full_checks
+
+
+def test_quick_tier_flags_lead_to_full_comparison(monkeypatch, full_checks):
+    monkeypatch.setattr(quick, "quick_check", lambda *args: [("Deployment", "web")])
+
+    drift_meta = quick.check_drift_quick(
+        "web", "default", [], helm_manifest=MANIFEST, previous=previous(), revision=3
+    )
+
+    assert drift_meta["tier"] == "full"
+    assert len(full_checks) == 1
+
+
+def test_quick_tier_propagates_cancellation(monkeypatch, full_checks):
+    def cancelled(*args):
+        raise ClusterError("cancelled", CANCELLED)
+
+    monkeypatch.setattr(quick, "quick_check", cancelled)
+
+    with pytest.raises(ClusterError):
+        quick.check_drift_quick(
+            "web", "default", [], helm_manifest=MANIFEST, previous=previous()
+        )
+    assert not full_checks
+
+
+def test_single_release_quick_check_notices_upgrades(monkeypatch, full_checks):
+    monkeypatch.setattr(quick, "quick_check", lambda *args: [])
+    monkeypatch.setattr(cli, "get_helm_manifest", lambda *args: MANIFEST)
+    monkeypatch.setattr(cli, "get_helm_revision", lambda *args: 4)
+    monkeypatch.setattr(cli, "get_calibration_file", lambda *args: None)
+    monkeypatch.setattr(cli, "get_chart_profile", lambda *args: None)
+    monkeypatch.setattr(cli, "get_drift_data", lambda *args: previous(revision=3))
+    monkeypatch.setattr(cli, "save_drift_data", lambda *args: None)
+    monkeypatch.setattr(cli, "get_drift_file_path", lambda *args: "drift.json")
+
+    drift_meta = cli.detect_drift("web", "default", "test", False, quick=True)
+
+    assert drift_meta["tier"] == "full"
+    assert drift_meta["revision"] == 4
+    assert len(full_checks) == 1
@@ -0,0 +1,82 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import threading
+
+import pytest
+
+from helm_inspect.utils import limiter
+from helm_inspect.utils.scheduler import run_scheduled_scan
+
+IN_SYNC = {"drift_summary": {"total_drifts": 0}}
+DRIFTED = {"drift_summary": {"total_drifts": 1}}
+
+
+@pytest.fixture(autouse=True)
+def timeout(monkeypatch):
+    monkeypatch.setattr(limiter, "_timed_out", threading.Event())
+
+
+def releases(*names):
+    return [{"name": name, "namespace": "default"} for name in names]
+
+
+def scan(release):
+    limiter.current_cancel_token().check()
+    return DRIFTED if release["name"] == "drifted" else IN_SYNC
+
+
+def test_fail_fast_cancels_only_its_scan():
+    outside = limiter.CancelToken()
+    started, release_blocked = threading.Event(), threading.Event()
+    statuses = []
+
+    def blocked_scan(release):
+        started.set()
+        release_blocked.wait(5)
+        limiter.current_cancel_token().check()
+        return IN_SYNC
+
+    other = threading.Thread(
+        target=lambda: statuses.extend(
+            o["status"] for o in run_scheduled_scan(releases("web"), blocked_scan)
+        )
+    )
+    other.start()
+    started.wait(5)
+
+    first = run_scheduled_scan(releases("drifted"), scan, workers=1, fail_fast=True)
+    release_blocked.set()
+    other.join(5)
+
+    assert [o["status"] for o in first] == ["complete"]
+    assert statuses == ["complete"]
+    assert not outside.is_cancelled()
+    assert not limiter.current_cancel_token().is_cancelled()
+
+
+def test_cancelled_calls_of_a_scan_are_incomplete():
+    def slow_scan(release):
+        token = limiter.current_cancel_token()
+        token.sleep(5)
+        token.check()
+        return IN_SYNC
+
+    outcomes = run_scheduled_scan(releases("web"), slow_scan, deadline=0.2)
+
+    assert [o["status"] for o in outcomes] == ["incomplete"]
+
+
+def test_run_timeout_cancels_every_scan():
+    limiter._time_out_run("Run timed out after 1s")
+
+    with pytest.raises(limiter.ClusterError, match="timed out"):
+        limiter.CancelToken().check()
+    outcomes = run_scheduled_scan(releases("web", "api"), scan, workers=1)
+
+    assert [o["status"] for o in outcomes] == ["skipped", "skipped"]
@@ -0,0 +1,104 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import pytest
+
+from helm_inspect.utils import cli, drift_check, quick
+
+
+def service(**spec):
+    return {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {"name": "web"},
+        "spec": spec,
+    }
+
+
+@pytest.mark.parametrize(
+    "resource, pinned",
+    [
+        (service(ports=[{"port": 80}]), False),
+        (service(clusterIP="None", ports=[{"port": 80}]), False),
+        (service(clusterIP="10.0.0.10"), True),
+        (service(type="NodePort", ports=[{"port": 80, "nodePort": 30080}]), True),
+        ({"kind": "ConfigMap", "metadata": {"name": "web"}}, False),
+    ],
+)
+def test_pins_allocated_ports(resource, pinned):
+    assert drift_check.pins_allocated_ports(resource) is pinned
+
+
+def test_pinned_services_are_left_out_of_the_dry_run(monkeypatch):
+    sent = []
+
+    def dry_run_resources(resources, namespace):
+        sent.extend(resources)
+        return {}
+
+    monkeypatch.setattr(drift_check, "dry_run_resources", dry_run_resources)
+    manifest = [
+        service(clusterIP="10.0.0.10"),
+        {"kind": "ConfigMap", "metadata": {"name": "web"}},
+        {"kind": "Ingress", "metadata": {"name": "web"}},
+    ]
+
+    drift_check.get_server_defaults(manifest, "default")
+
+    assert sent == [manifest[1]]
+
+
+def test_calibration_applies_alongside_server_defaults(monkeypatch):
+    monkeypatch.setattr(
+        cli,
+        "get_calibration_file",
+        lambda *args: {"ignorable_keys": ["Ingress.metadata.annotations"]},
+    )
+    monkeypatch.setattr(cli, "refresh_calibration", lambda data, *args: data)
+
+    ignorable_keys = cli.resolve_ignorable_keys(
+        "web", "default", "test", False, [], server_defaults={}
+    )
+
+    assert ignorable_keys == ["Ingress.metadata.annotations"]
+
+
+def test_quick_full_comparison_uses_server_defaults(monkeypatch):
+    manifest = [{"kind": "ConfigMap", "metadata": {"name": "web"}, "data": {}}]
+    server_defaults = {("ConfigMap", "web"): manifest[0]}
+    calls = []
+
+    def check_drift(*args, **kwargs):
+        calls.append(kwargs)
+        return {
+            "drift_logs": [],
+            "drift_reports": [],
+            "drift_summary": {
+                "total_drifts": 0,
+                "new_keys": 0,
+                "removed_keys": 0,
+                "modified_keys": 0,
+            },
+        }
+
+    monkeypatch.setattr(cli, "get_helm_manifest", lambda *args: manifest)
+    monkeypatch.setattr(cli, "get_server_defaults", lambda *args: server_defaults)
+    monkeypatch.setattr(cli, "get_calibration_file", lambda *args: None)
+    monkeypatch.setattr(cli, "get_chart_profile", lambda *args: None)
+    monkeypatch.setattr(cli, "get_drift_data", lambda *args: None)
+    monkeypatch.setattr(cli, "get_helm_revision", lambda *args: 3)
+    monkeypatch.setattr(cli, "save_drift_data", lambda *args: None)
+    monkeypatch.setattr(cli, "get_drift_file_path", lambda *args: "drift.json")
+    monkeypatch.setattr(quick, "check_drift", check_drift)
+
+    drift_meta = cli.detect_drift(
+        "web", "default", "test", False, quick=True, server_dry_run=True
+    )
+
+    assert drift_meta["tier"] == "full"
+    assert calls[0]["server_defaults"] is server_defaults
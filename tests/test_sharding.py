@@ -0,0 +1,124 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+from pathlib import Path
+
+from helm_inspect.utils import codec, sharding, storage
+from helm_inspect.utils.sharding import (
+    assign_shard,
+    merge_fleet_summaries,
+    save_fleet_report,
+    select_shard,
+)
+
+
+def summary(shard, finished, names, drifts=1):
+    releases = [
+        {
+            "namespace": "default",
+            "release": name,
+            "status": "complete",
+            "drift_summary": {"total_drifts": drifts},
+        }
+        for name in names
+    ]
+    hot_spots = {
+        "releases": len(names),
+        "drifts": drifts * len(names),
+        "keys": [
+            {
+                "kind": "Deployment",
+                "path": "spec.replicas",
+                "drifts": drifts * len(names),
+                "error": 0,
+            }
+        ],
+        "resources": [],
+    }
+    name = (
+        f"fleet_summary_prod{sharding.shard_suffix(sharding.parse_shard(shard))}.json"
+    )
+    return Path(name), {
+        "cluster": "prod",
+        "shard": shard,
+        "finished": finished,
+        "summary": {"releases": len(names)},
+        "releases": releases,
+        "hot_spots": hot_spots,
+    }
+
+
+def test_shard_assignment_is_stable():
+    releases = [{"namespace": "default", "name": f"app-{i}"} for i in range(200)]
+    shards = [select_shard(releases, "prod", (i, 4)) for i in range(4)]
+
+    assert sorted(r["name"] for shard in shards for r in shard) == sorted(
+        r["name"] for r in releases
+    )
+    assert select_shard(releases[:100], "prod", (1, 4)) == [
+        r for r in shards[1] if r in releases[:100]
+    ]
+    moved = sum(
+        assign_shard("prod", "default", r["name"], 4)
+        != assign_shard("prod", "default", r["name"], 5)
+        for r in releases
+    )
+    assert moved < len(releases) / 2
+
+
+def test_merge_skips_hot_spots_of_superseded_layout():
+    summaries = [
+        summary("0/2", "2025-01-01T00:00:00", ["a", "b"]),
+        summary("1/2", "2025-01-01T00:00:00", ["c", "d"]),
+        summary("0/3", "2025-01-02T00:00:00", ["a", "b"]),
+        summary("1/3", "2025-01-02T00:00:00", ["c"]),
+        summary("2/3", "2025-01-02T00:00:00", ["d"]),
+    ]
+
+    report = merge_fleet_summaries(summaries)
+
+    assert report["summary"]["releases"] == 4
+    assert report["summary"]["total_drifts"] == 4
+    assert report["hot_spots"]["releases"] == 4
+    assert report["hot_spots"]["drifts"] == 4
+    assert report["hot_spots"]["keys"][0]["drifts"] == 4
+    assert [s["superseded"] for s in report["shards"]] == [
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_merge_keeps_latest_run_of_each_shard():
+    summaries = [
+        summary("0/2", "2025-01-01T00:00:00", ["a"], drifts=5),
+        summary("0/2", "2025-01-02T00:00:00", ["a"], drifts=1),
+        summary("1/2", "2025-01-01T12:00:00", ["b"], drifts=1),
+    ]
+
+    report = merge_fleet_summaries(summaries)
+
+    assert report["hot_spots"]["releases"] == 2
+    assert report["hot_spots"]["drifts"] == 2
+    assert report["summary"]["total_drifts"] == 2
+
+
+def test_fleet_report_is_written_with_the_store_codec(monkeypatch, tmp_path):
+    monkeypatch.setattr(sharding, "DRIFT_DIR", tmp_path)
+    monkeypatch.setattr(storage, "STORE_COMPRESSION", "none")
+    monkeypatch.setattr(storage, "STORE_LAYOUT", "flat")
+    report = merge_fleet_summaries([summary("0/1", "2025-01-01T00:00:00", ["a"])])
+
+    default = save_fleet_report(report)
+    output = save_fleet_report(report, tmp_path / "out" / "report.json")
+
+    assert default == tmp_path / "fleet_report.json"
+    assert codec.loads(default.read_bytes()) == report
+    assert codec.loads(output.read_bytes()) == report
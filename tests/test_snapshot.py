@@ -0,0 +1,87 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import stat
+
+import pytest
+import yaml
+
+from helm_inspect.utils import blobs
+from helm_inspect.utils.snapshot import Snapshot
+
+MANIFEST = """---
+apiVersion: v1
+kind: Secret
+metadata:
+  name: creds
+stringData:
+  password: hunter2
+---
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: settings
+data:
+  level: debug
+"""
+
+SECRET = {
+    "kind": "Secret",
+    "metadata": {"name": "creds"},
+    "data": {"password": "aHVudGVyMg=="},
+}
+CONFIG_MAP = {
+    "kind": "ConfigMap",
+    "metadata": {"name": "settings"},
+    "data": {"level": "debug"},
+}
+
+
+@pytest.fixture(autouse=True)
+def key_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(blobs, "DIGEST_KEY_FILE", tmp_path / "digest.key")
+    monkeypatch.setattr(blobs, "_digest_key", None)
+
+
+def record(raw_secrets=False):
+    snapshot = Snapshot(raw_secrets=raw_secrets)
+    snapshot.record_manifest("web", "prod", MANIFEST)
+    snapshot.record_resource("Secret", "creds", "prod", SECRET)
+    snapshot.record_resource("ConfigMap", "settings", "prod", CONFIG_MAP)
+    snapshot.record_resource("Service", "missing", "prod", None)
+    return snapshot
+
+
+def test_snapshot_round_trip_redacts_secrets(tmp_path):
+    path = tmp_path / "scan.tar.gz"
+    record().save(path)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    loaded = Snapshot.load(path)
+
+    secret = loaded.get_resource("Secret", "creds", "prod")
+    assert secret["data"]["password"].startswith("hmac-sha256:")
+    assert loaded.get_resource("ConfigMap", "settings", "prod") == CONFIG_MAP
+    assert loaded.get_resource("Service", "missing", "prod") == {}
+
+    documents = list(yaml.safe_load_all(loaded.get_manifest("web", "prod")))
+    assert documents[0]["stringData"]["password"].startswith("hmac-sha256:")
+    assert documents[1] == yaml.safe_load(MANIFEST.split("---")[2])
+    assert "hunter2" not in loaded.get_manifest("web", "prod")
+
+
+def test_snapshot_keeps_raw_secrets_when_asked(tmp_path):
+    path = tmp_path / "scan.tar"
+    path.write_text("")
+    path.chmod(0o644)
+    record(raw_secrets=True).save(path)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    loaded = Snapshot.load(path)
+    assert loaded.get_resource("Secret", "creds", "prod") == SECRET
+    assert loaded.get_manifest("web", "prod") == MANIFEST
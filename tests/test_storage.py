@@ -0,0 +1,84 @@
+"""
+
+ Copyright 2025 @Qreater
+ Licensed under the Apache License, Version 2.0.
+ See: http://www.apache.org/licenses/LICENSE-2.0
+
+"""
+
+import os
+import stat
+import time
+
+import pytest
+
+from helm_inspect.utils import storage
+from helm_inspect.utils.storage import atomic_write, prune
+
+
+def age(path, seconds):
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_atomic_write_replaces_and_keeps_mode(tmp_path):
+    path = tmp_path / "state.json"
+    atomic_write(path, b"old")
+    path.chmod(0o600)
+
+    atomic_write(path, b"new")
+
+    assert path.read_bytes() == b"new"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_atomic_write_leaves_no_temp_file_on_failure(monkeypatch, tmp_path):
+    path = tmp_path / "state.json"
+    atomic_write(path, b"old")
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage.os, "replace", fail)
+    with pytest.raises(OSError):
+        atomic_write(path, b"new")
+
+    assert path.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_prune_removes_expired_and_stale_temp_files_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage, "STORE_COMPRESSION", "none")
+    old = tmp_path / "drift_web_default_prod.json"
+    new = tmp_path / "drift_api_default_prod.json"
+    stale = tmp_path / ".drift_web_default_prod.json.abc.tmp"
+    fresh = tmp_path / ".drift_api_default_prod.json.def.tmp"
+    for path in (old, new, stale, fresh):
+        path.write_text("{}")
+    age(old, 10 * 86400)
+    age(stale, 7200)
+
+    listed = prune(tmp_path, ["drift_*.json", "drift_web_*"], 7, dry_run=True)
+    assert sorted(listed) == sorted([old, stale])
+    assert old.exists() and stale.exists()
+
+    removed = prune(tmp_path, ["drift_*.json", "drift_web_*"], 7)
+    assert sorted(removed) == sorted([old, stale])
+    assert sorted(tmp_path.iterdir()) == sorted([new, fresh])
+
+
+def test_prune_tolerates_files_removed_meanwhile(monkeypatch, tmp_path):
+    old = tmp_path / "drift_web_default_prod.json"
+    old.write_text("{}")
+    age(old, 10 * 86400)
+    unlink = storage.Path.unlink
+
+    def removed_meanwhile(path, missing_ok=False):
+        unlink(path)
+        unlink(path, missing_ok=missing_ok)
+
+    monkeypatch.setattr(storage.Path, "unlink", removed_meanwhile)
+
+    assert prune(tmp_path, ["drift_*.json"], 7) == [old]
+    assert not old.exists()